@@ -51,6 +51,8 @@ class NeuralNetworkClassifier(TrainableModel, ClassifierMixin):
         warm_start: bool = False,
         initial_point: np.ndarray = None,
         callback: Callable[[np.ndarray, float], None] | None = None,
+        batch_size: int | None = None,
+        shuffle: bool = True,
     ):
         """
         Args:
@@ -86,10 +88,30 @@ class NeuralNetworkClassifier(TrainableModel, ClassifierMixin):
                 On each iteration an optimizer invokes the callback and passes current weights
                 as an array and a computed value as a float of the objective function being
                 optimized. This allows to track how well optimization / training process is going on.
+            batch_size: The number of samples the objective function and its gradients are
+                evaluated on. If ``None``, all samples are used in every evaluation. Otherwise,
+                the training data is split into mini-batches and the objective function moves on
+                to the next mini-batch once per optimizer iteration, i.e. after every gradient
+                evaluation. This is intended for stochastic gradient-based optimizers.
+                Gradient-free optimizers, such as :class:`~qiskit_algorithms.optimizers.COBYLA`
+                or :class:`~qiskit_algorithms.optimizers.SPSA`, train on the first mini-batch
+                only, they do not work with mini-batches.
+            shuffle: Whether the training data is shuffled at the beginning of every epoch when
+                mini-batches are used.
         Raises:
-            QiskitMachineLearningError: unknown loss, invalid neural network
+            QiskitMachineLearningError: unknown loss, invalid neural network.
+            ValueError: non-positive batch size.
         """
-        super().__init__(neural_network, loss, optimizer, warm_start, initial_point, callback)
+        super().__init__(
+            neural_network,
+            loss,
+            optimizer,
+            warm_start,
+            initial_point,
+            callback,
+            batch_size,
+            shuffle,
+        )
         self._one_hot = one_hot
         # encodes the target data if categorical
         self._target_encoder = OneHotEncoder(sparse_output=False) if one_hot else LabelEncoder()
@@ -129,12 +151,18 @@ class NeuralNetworkClassifier(TrainableModel, ClassifierMixin):
         function: ObjectiveFunction = None
         if self._neural_network.output_shape == (1,):
             self._validate_binary_targets(y)
-            function = BinaryObjectiveFunction(X, y, self._neural_network, self._loss)
+            function = BinaryObjectiveFunction(
+                X, y, self._neural_network, self._loss, self._batch_size, self._shuffle
+            )
         else:
             if self._one_hot:
-                function = OneHotObjectiveFunction(X, y, self._neural_network, self._loss)
+                function = OneHotObjectiveFunction(
+                    X, y, self._neural_network, self._loss, self._batch_size, self._shuffle
+                )
             else:
-                function = MultiClassObjectiveFunction(X, y, self._neural_network, self._loss)
+                function = MultiClassObjectiveFunction(
+                    X, y, self._neural_network, self._loss, self._batch_size, self._shuffle
+                )
 
         return function
 
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterable
 
 import numpy as np
 from qiskit_algorithms.utils import algorithm_globals
@@ -28,12 +28,15 @@ from ...kernels import BaseKernel, FidelityQuantumKernel
 
 logger = logging.getLogger(__name__)
 
+# the maximum number of samples whose kernel values are evaluated at once in prediction
+_PREDICTION_BATCH_SIZE = 1000
+
 
 class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
     r"""
     Implements Pegasos Quantum Support Vector Classifier algorithm. The algorithm has been
-    developed in [1] and includes methods ``fit``, ``predict`` and ``decision_function`` following
-    the signatures
+    developed in [1] and includes methods ``fit``, ``partial_fit``, ``predict`` and
+    ``decision_function`` following the signatures
     of `sklearn.svm.SVC <https://scikit-learn.org/stable/modules/generated/sklearn.svm.SVC.html>`_.
     This implementation is adapted to work with quantum kernels.
 
@@ -64,6 +67,8 @@ class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
         num_steps: int = 1000,
         precomputed: bool = False,
         seed: int | None = None,
+        batch_size: int = 1,
+        max_support_vectors: int | None = None,
     ) -> None:
         """
         Args:
@@ -83,12 +88,21 @@ class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
             precomputed: A boolean flag indicating whether a precomputed kernel is used. Set it to
                 ``True`` in case of precomputed kernel.
             seed: A seed for the random number generator.
+            batch_size: The number of random data used in every step of the Pegasos algorithm.
+                The kernel values of all data of a step are evaluated in a single call of the
+                quantum kernel.
+            max_support_vectors: The maximum number of support vectors. If a datum has to become
+                a support vector once this budget is exhausted, it replaces the support vector
+                with the smallest alpha. This keeps the cost of every step and the memory
+                constant. If ``None``, the number of support vectors is not limited.
 
         Raises:
             ValueError:
                 - if ``quantum_kernel`` is passed and ``precomputed`` is set to ``True``. To use
                 a precomputed kernel, ``quantum_kernel`` has to be of the ``None`` type.
                 - if C is not a positive number.
+                - if ``batch_size`` is not a positive number.
+                - if ``max_support_vectors`` is not a positive number.
         """
 
         if precomputed:
@@ -109,14 +123,29 @@ class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
         else:
             raise ValueError(f"C has to be a positive number, found {C}.")
 
+        if batch_size < 1:
+            raise ValueError(f"batch_size has to be a positive number, found {batch_size}.")
+        self._batch_size = batch_size
+
+        if max_support_vectors is not None and max_support_vectors < 1:
+            raise ValueError(
+                f"max_support_vectors has to be a positive number, found {max_support_vectors}."
+            )
+        self._max_support_vectors = max_support_vectors
+
         # these are the parameters being fit and are needed for prediction
-        self._alphas: Dict[int, int] | None = None
-        self._x_train: np.ndarray | None = None
+        self._alphas: np.ndarray | None = None
+        self._num_support: int | None = None
         self._n_samples: int | None = None
-        self._y_train: np.ndarray | None = None
-        self._label_map: Dict[int, int] | None = None
         self._label_pos: int | None = None
         self._label_neg: int | None = None
+        self._support_indices: np.ndarray | None = None
+        self._support_vectors: np.ndarray | None = None
+        self._support_labels: np.ndarray | None = None
+        self._dual_coef: np.ndarray | None = None
+        # the number of steps and of data used in training so far, continued by partial_fit
+        self._step: int | None = None
+        self._num_seen: int | None = None
 
         # added to all kernel values to include an implicit bias to the hyperplane
         self._kernel_offset = 1
@@ -174,31 +203,84 @@ class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
         # the algorithm works with labels in {+1, -1}
         self._label_pos = np.unique(y)[0]
         self._label_neg = np.unique(y)[1]
-        self._label_map = {self._label_pos: +1, self._label_neg: -1}
 
-        # the training data are later needed for prediction
-        self._x_train = X
-        self._y_train = y
+        # the number of training data is later needed to validate a precomputed kernel
         self._n_samples = X.shape[0]
-
-        # empty dictionary to represent sparse array
-        self._alphas = {}
+        self._init_support(X.shape[1])
+
+        def sample_batches():
+            for _ in range(self._num_steps):
+                # for every step, random indices (determining random data) are fixed
+                if self._batch_size == 1:
+                    yield np.array([algorithm_globals.random.integers(0, len(y))])
+                else:
+                    yield algorithm_globals.random.choice(
+                        len(y), size=min(self._batch_size, len(y)), replace=False
+                    )
 
         t_0 = datetime.now()
-        # training loop
-        for step in range(1, self._num_steps + 1):
-            # for every step, a random index (determining a random datum) is fixed
-            i = algorithm_globals.random.integers(0, len(y))
+        self._train(X, y, sample_batches())
 
-            value = self._compute_weighted_kernel_sum(i, X, training=True)
+        logger.debug("fit completed after %s", str(datetime.now() - t_0)[:-7])
 
-            if (self._label_map[y[i]] * self.C / step) * value < 1:
-                # only way for a component of alpha to become non zero
-                self._alphas[i] = self._alphas.get(i, 0) + 1
+        return self
 
-        self.fit_status_ = PegasosQSVC.FITTED
+    # pylint: disable=invalid-name
+    def partial_fit(
+        self, X: np.ndarray, y: np.ndarray, classes: np.ndarray | None = None
+    ) -> "PegasosQSVC":
+        """Continue the training on a chunk of training data. Every datum of the chunk is used
+        once, in the given order and in steps of ``batch_size`` data, and the steps of the Pegasos
+        algorithm are counted across chunks. Only the support vectors are kept, thus, the model
+        can be trained on a stream of data that does not fit into memory. Calling
+        :meth:`fit` starts a new training.
 
-        logger.debug("fit completed after %s", str(datetime.now() - t_0)[:-7])
+        Args:
+            X: Train features of the shape ``(n_samples, n_features)``. A precomputed kernel is not
+                supported.
+            y: shape (n_samples), train labels.
+            classes: The two labels of the classification problem. Required in the first call if
+                ``y`` does not contain both labels, ignored in later calls.
+
+        Returns:
+            ``self``, Partially fitted estimator.
+
+        Raises:
+            ValueError:
+                - A precomputed kernel is used.
+                - X and/or y have the wrong shape.
+                - X and y have incompatible dimensions.
+                - There are not exactly two labels in the first call.
+                - y includes labels other than the labels of the first call.
+        """
+        if self._precomputed:
+            raise ValueError("partial_fit is not supported for a precomputed kernel")
+        if np.ndim(X) != 2:
+            raise ValueError("X has to be a 2D array")
+        if np.ndim(y) != 1:
+            raise ValueError("y has to be a 1D array")
+        if X.shape[0] != y.shape[0]:
+            raise ValueError("'X' and 'y' have to contain the same number of samples")
+
+        if self._step is None:
+            labels = np.unique(y if classes is None else classes)
+            if len(labels) != 2:
+                raise ValueError("Only binary classification is supported")
+            self._label_pos, self._label_neg = labels
+            self._init_support(X.shape[1])
+        elif not np.all(np.isin(y, [self._label_pos, self._label_neg])):
+            raise ValueError(
+                f"y has to contain the labels {self._label_pos} and {self._label_neg} only"
+            )
+
+        t_0 = datetime.now()
+        batches = (
+            np.arange(start, min(start + self._batch_size, X.shape[0]))
+            for start in range(0, X.shape[0], self._batch_size)
+        )
+        self._train(X, y, batches)
+
+        logger.debug("partial fit completed after %s", str(datetime.now() - t_0)[:-7])
 
         return self
 
@@ -227,7 +309,7 @@ class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
 
         t_0 = datetime.now()
         values = self.decision_function(X)
-        y = np.array([self._label_pos if val > 0 else self._label_neg for val in values])
+        y = np.where(values > 0, self._label_pos, self._label_neg)
         logger.debug("prediction completed after %s", str(datetime.now() - t_0)[:-7])
 
         return y
@@ -262,48 +344,187 @@ class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
                 "For a precomputed kernel, X should be in shape (m_samples, n_samples)"
             )
 
+        if self._precomputed:
+            return X[:, self._support_indices] @ self._dual_coef
+
+        # the kernel values against the support vectors are evaluated in batches of samples
         values = np.zeros(X.shape[0])
-        for i in range(X.shape[0]):
-            values[i] = self._compute_weighted_kernel_sum(i, X, training=False)
+        for start in range(0, X.shape[0], _PREDICTION_BATCH_SIZE):
+            stop = start + _PREDICTION_BATCH_SIZE
+            kernel = self._quantum_kernel.evaluate(X[start:stop], self._support_vectors)
+            values[start:stop] = (kernel + self._kernel_offset) @ self._dual_coef
 
         return values
 
-    def _compute_weighted_kernel_sum(self, index: int, X: np.ndarray, training: bool) -> float:
-        """Helper function to compute the weighted sum over support vectors used for both training
-        and prediction with the Pegasos algorithm.
+    def _init_support(self, num_features: int) -> None:
+        """Helper function to start a new training without support vectors.
 
         Args:
-            index: fixed index distinguishing some datum
-            X: Features
-            training: flag indicating whether the loop is used within training or prediction
+            num_features: number of features of the training data
+        """
+        self._alphas = np.zeros(0)
+        self._support_indices = np.zeros(0, dtype=int)
+        self._support_labels = np.zeros(0, dtype=int)
+        self._support_vectors = None if self._precomputed else np.zeros((0, num_features))
+        self._num_support = 0
+        self._step = 0
+        self._num_seen = 0
+
+    def _train(self, X: np.ndarray, y: np.ndarray, batches: Iterable[np.ndarray]) -> None:
+        """Helper function to run steps of the Pegasos algorithm, continuing the support vectors
+        and the step counter of previous training.
 
-        Returns:
-            Weighted sum of kernel evaluations employed in the Pegasos algorithm
+        Args:
+            X: Training features
+            y: Training labels
+            batches: indices of the training data used in every step
         """
-        # non-zero indices corresponding to the support vectors
-        support_indices = list(self._alphas.keys())
-
-        # for training
-        if training:
-            # support vectors
-            x_supp = X[support_indices]
-        # for prediction
-        else:
-            x_supp = self._x_train[support_indices]
+        # the training labels mapped to {-1, +1}
+        labels = np.where(y == self._label_pos, 1, -1)
+
+        # the support vectors are stored in a preallocated number of slots, at most one slot is
+        # needed for every datum
+        num_slots = self._num_support + X.shape[0]
+        if self._max_support_vectors is not None:
+            num_slots = max(min(self._max_support_vectors, num_slots), self._num_support)
+        self._reserve_slots(num_slots)
+        # maps the indices of the support vectors to their slots
+        slots: Dict[int, int] = {}
+        kernel_rows: Dict[int, np.ndarray] | None = None
         if not self._precomputed:
-            # evaluate kernel function only for the fixed datum and the support vectors
-            kernel = self._quantum_kernel.evaluate(X[index], x_supp) + self._kernel_offset
-        else:
-            kernel = X[index, support_indices]
+            # maps the indices of the sampled training data to their kernel values against the
+            # slots, NaN if not evaluated yet, so only kernel values of new support vectors are
+            # evaluated. Rows are kept for sampled data only and cover the slots in use when they
+            # were last evaluated. Kernel values of support vectors of previous training are
+            # evaluated again.
+            kernel_rows = {}
+
+        for indices in batches:
+            self._step += 1
+            values = self._compute_training_kernel_sums(indices, X, kernel_rows)
+
+            # the decisions of all data of the step are based on the same alphas
+            factor = self.C / (self._step * len(indices))
+            for i, value in zip(indices, values):
+                if labels[i] * factor * value < 1:
+                    # only way for a component of alpha to become non zero
+                    self._increment_alpha(i, X, labels, slots, kernel_rows)
+
+        self._num_seen += X.shape[0]
+
+        # the support vectors and their alphas multiplied by their labels are used for prediction
+        self._reserve_slots(self._num_support)
+        self._dual_coef = self._alphas * self._support_labels
+
+        self.fit_status_ = PegasosQSVC.FITTED
+
+    def _reserve_slots(self, num_slots: int) -> None:
+        """Helper function to resize the arrays of the support vectors to the number of slots.
+
+        Args:
+            num_slots: number of slots, at least the number of support vectors
+        """
 
-        # map the training labels of the support vectors to {-1,1}
-        y = np.array(list(map(self._label_map.get, self._y_train[support_indices])))
-        # weights for the support vectors
-        alphas = np.array(list(self._alphas.values()))
-        # this value corresponds to a sum of kernel values weighted by their labels and alphas
-        value = np.sum(alphas * y * kernel)
+        def resize(values: np.ndarray) -> np.ndarray:
+            resized = np.zeros((num_slots,) + values.shape[1:], dtype=values.dtype)
+            resized[: self._num_support] = values[: self._num_support]
+            return resized
+
+        self._alphas = resize(self._alphas)
+        self._support_indices = resize(self._support_indices)
+        self._support_labels = resize(self._support_labels)
+        if not self._precomputed:
+            self._support_vectors = resize(self._support_vectors)
+
+    def _compute_training_kernel_sums(
+        self,
+        indices: np.ndarray,
+        X: np.ndarray,
+        kernel_rows: Dict[int, np.ndarray] | None,
+    ) -> np.ndarray:
+        """Helper function to compute the weighted sums over support vectors of the training data
+        sampled in a step of the Pegasos algorithm.
+
+        Args:
+            indices: indices of the sampled training data
+            X: Training features
+            kernel_rows: cached kernel values of the sampled training data against the support
+                vector slots, updated in place. ``None`` for a precomputed kernel.
+
+        Returns:
+            Weighted sums of kernel evaluations for each of the sampled data
+        """
+        if self._precomputed:
+            kernel = X[np.ix_(indices, self._support_indices[: self._num_support])]
+        else:
+            kernel = np.full((len(indices), self._num_support), np.nan)
+            for row, index in enumerate(indices):
+                cached = kernel_rows.get(int(index))
+                if cached is not None:
+                    size = min(len(cached), self._num_support)
+                    kernel[row, :size] = cached[:size]
+            missing = np.isnan(kernel)
+            if missing.any():
+                # the missing kernel values of all sampled data are evaluated in a single call
+                rows = np.flatnonzero(missing.any(axis=1))
+                cols = np.flatnonzero(missing.any(axis=0))
+                new_kernel = (
+                    self._quantum_kernel.evaluate(X[indices[rows]], self._support_vectors[cols])
+                    + self._kernel_offset
+                )
+                kernel[np.ix_(rows, cols)] = new_kernel
+                for row in rows:
+                    kernel_rows[int(indices[row])] = kernel[row].copy()
+
+        # weights for the support vectors multiplied by their labels
+        weights = self._alphas[: self._num_support] * self._support_labels[: self._num_support]
+        return kernel @ weights
+
+    def _increment_alpha(
+        self,
+        index: int,
+        X: np.ndarray,
+        labels: np.ndarray,
+        slots: Dict[int, int],
+        kernel_rows: Dict[int, np.ndarray] | None,
+    ) -> None:
+        """Helper function to increment the alpha of a training datum. If the datum is not a
+        support vector yet, it is stored in a free slot or, once all slots are used, it replaces
+        the support vector with the smallest alpha.
 
-        return value
+        Args:
+            index: index of the training datum
+            X: Training features
+            labels: training labels mapped to {-1, +1}
+            slots: maps the indices of the support vectors of this training to their slots,
+                updated in place
+            kernel_rows: cached kernel values of the sampled training data against the support
+                vector slots, updated in place. ``None`` for a precomputed kernel.
+        """
+        # data of previous training are identified by the number of data seen before
+        key = self._num_seen + int(index)
+        slot = slots.get(key)
+        if slot is None:
+            if self._num_support < len(self._alphas):
+                slot = self._num_support
+                self._num_support += 1
+            else:
+                # the budget is exhausted, the support vector with the smallest alpha is removed
+                slot = int(np.argmin(self._alphas))
+                slots.pop(int(self._support_indices[slot]), None)
+                self._alphas[slot] = 0
+                if kernel_rows is not None:
+                    for cached in kernel_rows.values():
+                        if slot < len(cached):
+                            cached[slot] = np.nan
+
+            slots[key] = slot
+            self._support_indices[slot] = key
+            self._support_labels[slot] = labels[index]
+            if not self._precomputed:
+                self._support_vectors[slot] = X[index]
+
+        self._alphas[slot] += 1
 
     @property
     def quantum_kernel(self) -> BaseKernel:
@@ -336,6 +557,38 @@ class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
         # reset training status
         self._reset_state()
 
+    @property
+    def batch_size(self) -> int:
+        """Returns the number of random data used in every step of the Pegasos algorithm."""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: int):
+        """Sets the number of random data used in every step of the Pegasos algorithm."""
+        if batch_size < 1:
+            raise ValueError(f"batch_size has to be a positive number, found {batch_size}.")
+        self._batch_size = batch_size
+
+        # reset training status
+        self._reset_state()
+
+    @property
+    def max_support_vectors(self) -> int | None:
+        """Returns the maximum number of support vectors or ``None`` if it is not limited."""
+        return self._max_support_vectors
+
+    @max_support_vectors.setter
+    def max_support_vectors(self, max_support_vectors: int | None):
+        """Sets the maximum number of support vectors, ``None`` to not limit it."""
+        if max_support_vectors is not None and max_support_vectors < 1:
+            raise ValueError(
+                f"max_support_vectors has to be a positive number, found {max_support_vectors}."
+            )
+        self._max_support_vectors = max_support_vectors
+
+        # reset training status
+        self._reset_state()
+
     @property
     def precomputed(self) -> bool:
         """Returns a boolean flag indicating whether a precomputed kernel is used."""
@@ -361,9 +614,13 @@ class PegasosQSVC(ClassifierMixin, SerializableModelMixin):
         """Resets internal data structures used in training."""
         self.fit_status_ = PegasosQSVC.UNFITTED
         self._alphas = None
-        self._x_train = None
+        self._num_support = None
         self._n_samples = None
-        self._y_train = None
-        self._label_map = None
         self._label_pos = None
         self._label_neg = None
+        self._support_indices = None
+        self._support_vectors = None
+        self._support_labels = None
+        self._dual_coef = None
+        self._step = None
+        self._num_seen = None
@@ -13,9 +13,11 @@
 for classifiers/regressors."""
 
 from abc import abstractmethod
-from typing import Optional, Union
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
 
 import numpy as np
+from qiskit_algorithms.utils import algorithm_globals
 
 import qiskit_machine_learning.optionals as _optionals
 from qiskit_machine_learning.neural_networks import NeuralNetwork
@@ -40,7 +42,14 @@ class ObjectiveFunction:
 
     # pylint: disable=invalid-name
     def __init__(
-        self, X: np.ndarray, y: np.ndarray, neural_network: NeuralNetwork, loss: Loss
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        neural_network: NeuralNetwork,
+        loss: Loss,
+        batch_size: Optional[int] = None,
+        shuffle: bool = True,
+        cache_size: int = 1,
     ) -> None:
         """
         Args:
@@ -49,15 +58,106 @@ class ObjectiveFunction:
             neural_network: An instance of an quantum neural network to be used by this
                 objective function.
             loss: A target loss function to be used in training.
+            batch_size: The number of samples the objective and its gradients are evaluated on.
+                If ``None``, all samples are used. Otherwise, the samples are split into
+                mini-batches and :meth:`next_batch` moves on to the next mini-batch. Once all
+                mini-batches have been used, a new epoch starts.
+            shuffle: Whether the samples are shuffled at the beginning of every epoch when
+                mini-batches are used.
+            cache_size: The number of weight vectors for which the results of the forward and
+                backward passes are cached. The least recently used results are discarded first.
+                The default caches the results of the last weights only, which serves a gradient
+                evaluated at the same weights as the objective. Larger values help optimizers
+                alternating between several weights, such as
+                :class:`~qiskit_algorithms.optimizers.SPSA`, at the cost of keeping a gradient
+                tensor for every cached weight vector in memory.
+
+        Raises:
+            ValueError: When a non-positive batch size or cache size is passed.
         """
         super().__init__()
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {batch_size}.")
+        if cache_size < 1:
+            raise ValueError(f"Cache size must be positive, got {cache_size}.")
+
+        self._all_X = X
+        self._all_y = y
+        self._neural_network = neural_network
+        self._loss = loss
+        self._batch_size = batch_size
+        self._shuffle = shuffle
+        self._epoch = 0
+        self._batch_start = 0
+        self._order = self._sample_order()
+
         self._X = X
         self._num_samples = X.shape[0]
         self._y = y
-        self._neural_network = neural_network
-        self._loss = loss
-        self._last_forward_weights: Optional[np.ndarray] = None
-        self._last_forward: Optional[Union[np.ndarray, SparseArray]] = None
+        # maps the bytes of the weights to the results of the forward and backward passes
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, dict] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._select_batch()
+
+    @property
+    def batch_size(self) -> Optional[int]:
+        """Returns the number of samples in a mini-batch or ``None`` if all samples are used."""
+        return self._batch_size
+
+    @property
+    def epoch(self) -> int:
+        """Returns the number of epochs completed by :meth:`next_batch`."""
+        return self._epoch
+
+    @property
+    def cache_size(self) -> int:
+        """Returns the number of weight vectors for which the network results are cached."""
+        return self._cache_size
+
+    @property
+    def cache_hits(self) -> int:
+        """Returns the number of network evaluations served from the cache."""
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Returns the number of network evaluations not found in the cache."""
+        return self._cache_misses
+
+    def next_batch(self) -> None:
+        """
+        Moves on to the next mini-batch of samples. Once all samples of an epoch have been used,
+        a new epoch starts, and the samples are shuffled again if ``shuffle`` is ``True``. This
+        does nothing if all samples are used at once.
+        """
+        if self._batch_size is None:
+            return
+
+        self._batch_start += self._batch_size
+        if self._batch_start >= self._all_X.shape[0]:
+            self._epoch += 1
+            self._batch_start = 0
+            self._order = self._sample_order()
+        self._select_batch()
+
+    def _sample_order(self) -> np.ndarray:
+        num_samples = self._all_X.shape[0]
+        if self._batch_size is not None and self._shuffle:
+            return algorithm_globals.random.permutation(num_samples)
+        return np.arange(num_samples)
+
+    def _select_batch(self) -> None:
+        if self._batch_size is None:
+            return
+
+        indices = self._order[self._batch_start : self._batch_start + self._batch_size]
+        self._X = self._all_X[indices]
+        self._y = np.asarray(self._all_y)[indices]
+        self._num_samples = self._X.shape[0]
+        # the cached passes were evaluated on a different batch
+        self._cache.clear()
 
     @abstractmethod
     def objective(self, weights: np.ndarray) -> float:
@@ -83,6 +183,22 @@ class ObjectiveFunction:
         """
         raise NotImplementedError
 
+    def _cache_entry(self, weights: np.ndarray) -> dict:
+        """
+        Returns the cached results for the weights, keyed by their exact values, and marks them
+        as the most recently used ones. A new empty entry is added if the weights are not cached.
+        """
+        key = np.asarray(weights, dtype=float).tobytes()
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = {}
+            self._cache[key] = entry
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return entry
+
     def _neural_network_forward(self, weights: np.ndarray) -> Union[np.ndarray, SparseArray]:
         """
         Computes and caches the results of the forward pass. Cached values may be re-used in
@@ -94,16 +210,60 @@ class ObjectiveFunction:
         Returns:
             The result of the neural network.
         """
-        # if we get the same weights, we don't compute the forward pass again.
-        if self._last_forward_weights is None or (
-            not np.all(np.isclose(weights, self._last_forward_weights))
-        ):
-            # compute forward and cache the results for re-use in backward
-            self._last_forward = self._neural_network.forward(self._X, weights)
-            # a copy avoids keeping a reference to the same array, so we are sure we have
-            # different arrays on the next iteration.
-            self._last_forward_weights = np.copy(weights)
-        return self._last_forward
+        entry = self._cache_entry(weights)
+        if "forward" in entry:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+            entry["forward"] = self._neural_network.forward(self._X, weights)
+        return entry["forward"]
+
+    def _neural_network_backward(
+        self, weights: np.ndarray
+    ) -> Optional[Union[np.ndarray, SparseArray]]:
+        """
+        Computes and caches the weight gradients of the backward pass.
+
+        Args:
+            weights: an array of weights to be used in the backward pass.
+
+        Returns:
+            The gradients of the neural network with respect to the weights.
+        """
+        entry = self._cache_entry(weights)
+        if "backward" in entry:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+            _, entry["backward"] = self._neural_network.backward(self._X, weights)
+        return entry["backward"]
+
+    def _neural_network_forward_backward(
+        self, weights: np.ndarray
+    ) -> Tuple[Union[np.ndarray, SparseArray], Optional[Union[np.ndarray, SparseArray]]]:
+        """
+        Computes and caches the results of the forward pass and the weight gradients of the
+        backward pass. Only the passes missing from the cache are evaluated, and both passes are
+        evaluated at once if neither is cached.
+
+        Args:
+            weights: an array of weights to be used in the forward and backward passes.
+
+        Returns:
+            The result of the neural network and the gradients with respect to the weights.
+        """
+        entry = self._cache_entry(weights)
+        if "forward" in entry and "backward" in entry:
+            self._cache_hits += 1
+        elif "forward" in entry:
+            self._cache_misses += 1
+            _, entry["backward"] = self._neural_network.backward(self._X, weights)
+        else:
+            self._cache_misses += 1
+            output, _, weight_grad = self._neural_network.forward_backward(self._X, weights)
+            entry["forward"] = output
+            entry["backward"] = weight_grad
+        return entry["forward"], entry["backward"]
 
 
 class BinaryObjectiveFunction(ObjectiveFunction):
@@ -124,9 +284,8 @@ class BinaryObjectiveFunction(ObjectiveFunction):
             raise ValueError(f"Number of outputs is expected to be 1, got {num_outputs}")
 
         # output must be of shape (N, 1), where N is a number of samples
-        output = self._neural_network_forward(weights)
         # weight grad is of shape (N, 1, num_weights)
-        _, weight_grad = self._neural_network.backward(self._X, weights)
+        output, weight_grad = self._neural_network_forward_backward(weights)
 
         # we reshape _y since the output has the shape (N, 1) and _y has (N,)
         # loss_gradient is of shape (N, 1)
@@ -147,36 +306,60 @@ class MultiClassObjectiveFunction(ObjectiveFunction):
     ``0``, ``1``, ``2``, etc.
     """
 
+    def __init__(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        neural_network: NeuralNetwork,
+        loss: Loss,
+        batch_size: Optional[int] = None,
+        shuffle: bool = True,
+        cache_size: int = 1,
+    ) -> None:
+        # the loss table depends on the labels of the current batch, see _select_batch
+        self._loss_table: Optional[np.ndarray] = None
+        super().__init__(X, y, neural_network, loss, batch_size, shuffle, cache_size)
+
+    def _select_batch(self) -> None:
+        super()._select_batch()
+        self._loss_table = None
+
+    def _get_loss_table(self) -> np.ndarray:
+        """
+        Computes and caches the loss of every output value versus the true labels.
+
+        Returns:
+            An array of shape (N, num_outputs), where the column ``i`` is the loss of the output
+            value ``i`` versus the true labels across all samples.
+        """
+        if self._loss_table is None:
+            num_outputs = self._neural_network.output_shape[0]
+            labels = np.asarray(self._y)
+            # the loss of all output values and samples is evaluated in a single call
+            predict = np.tile(np.arange(num_outputs), labels.shape[0])
+            target = np.repeat(labels, num_outputs)
+            self._loss_table = np.reshape(self._loss(predict, target), (-1, num_outputs))
+        return self._loss_table
+
     def objective(self, weights: np.ndarray) -> float:
         # probabilities is of shape (N, num_outputs)
         probs = self._neural_network_forward(weights)
 
-        num_outputs = self._neural_network.output_shape[0]
-        val = 0.0
-        num_samples = self._X.shape[0]
-        for i in range(num_outputs):
-            # for each output we compute a dot product of probabilities of this output and a loss
-            # vector.
-            # loss vector is a loss of a particular output value(value of i) versus true labels.
-            # we do this across all samples.
-            val += probs[:, i] @ self._loss(np.full(num_samples, i), self._y)
-        val = val / self._num_samples
-
-        return val
+        # a sum of probabilities of each output value weighted by the loss of this output value
+        # versus true labels across all samples.
+        val = np.tensordot(probs, self._get_loss_table(), axes=2)
+        # float(...) is for mypy compliance
+        return float(val) / self._num_samples
 
     def gradient(self, weights: np.ndarray) -> np.ndarray:
         # weight probability gradient is of shape (N, num_outputs, num_weights)
-        _, weight_prob_grad = self._neural_network.backward(self._X, weights)
-
-        grad = np.zeros((1, self._neural_network.num_weights))
-        num_samples = self._X.shape[0]
-        num_outputs = self._neural_network.output_shape[0]
-        for i in range(num_outputs):
-            # similar to what is in the objective, but we compute a matrix multiplication of
-            # weight probability gradients and a loss vector.
-            grad += weight_prob_grad[:, i, :].T @ self._loss(np.full(num_samples, i), self._y)
+        weight_prob_grad = self._neural_network_backward(weights)
 
-        grad = grad / self._num_samples
+        # similar to what is in the objective, but we contract weight probability gradients
+        # with the loss table over samples and outputs.
+        grad = np.tensordot(weight_prob_grad, self._get_loss_table(), axes=([0, 1], [0, 1]))
+        # we keep the shape of (1, num_weights)
+        grad = grad.reshape(1, -1) / self._num_samples
         return grad
 
 
@@ -195,9 +378,8 @@ class OneHotObjectiveFunction(ObjectiveFunction):
 
     def gradient(self, weights: np.ndarray) -> np.ndarray:
         # predict is of shape (N, num_outputs)
-        y_predict = self._neural_network_forward(weights)
         # weight probability gradient is of shape (N, num_outputs, num_weights)
-        _, weight_prob_grad = self._neural_network.backward(self._X, weights)
+        y_predict, weight_prob_grad = self._neural_network_forward_backward(weights)
 
         grad = np.zeros(self._neural_network.num_weights)
         num_outputs = self._neural_network.output_shape[0]
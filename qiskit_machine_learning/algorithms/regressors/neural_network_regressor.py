@@ -37,9 +37,13 @@ class NeuralNetworkRegressor(TrainableModel, RegressorMixin):
         # mypy definition
         function: ObjectiveFunction = None
         if self._neural_network.output_shape == (1,):
-            function = BinaryObjectiveFunction(X, y, self._neural_network, self._loss)
+            function = BinaryObjectiveFunction(
+                X, y, self._neural_network, self._loss, self._batch_size, self._shuffle
+            )
         else:
-            function = MultiClassObjectiveFunction(X, y, self._neural_network, self._loss)
+            function = MultiClassObjectiveFunction(
+                X, y, self._neural_network, self._loss, self._batch_size, self._shuffle
+            )
 
         return self._minimize(function)
 
@@ -41,6 +41,8 @@ class VQR(NeuralNetworkRegressor):
         initial_point: np.ndarray | None = None,
         callback: Callable[[np.ndarray, float], None] | None = None,
         *,
+        batch_size: int | None = None,
+        shuffle: bool = True,
         estimator: BaseEstimator | None = None,
     ) -> None:
         r"""
@@ -71,6 +73,16 @@ class VQR(NeuralNetworkRegressor):
                 On each iteration an optimizer invokes the callback and passes current weights
                 as an array and a computed value as a float of the objective function being
                 optimized. This allows to track how well optimization / training process is going on.
+            batch_size: The number of samples the objective function and its gradients are
+                evaluated on. If ``None``, all samples are used in every evaluation. Otherwise,
+                the training data is split into mini-batches and the objective function moves on
+                to the next mini-batch once per optimizer iteration, i.e. after every gradient
+                evaluation. This is intended for stochastic gradient-based optimizers.
+                Gradient-free optimizers, such as :class:`~qiskit_algorithms.optimizers.COBYLA`
+                or :class:`~qiskit_algorithms.optimizers.SPSA`, train on the first mini-batch
+                only, they do not work with mini-batches.
+            shuffle: Whether the training data is shuffled at the beginning of every epoch when
+                mini-batches are used.
             estimator: an optional Estimator primitive instance to be used by the underlying
                 :class:`~qiskit_machine_learning.neural_networks.EstimatorQNN` neural network. If
                 ``None`` is passed then an instance of the reference Estimator will be used.
@@ -117,6 +129,8 @@ class VQR(NeuralNetworkRegressor):
             warm_start=warm_start,
             initial_point=initial_point,
             callback=callback,
+            batch_size=batch_size,
+            shuffle=shuffle,
         )
 
     @property
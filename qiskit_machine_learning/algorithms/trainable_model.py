@@ -43,6 +43,8 @@ class TrainableModel(SerializableModelMixin):
         warm_start: bool = False,
         initial_point: np.ndarray = None,
         callback: Callable[[np.ndarray, float], None] | None = None,
+        batch_size: int | None = None,
+        shuffle: bool = True,
     ):
         """
         Args:
@@ -71,8 +73,22 @@ class TrainableModel(SerializableModelMixin):
                 On each iteration an optimizer invokes the callback and passes current weights
                 as an array and a computed value as a float of the objective function being
                 optimized. This allows to track how well optimization / training process is going on.
+            batch_size: The number of samples the objective function and its gradients are
+                evaluated on. If ``None``, all samples are used in every evaluation. Otherwise,
+                the training data is split into mini-batches and the objective function moves on
+                to the next mini-batch once per optimizer iteration, i.e. after every gradient
+                evaluation, which makes the cost of an iteration independent of the size of the
+                dataset. This is intended for stochastic gradient-based optimizers such as
+                :class:`~qiskit_algorithms.optimizers.GradientDescent` or
+                :class:`~qiskit_algorithms.optimizers.ADAM`. Gradient-free optimizers, such as
+                :class:`~qiskit_algorithms.optimizers.COBYLA` or
+                :class:`~qiskit_algorithms.optimizers.SPSA`, never evaluate the gradient and
+                thus train on the first mini-batch only, they do not work with mini-batches.
+            shuffle: Whether the training data is shuffled at the beginning of every epoch when
+                mini-batches are used.
         Raises:
-            QiskitMachineLearningError: unknown loss, invalid neural network
+            QiskitMachineLearningError: unknown loss, invalid neural network.
+            ValueError: non-positive batch size.
         """
         self._neural_network = neural_network
         if len(neural_network.output_shape) > 1:
@@ -98,6 +114,11 @@ class TrainableModel(SerializableModelMixin):
         self._initial_point = initial_point
         self._callback = callback
 
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {batch_size}.")
+        self._batch_size = batch_size
+        self._shuffle = shuffle
+
     @property
     def neural_network(self):
         """Returns the underlying neural network."""
@@ -130,6 +151,32 @@ class TrainableModel(SerializableModelMixin):
         """Sets the warm start flag."""
         self._warm_start = warm_start
 
+    @property
+    def batch_size(self) -> int | None:
+        """Returns the number of samples in a mini-batch or ``None`` if all samples are used."""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: int | None) -> None:
+        """Sets the number of samples in a mini-batch.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {batch_size}.")
+        self._batch_size = batch_size
+
+    @property
+    def shuffle(self) -> bool:
+        """Returns whether the training data is shuffled in every epoch of mini-batches."""
+        return self._shuffle
+
+    @shuffle.setter
+    def shuffle(self, shuffle: bool) -> None:
+        """Sets whether the training data is shuffled in every epoch of mini-batches."""
+        self._shuffle = shuffle
+
     @property
     def initial_point(self) -> np.ndarray:
         """Returns current initial point"""
@@ -274,6 +321,73 @@ class TrainableModel(SerializableModelMixin):
 
         return objective
 
+    @staticmethod
+    def _get_gradient(function: ObjectiveFunction) -> Callable:
+        """
+        Wraps the gradient of the given `ObjectiveFunction`. When mini-batches are used, the
+        gradient is flattened to the shape of the weights as expected by stochastic optimizers.
+        Returned function is passed to `Optimizer.minimize()`.
+
+        Args:
+            function: The objective function whose gradient is to be evaluated.
+
+        Returns:
+            Function to evaluate the gradient of the objective function.
+        """
+        if function.batch_size is None:
+            return function.gradient
+
+        def gradient(objective_weights):
+            return np.reshape(function.gradient(objective_weights), -1)
+
+        return gradient
+
+    @staticmethod
+    def _advance_batches(
+        function: ObjectiveFunction, objective: Callable, gradient: Callable
+    ) -> tuple[Callable, Callable]:
+        """
+        Wraps the objective and the gradient to move on to the next mini-batch of the given
+        `ObjectiveFunction` once per optimizer iteration, i.e. on the first evaluation at weights
+        that differ from the weights of the last gradient evaluation. Thus, the objective and the
+        gradient at the same weights are evaluated on the same mini-batch, in any order. Objective
+        evaluations at other weights without a gradient evaluation in between, e.g. the
+        perturbations of SPSA or the probes of gradient-free optimizers, are evaluated on the
+        same mini-batch, so their values are comparable.
+
+        Args:
+            function: The objective function that provides the mini-batches.
+            objective: The objective to be passed to `Optimizer.minimize()`.
+            gradient: The gradient to be passed to `Optimizer.minimize()`.
+
+        Returns:
+            The wrapped objective and gradient.
+        """
+        # the weights of the last gradient evaluation, if the mini-batch has not been moved on
+        # since then
+        gradient_weights = None
+
+        def advance(objective_weights):
+            nonlocal gradient_weights
+            if gradient_weights is not None and not np.array_equal(
+                gradient_weights, objective_weights
+            ):
+                function.next_batch()
+                gradient_weights = None
+
+        def batch_objective(objective_weights):
+            advance(objective_weights)
+            return objective(objective_weights)
+
+        def batch_gradient(objective_weights):
+            nonlocal gradient_weights
+            advance(objective_weights)
+            objective_gradient = gradient(objective_weights)
+            gradient_weights = np.array(objective_weights, copy=True)
+            return objective_gradient
+
+        return batch_objective, batch_gradient
+
     def _minimize(self, function: ObjectiveFunction) -> OptimizerResult:
         """
         Minimizes the objective function.
@@ -285,16 +399,17 @@ class TrainableModel(SerializableModelMixin):
             An optimization result.
         """
         objective = self._get_objective(function)
+        gradient = self._get_gradient(function)
+        if function.batch_size is not None:
+            objective, gradient = self._advance_batches(function, objective, gradient)
 
         initial_point = self._choose_initial_point()
         if callable(self._optimizer):
-            optimizer_result = self._optimizer(
-                fun=objective, x0=initial_point, jac=function.gradient
-            )
+            optimizer_result = self._optimizer(fun=objective, x0=initial_point, jac=gradient)
         else:
             optimizer_result = self._optimizer.minimize(
                 fun=objective,
                 x0=initial_point,
-                jac=function.gradient,
+                jac=gradient,
             )
         return optimizer_result
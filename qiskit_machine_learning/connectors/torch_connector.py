@@ -13,6 +13,9 @@
 """A connector to use Qiskit (Quantum) Neural Networks as PyTorch modules."""
 from __future__ import annotations
 
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from typing import Tuple, Any, cast
 
 import numpy as np
@@ -52,6 +55,129 @@ else:
         pass
 
 
+# the copy of the neural network evaluated by a worker process of a TorchConnector
+_WORKER_NETWORK: NeuralNetwork | None = None
+
+
+def _init_worker(neural_network: NeuralNetwork) -> None:
+    global _WORKER_NETWORK  # pylint: disable=global-statement
+    _WORKER_NETWORK = neural_network
+
+
+def _run_worker(method: str, input_data: np.ndarray, weights: np.ndarray) -> Any:
+    return getattr(_WORKER_NETWORK, method)(input_data, weights)
+
+
+def _concatenate(parts: list) -> Any:
+    """Concatenates dense or sparse results of shards of a batch along the batch dimension."""
+    if parts[0] is None:
+        return None
+    if isinstance(parts[0], np.ndarray):
+        return np.concatenate(parts)
+
+    _optionals.HAS_SPARSE.require_now("Sparse")
+    import sparse
+
+    # pylint: disable=no-member
+    return sparse.concatenate(parts)
+
+
+class _WorkerPool:
+    """Evaluates a neural network on shards of a batch in worker processes, each holding its own
+    copy of the neural network. The worker processes are spawned rather than forked, since the
+    process may run threads, e.g. of PyTorch or of the primitives, and they are shut down once
+    the pool is garbage collected."""
+
+    def __init__(self, neural_network: NeuralNetwork, num_workers: int) -> None:
+        self._neural_network = neural_network
+        self._num_workers = num_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(neural_network,),
+        )
+        self._finalizer = weakref.finalize(self, self._executor.shutdown)
+
+    def run(self, method: str, input_data: np.ndarray, weights: np.ndarray) -> Any:
+        """Evaluates a method of the neural network, ``forward``, ``backward`` or
+        ``forward_backward``, on a batch. Batches of more than one sample are split into a shard
+        for every worker process and the results are gathered in the order of the samples."""
+        if input_data.ndim != 2 or input_data.shape[0] < 2:
+            return getattr(self._neural_network, method)(input_data, weights)
+
+        shards = np.array_split(input_data, min(self._num_workers, input_data.shape[0]))
+        futures = [self._executor.submit(_run_worker, method, shard, weights) for shard in shards]
+        results = [future.result() for future in futures]
+        if method == "forward":
+            return _concatenate(results)
+        return tuple(_concatenate(list(parts)) for parts in zip(*results))
+
+    def shutdown(self) -> None:
+        """Shuts the worker processes down."""
+        self._finalizer()
+
+
+class _TensorBridge:
+    """Converts between tensors and arrays, sharing memory where possible, and counts the bytes
+    copied by the conversions."""
+
+    def __init__(self, dtype: torch.dtype) -> None:
+        self.dtype = dtype
+        self.bytes_copied = 0
+
+    def to_array(self, tensor: Tensor) -> np.ndarray:
+        """Converts a tensor to an array that shares memory with tensors on CPU."""
+        tensor = tensor.detach()
+        if tensor.device.type != "cpu":
+            tensor = tensor.cpu()
+            self.bytes_copied += tensor.element_size() * tensor.nelement()
+        return tensor.numpy()
+
+    def to_tensor(
+        self, array: np.ndarray, dtype: torch.dtype | None = None, device: Any = None
+    ) -> Tensor:
+        """Converts an array to a tensor of the given type, the output type if ``None``, on the
+        given device. The tensor shares memory with the array if no conversion is required."""
+        array = np.asarray(array)
+        try:
+            if not array.flags.writeable:
+                raise ValueError("Read-only arrays are not shared")
+            tensor = torch.from_numpy(array)
+        except (TypeError, ValueError):
+            # e.g. read-only arrays or negative strides
+            tensor = torch.tensor(array)
+            self.bytes_copied += array.nbytes
+
+        converted = tensor.to(device=device, dtype=dtype or self.dtype)
+        if converted.data_ptr() != tensor.data_ptr():
+            self.bytes_copied += converted.element_size() * converted.nelement()
+        return converted
+
+    def to_sparse_tensor(
+        self, array: Any, dtype: torch.dtype | None = None, device: Any = None
+    ) -> Tensor:
+        """Converts a sparse array in COO format to a sparse tensor."""
+        return torch.sparse_coo_tensor(
+            self.to_tensor(array.coords, dtype=torch.long, device=device),
+            self.to_tensor(array.data, dtype=dtype, device=device),
+            size=array.shape,
+        )
+
+
+def _evaluate(
+    neural_network: NeuralNetwork,
+    worker_pool: _WorkerPool | None,
+    method: str,
+    input_data: np.ndarray,
+    weights: np.ndarray,
+) -> Any:
+    """Evaluates a method of the neural network in the worker processes, if any."""
+    if worker_pool is None:
+        return getattr(neural_network, method)(input_data, weights)
+    return worker_pool.run(method, input_data, weights)
+
+
 @_optionals.HAS_TORCH.require_in_instance
 class TorchConnector(Module):
     """Connects a Qiskit (Quantum) Neural Network to PyTorch."""
@@ -66,6 +192,9 @@ class TorchConnector(Module):
             weights: Tensor,
             neural_network: NeuralNetwork,
             sparse: bool,
+            fused: bool = False,
+            worker_pool: _WorkerPool | None = None,
+            bridge: _TensorBridge | None = None,
         ) -> Tensor:
             """Forward pass computation.
             Args:
@@ -74,6 +203,12 @@ class TorchConnector(Module):
                 weights: The weights.
                 neural_network: The neural network to be connected.
                 sparse: Indicates whether to use sparse output or not.
+                fused: Indicates whether to evaluate the gradients for the backward pass together
+                    with the forward pass.
+                worker_pool: The worker processes to evaluate the neural network on shards of the
+                    batch, or ``None`` to evaluate it in this process.
+                bridge: Converts between tensors and arrays and sets the type of the output. If
+                    ``None``, the output is of type ``torch.float``.
 
             Returns:
                 The resulting value of the forward pass.
@@ -90,25 +225,41 @@ class TorchConnector(Module):
                     + f"expected input compatible to {neural_network.num_inputs}"
                 )
 
+            if bridge is None:
+                bridge = _TensorBridge(torch.float)
+
             ctx.neural_network = neural_network
             ctx.sparse = sparse
+            ctx.worker_pool = worker_pool
+            ctx.bridge = bridge
             ctx.save_for_backward(input_data, weights)
 
             # Detach the tensors and move it to CPU as we need numpy array to compute gradients
-            # of the quantum neural network. If the tensors are on CPU already this does nothing.
-            # Some other tensors down below are also moved to CPU for computations.
-            result = neural_network.forward(
-                input_data.detach().cpu().numpy(), weights.detach().cpu().numpy()
-            )
+            # of the quantum neural network. If the tensors are on CPU already the arrays share
+            # memory with the tensors.
+            input_array = bridge.to_array(input_data)
+            weights_array = bridge.to_array(weights)
+            ctx.gradients = None
+            if fused and any(ctx.needs_input_grad[:2]):
+                # the gradients will be needed in the backward pass, so both passes are
+                # evaluated at once. No job of the network is left running once the forward pass
+                # returns, so later passes never submit jobs to the primitives concurrently.
+                result, *ctx.gradients = _evaluate(
+                    neural_network, worker_pool, "forward_backward", input_array, weights_array
+                )
+            else:
+                result = _evaluate(
+                    neural_network, worker_pool, "forward", input_array, weights_array
+                )
             if ctx.sparse:
                 if neural_network.sparse:
                     _optionals.HAS_SPARSE.require_now("SparseArray")
                     # pylint: disable=import-error
                     from sparse import SparseArray, COO
 
-                    # todo: replace output type from DOK to COO?
+                    # the output of the network is in COO format already, so nothing is converted
                     result = cast(COO, cast(SparseArray, result).asformat("coo"))
-                    result_tensor = torch.sparse_coo_tensor(result.coords, result.data)
+                    result_tensor = bridge.to_sparse_tensor(result, device=input_data.device)
                 else:
                     raise RuntimeError(
                         "TorchConnector configured as sparse, the network must be sparse as well"
@@ -122,7 +273,8 @@ class TorchConnector(Module):
 
                     # cast is required by mypy
                     result = cast(SparseArray, result).todense()
-                result_tensor = torch.as_tensor(result, dtype=torch.float)
+                # place the resulting tensor back to the device where input data is stored
+                result_tensor = bridge.to_tensor(result, device=input_data.device)
 
             # if the input was not a batch, then remove the batch-dimension from the result,
             # since the neural network will always treat input as a batch and cast to a
@@ -131,9 +283,6 @@ class TorchConnector(Module):
             if len(input_data.shape) == 1:
                 result_tensor = result_tensor[0]
 
-            # place the resulting tensor back to the device where input data is stored
-            result_tensor = result_tensor.to(input_data.device)
-
             return result_tensor
 
         @staticmethod
@@ -150,9 +299,11 @@ class TorchConnector(Module):
                 gradients for the first two arguments and None for the others
             """
 
-            # get context data
+            # get context data, the saved tensors are checked by PyTorch not to have been modified
+            # in place since the forward pass
             input_data, weights = ctx.saved_tensors
             neural_network = ctx.neural_network
+            bridge = ctx.bridge
 
             # validate input shape
             if input_data.shape[-1] != neural_network.num_inputs:
@@ -165,100 +316,102 @@ class TorchConnector(Module):
             if len(grad_output.shape) == 1:
                 grad_output = grad_output.view(1, -1)
 
-            # evaluate QNN gradient
-            input_grad, weights_grad = neural_network.backward(
-                input_data.detach().cpu().numpy(), weights.detach().cpu().numpy()
-            )
+            # evaluate QNN gradient, unless it has been evaluated in the forward pass
+            if ctx.gradients is not None:
+                input_grad, weights_grad = ctx.gradients
+                ctx.gradients = None
+            else:
+                input_grad, weights_grad = _evaluate(
+                    neural_network,
+                    ctx.worker_pool,
+                    "backward",
+                    bridge.to_array(input_data),
+                    bridge.to_array(weights),
+                )
+
+            if ctx.sparse:
+                if not neural_network.sparse:
+                    # this exception should never happen
+                    raise RuntimeError(
+                        "TorchConnector configured as sparse, the network must be sparse as well"
+                    )
+                _optionals.HAS_SPARSE.require_now("Sparse")
+                import sparse
+                from sparse import COO
+
+                grad_output = grad_output.detach()
+                grad_output = COO(
+                    bridge.to_array(grad_output.indices()), bridge.to_array(grad_output.values())
+                )
+                # Pytorch does not support sparse einsum, so we rely on Sparse.
+                # pylint: disable=no-member
+                einsum = sparse.einsum
+            else:
+                # the gradients of the network are contracted as arrays, so only the contracted
+                # gradients are converted to tensors
+                grad_output = bridge.to_array(grad_output)
+                einsum = np.einsum
+
             if input_grad is not None:
-                if ctx.sparse:
-                    if neural_network.sparse:
-                        _optionals.HAS_SPARSE.require_now("Sparse")
-                        import sparse
-                        from sparse import COO
-
-                        grad_output = grad_output.detach().cpu()
-                        grad_coo = COO(grad_output.indices(), grad_output.values())
-
-                        # Takes gradients from previous layer in backward pass (i.e. later layer in
-                        # forward pass) j for each observation i in the batch. Multiplies this with
-                        # the gradient from this point on backwards with respect to each input k.
-                        # Sums over all j to get total gradient of output w.r.t. each input k and
-                        # batch index i. This operation should preserve the batch dimension to be
-                        # able to do back-prop in a batched manner.
-                        # Pytorch does not support sparse einsum, so we rely on Sparse.
-                        # pylint: disable=no-member
-                        input_grad = sparse.einsum("ij,ijk->ik", grad_coo, input_grad)
-
-                        # return sparse gradients
-                        input_grad = torch.sparse_coo_tensor(input_grad.coords, input_grad.data)
-                    else:
-                        # this exception should never happen
-                        raise RuntimeError(
-                            "TorchConnector configured as sparse, "
-                            "the network must be sparse as well"
-                        )
-                else:
-                    # connector is dense
-                    if neural_network.sparse:
-                        # convert to dense
-                        input_grad = input_grad.todense()
-                    input_grad = torch.as_tensor(input_grad, dtype=torch.float)
+                if neural_network.sparse and not ctx.sparse:
+                    # convert to dense
+                    input_grad = input_grad.todense()
 
-                    # same as above
-                    input_grad = torch.einsum("ij,ijk->ik", grad_output.detach().cpu(), input_grad)
+                # Takes gradients from previous layer in backward pass (i.e. later layer in
+                # forward pass) j for each observation i in the batch. Multiplies this with
+                # the gradient from this point on backwards with respect to each input k.
+                # Sums over all j to get total gradient of output w.r.t. each input k and
+                # batch index i. This operation should preserve the batch dimension to be
+                # able to do back-prop in a batched manner.
+                input_grad = einsum("ij,ijk->ik", grad_output, input_grad)
 
                 # place the resulting tensor to the device where they were stored
-                input_grad = input_grad.to(input_data.device)
-
-            if weights_grad is not None:
                 if ctx.sparse:
-                    if neural_network.sparse:
-                        import sparse
-                        from sparse import COO
-
-                        grad_output = grad_output.detach().cpu()
-                        grad_coo = COO(grad_output.indices(), grad_output.values())
-
-                        # Takes gradients from previous layer in backward pass (i.e. later layer in
-                        # forward pass) j for each observation i in the batch. Multiplies this with
-                        # the gradient from this point on backwards with respect to each
-                        # parameter k. Sums over all i and j to get total gradient of output
-                        # w.r.t. each parameter k. The weights' dimension is independent of the
-                        # batch size.
-                        # pylint: disable=no-member
-                        weights_grad = sparse.einsum("ij,ijk->k", grad_coo, weights_grad)
-
-                        # return sparse gradients
-                        weights_grad = torch.sparse_coo_tensor(
-                            weights_grad.coords, weights_grad.data
-                        )
-                    else:
-                        # this exception should never happen
-                        raise RuntimeError(
-                            "TorchConnector configured as sparse, "
-                            "the network must be sparse as well"
-                        )
+                    # return sparse gradients
+                    input_grad = bridge.to_sparse_tensor(
+                        input_grad, dtype=input_data.dtype, device=input_data.device
+                    )
                 else:
-                    if neural_network.sparse:
-                        # convert to dense
-                        weights_grad = weights_grad.todense()
-                    weights_grad = torch.as_tensor(weights_grad, dtype=torch.float)
-                    # same as above
-                    weights_grad = torch.einsum(
-                        "ij,ijk->k", grad_output.detach().cpu(), weights_grad
+                    input_grad = bridge.to_tensor(
+                        input_grad, dtype=input_data.dtype, device=input_data.device
                     )
 
+            if weights_grad is not None:
+                if neural_network.sparse and not ctx.sparse:
+                    # convert to dense
+                    weights_grad = weights_grad.todense()
+
+                # Takes gradients from previous layer in backward pass (i.e. later layer in
+                # forward pass) j for each observation i in the batch. Multiplies this with
+                # the gradient from this point on backwards with respect to each
+                # parameter k. Sums over all i and j to get total gradient of output
+                # w.r.t. each parameter k. The weights' dimension is independent of the
+                # batch size.
+                weights_grad = einsum("ij,ijk->k", grad_output, weights_grad)
+
                 # place the resulting tensor to the device where they were stored
-                weights_grad = weights_grad.to(weights.device)
+                if ctx.sparse:
+                    # return sparse gradients
+                    weights_grad = bridge.to_sparse_tensor(
+                        weights_grad, dtype=weights.dtype, device=weights.device
+                    )
+                else:
+                    weights_grad = bridge.to_tensor(
+                        weights_grad, dtype=weights.dtype, device=weights.device
+                    )
 
-            # return gradients for the first two arguments and None for the others (i.e. qnn/sparse)
-            return input_grad, weights_grad, None, None
+            # return gradients for the first two arguments and None for the others
+            # (i.e. qnn/sparse/fused/worker_pool/bridge)
+            return input_grad, weights_grad, None, None, None, None, None
 
     def __init__(
         self,
         neural_network: NeuralNetwork,
         initial_weights: np.ndarray | Tensor | None = None,
         sparse: bool | None = None,
+        num_workers: int | None = None,
+        dtype: torch.dtype | None = None,
+        fused: bool = False,
     ):
         """
         Args:
@@ -272,10 +425,29 @@ class TorchConnector(Module):
                 to None, then the setting from the given neural network is used. Note that sparse
                 output is only returned if the underlying neural network also returns sparse output,
                 otherwise an error will be raised.
+            num_workers: The number of worker processes to evaluate the neural network in. If
+                set, every batch is split into shards that are evaluated in parallel by the worker
+                processes, each holding its own copy of the neural network, including its
+                primitives. The copies are pickled when the worker processes are spawned on the
+                first forward pass, so the neural network must be picklable and later changes of
+                it are not seen by the workers. The worker processes are shut down by
+                :meth:`shutdown` or once the connector is garbage collected. If ``None``, the
+                neural network is evaluated in this process.
+            dtype: The type of the weights, the output and the gradients. If ``None``, the default
+                type of PyTorch is used, usually ``torch.float``. With ``torch.double``, the
+                output and gradients of the neural network are not converted, thus, they are
+                passed to PyTorch without copying them.
+            fused: Whether to evaluate the backward pass of the neural network together with the
+                forward pass when autograd records the forward pass, so the gradients are ready
+                when the backward pass is called. This saves a round trip to the primitives per
+                training step, but the gradients are evaluated even if the
+                backward pass is never called, e.g. for inference without
+                :func:`torch.no_grad`. Default ``False``, the gradients are evaluated in the
+                backward pass.
 
         Raises:
             QiskitMachineLearningError: If the connector is configured as sparse and the underlying
-                network is not sparse.
+                network is not sparse, or if the number of worker processes is not positive.
         """
         super().__init__()
         self._neural_network = neural_network
@@ -290,7 +462,21 @@ class TorchConnector(Module):
                 "TorchConnector configured as sparse, the network must be sparse as well"
             )
 
-        weight_param = torch.nn.Parameter(torch.zeros(neural_network.num_weights))
+        if num_workers is not None and num_workers < 1:
+            raise QiskitMachineLearningError(
+                f"Number of workers must be positive, got {num_workers}."
+            )
+        self._num_workers = num_workers
+        self._fused = fused
+        # started on the first forward pass
+        self._worker_pool: _WorkerPool | None = None
+
+        if dtype is None:
+            dtype = torch.get_default_dtype()
+        # converts between tensors and arrays in both passes
+        self._bridge = _TensorBridge(dtype)
+
+        weight_param = torch.nn.Parameter(torch.zeros(neural_network.num_weights, dtype=dtype))
         # Register param. in graph following PyTorch naming convention
         self.register_parameter("weight", weight_param)
         # If `weight_param` is assigned to `self._weights` after registration,
@@ -303,7 +489,7 @@ class TorchConnector(Module):
         if initial_weights is None:
             self._weights.data.uniform_(-1, 1)
         else:
-            self._weights.data = torch.tensor(initial_weights, dtype=torch.float)
+            self._weights.data = torch.tensor(initial_weights, dtype=dtype)
 
     @property
     def neural_network(self) -> NeuralNetwork:
@@ -320,6 +506,44 @@ class TorchConnector(Module):
         """Returns whether this connector returns sparse output or not."""
         return self._sparse
 
+    @property
+    def num_workers(self) -> int | None:
+        """Returns the number of worker processes the neural network is evaluated in."""
+        return self._num_workers
+
+    @property
+    def fused(self) -> bool:
+        """Returns whether the backward pass is submitted together with the forward pass."""
+        return self._fused
+
+    @property
+    def dtype(self) -> torch.dtype:
+        """Returns the type of the weights, the output and the gradients."""
+        return self._bridge.dtype
+
+    @property
+    def bytes_copied(self) -> int:
+        """Returns the number of bytes copied to convert between tensors and arrays in the forward
+        and backward passes since the connector was created or
+        :meth:`reset_bytes_copied` was called."""
+        return self._bridge.bytes_copied
+
+    def reset_bytes_copied(self) -> None:
+        """Resets the number of bytes copied, e.g. at the beginning of a training step."""
+        self._bridge.bytes_copied = 0
+
+    def shutdown(self) -> None:
+        """Shuts the worker processes down. They are started again on the next forward pass."""
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # worker processes are not copied, a copy starts its own worker processes
+        state["_worker_pool"] = None
+        return state
+
     def forward(self, input_data: Tensor | None = None) -> Tensor:
         """Forward pass.
 
@@ -330,6 +554,16 @@ class TorchConnector(Module):
             Result of forward pass of this model.
         """
         input_ = input_data if input_data is not None else torch.zeros(0)
+        if self._num_workers is not None and self._worker_pool is None:
+            self._worker_pool = _WorkerPool(self._neural_network, self._num_workers)
+        # when requested and autograd records the computation, the gradients are evaluated
+        # together with the forward pass, since they are likely needed in the backward pass
         return TorchConnector._TorchNNFunction.apply(
-            input_, self._weights, self._neural_network, self._sparse
+            input_,
+            self._weights,
+            self._neural_network,
+            self._sparse,
+            self._fused and torch.is_grad_enabled(),
+            self._worker_pool,
+            self._bridge,
         )
@@ -43,8 +43,11 @@ Quantum Kernels
    :nosignatures:
 
    BaseKernel
+   FidelityCache
    FidelityQuantumKernel
    FidelityStatevectorKernel
+   NystromQuantumKernel
+   StatevectorCache
    TrainableKernel
    TrainableFidelityQuantumKernel
    TrainableFidelityStatevectorKernel
@@ -59,16 +62,22 @@ Submodules
 """
 
 from .base_kernel import BaseKernel
+from .fidelity_cache import FidelityCache
 from .fidelity_quantum_kernel import FidelityQuantumKernel
 from .fidelity_statevector_kernel import FidelityStatevectorKernel
+from .nystrom_quantum_kernel import NystromQuantumKernel
+from .statevector_cache import StatevectorCache
 from .trainable_kernel import TrainableKernel
 from .trainable_fidelity_quantum_kernel import TrainableFidelityQuantumKernel
 from .trainable_fidelity_statevector_kernel import TrainableFidelityStatevectorKernel
 
 __all__ = [
     "BaseKernel",
+    "FidelityCache",
     "FidelityQuantumKernel",
     "FidelityStatevectorKernel",
+    "NystromQuantumKernel",
+    "StatevectorCache",
     "TrainableKernel",
     "TrainableFidelityQuantumKernel",
     "TrainableFidelityStatevectorKernel",
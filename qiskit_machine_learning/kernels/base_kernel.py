@@ -14,9 +14,15 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 from abc import abstractmethod, ABC
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
 
 import numpy as np
+from scipy.sparse.linalg import ArpackNoConvergence, eigsh
 from qiskit import QuantumCircuit
 from qiskit.circuit.library import ZZFeatureMap
 
@@ -42,7 +48,15 @@ class BaseKernel(ABC):
     algorithms such as support vector classification, spectral clustering or ridge regression.
     """
 
-    def __init__(self, *, feature_map: QuantumCircuit = None, enforce_psd: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        feature_map: QuantumCircuit = None,
+        enforce_psd: bool = True,
+        block_size: int | None = None,
+        n_jobs: int | None = None,
+        psd_method: str = "eigh",
+    ) -> None:
         """
         Args:
             feature_map: Parameterized circuit to be used as the feature map. If ``None`` is given,
@@ -52,13 +66,54 @@ class BaseKernel(ABC):
                 number of features.
             enforce_psd: Project to closest positive semidefinite matrix if ``x = y``.
                 Default ``True``.
+            block_size: If set, the kernel matrix is evaluated in tiles of at most
+                ``block_size x block_size`` entries, so that the memory required by the
+                evaluation is bounded by the tile size rather than by the size of the kernel
+                matrix. When ``None`` the whole matrix is evaluated at once. Default ``None``.
+            n_jobs: The number of worker processes used to evaluate the kernel matrix. ``None``
+                or ``1`` means the kernel is evaluated in the current process, ``-1`` means
+                that all available cores are used. Default ``None``.
+            psd_method: Defines a strategy how the kernel matrix is projected to a positive
+                semidefinite matrix if ``enforce_psd`` is ``True``. Possible values are:
+
+                    - ``eigh`` computes the full spectrum of the matrix with a symmetric
+                      eigensolver and clips the negative eigenvalues to zero. This is the closest
+                      positive semidefinite matrix. This is the default value.
+                    - ``cholesky`` attempts a Cholesky factorization of the matrix and, if it
+                      fails, of the matrix with an increasing jitter added to the diagonal. The
+                      first matrix that can be factorized is returned. If the jitter required is
+                      too large, ``eigh`` is used instead. This is cheap for matrices that are
+                      (almost) positive definite.
+                    - ``lanczos`` computes only the smallest eigenvalues and the corresponding
+                      eigenvectors with a Lanczos solver and removes the negative part of the
+                      spectrum. This is cheap for large matrices with few negative eigenvalues
+                      and gives the same result as ``eigh``.
+
+        Raises:
+            ValueError: When a non-positive block size, zero jobs or an unsupported value of
+                ``psd_method`` is passed.
         """
         if feature_map is None:
             feature_map = ZZFeatureMap(2)
 
+        if block_size is not None and block_size < 1:
+            raise ValueError(f"Block size must be a positive integer, got {block_size}.")
+
+        if n_jobs == 0:
+            raise ValueError("The number of jobs must be a non-zero integer.")
+
+        method = psd_method.lower()
+        if method not in ("eigh", "cholesky", "lanczos"):
+            raise ValueError(f"Unsupported value passed as psd_method: {psd_method}")
+
         self._num_features = feature_map.num_parameters
         self._feature_map = feature_map
         self._enforce_psd = enforce_psd
+        self._block_size = block_size
+        self._n_jobs = n_jobs
+        self._psd_method = method
+        # the worker processes shared by the tiles of a kernel matrix, see _worker_pool
+        self._executor: ProcessPoolExecutor | None = None
 
     @abstractmethod
     def evaluate(self, x_vec: np.ndarray, y_vec: np.ndarray | None = None) -> np.ndarray:
@@ -78,6 +133,57 @@ class BaseKernel(ABC):
         """
         raise NotImplementedError()
 
+    def extend(
+        self,
+        kernel_matrix: np.ndarray,
+        x_old: np.ndarray,
+        x_new: np.ndarray,
+        enforce_psd: bool = False,
+    ) -> np.ndarray:
+        r"""
+        Extends the symmetric kernel matrix of ``x_old`` to the kernel matrix of ``x_old`` and
+        ``x_new`` stacked together. Only the new rows and columns are evaluated, i.e.
+        :math:`N_{new} (N_{old} + N_{new})` entries instead of :math:`(N_{old} + N_{new})^2`.
+
+        Args:
+            kernel_matrix: Symmetric 2D matrix, :math:`N_{old} \times N_{old}`, of ``x_old``.
+            x_old: 1D or 2D array of the datapoints ``kernel_matrix`` was evaluated for,
+                :math:`N_{old} \times D`, where D is the feature dimension.
+            x_new: 1D or 2D array of new datapoints, :math:`N_{new} \times D`.
+            enforce_psd: Project the extended matrix to the closest positive semidefinite
+                matrix. Default ``False``.
+
+        Returns:
+            2D matrix, :math:`(N_{old} + N_{new}) \times (N_{old} + N_{new})`.
+
+        Raises:
+            ValueError: When the shape of ``kernel_matrix`` does not match ``x_old``.
+        """
+        x_old, x_new = self._validate_input(x_old, x_new)
+        kernel_matrix = np.asarray(kernel_matrix)
+
+        num_old = x_old.shape[0]
+        if kernel_matrix.shape != (num_old, num_old):
+            raise ValueError(
+                f"The kernel matrix of shape {kernel_matrix.shape} does not match the "
+                f"{num_old} datapoints in x_old."
+            )
+
+        num_total = num_old + x_new.shape[0]
+        extended_matrix = np.empty((num_total, num_total))
+        extended_matrix[:num_old, :num_old] = kernel_matrix
+
+        with self._worker_pool():
+            new_rows = self._evaluate_kernel_matrix(x_new, x_old, False)
+            extended_matrix[num_old:, :num_old] = new_rows
+            extended_matrix[:num_old, num_old:] = new_rows.T
+            extended_matrix[num_old:, num_old:] = self._evaluate_kernel_matrix(x_new, x_new, True)
+
+        if enforce_psd:
+            extended_matrix = self._make_psd(extended_matrix)
+
+        return extended_matrix
+
     @property
     def feature_map(self) -> QuantumCircuit:
         """Returns the feature map of this kernel."""
@@ -96,6 +202,26 @@ class BaseKernel(ABC):
         """
         return self._enforce_psd
 
+    @property
+    def psd_method(self) -> str:
+        """
+        Returns the strategy used to project the kernel matrix to a positive semidefinite matrix.
+        """
+        return self._psd_method
+
+    @property
+    def block_size(self) -> int | None:
+        """
+        Returns the maximum number of rows and columns of a tile the kernel matrix is evaluated in,
+        or ``None`` if the whole matrix is evaluated at once.
+        """
+        return self._block_size
+
+    @property
+    def n_jobs(self) -> int | None:
+        """Returns the number of worker processes used to evaluate the kernel matrix."""
+        return self._n_jobs
+
     def _validate_input(
         self, x_vec: np.ndarray, y_vec: np.ndarray | None
     ) -> tuple[np.ndarray, np.ndarray | None]:
@@ -136,11 +262,139 @@ class BaseKernel(ABC):
 
         return x_vec, y_vec
 
+    def _evaluate_kernel_matrix(
+        self, x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool
+    ) -> np.ndarray:
+        """
+        Evaluates the kernel matrix of validated datapoints without any post-processing, such as
+        the projection to a positive semi-definite matrix. Kernels should override this method,
+        by default the kernel matrix is evaluated by :meth:`evaluate`, including any
+        post-processing of the kernel.
+
+        Args:
+            x_vec: 2D array of datapoints, NxD.
+            y_vec: 2D array of datapoints, MxD.
+            is_symmetric: whether the self inner product of ``x_vec`` is computed.
+
+        Returns:
+            2D matrix, NxM
+        """
+        return self.evaluate(x_vec, None if is_symmetric else y_vec)
+
+    def _evaluate_in_blocks(
+        self,
+        x_vec: np.ndarray,
+        y_vec: np.ndarray,
+        is_symmetric: bool,
+        evaluate_block: Callable[[np.ndarray, np.ndarray, bool], Any],
+        parallel: bool = False,
+        collect: Callable[[Any], np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """
+        Evaluates the kernel matrix tile by tile and writes the tiles into a preallocated matrix.
+        In the symmetric case only the tiles on and above the diagonal are evaluated, the tiles
+        below the diagonal are mirrored.
+
+        Args:
+            x_vec: 2D array of datapoints, NxD.
+            y_vec: 2D array of datapoints, MxD.
+            is_symmetric: whether the self inner product of ``x_vec`` is computed.
+            evaluate_block: a callable that evaluates a tile of the kernel matrix given the row
+                and column datapoints of the tile and whether the tile is on the diagonal of a
+                symmetric kernel matrix.
+            parallel: whether the tiles are distributed across the worker processes. If so,
+                ``evaluate_block`` must be picklable.
+            collect: an optional callable applied in the current process to the result of
+                ``evaluate_block`` that returns the tile, e.g. to merge state computed in the
+                worker processes.
+
+        Returns:
+            2D matrix, NxM
+        """
+        if collect is None:
+            collect = _identity
+
+        if self._block_size is None:
+            return collect(evaluate_block(x_vec, y_vec, is_symmetric))
+
+        block_size = self._block_size
+        blocks = []
+        for row in range(0, x_vec.shape[0], block_size):
+            for col in range(row if is_symmetric else 0, y_vec.shape[0], block_size):
+                blocks.append((slice(row, row + block_size), slice(col, col + block_size)))
+
+        x_blocks = [x_vec[row_slice] for row_slice, _ in blocks]
+        y_blocks = [y_vec[col_slice] for _, col_slice in blocks]
+        is_diagonal = [is_symmetric and row_slice == col_slice for row_slice, col_slice in blocks]
+        if parallel:
+            results: Iterable[Any] = self._map(evaluate_block, x_blocks, y_blocks, is_diagonal)
+        else:
+            # evaluate lazily, so only a single tile is held in memory at a time
+            results = map(evaluate_block, x_blocks, y_blocks, is_diagonal)
+
+        kernel_matrix = np.empty((x_vec.shape[0], y_vec.shape[0]))
+        for (row_slice, col_slice), block in zip(blocks, map(collect, results)):
+            kernel_matrix[row_slice, col_slice] = block
+            if is_symmetric and row_slice != col_slice:
+                kernel_matrix[col_slice, row_slice] = block.T
+
+        return kernel_matrix
+
+    def _map(self, function: Callable, *iterables: Iterable) -> Iterator[Any]:
+        """
+        Applies a function to the items of the iterables, in order. If more than one job is
+        requested, the items are distributed across a pool of worker processes, so the function
+        and the items must be picklable. Otherwise, the items are evaluated lazily while the
+        results are consumed. The results do not depend on the number of workers.
+        """
+        num_workers = self._num_workers()
+        if num_workers == 1:
+            return map(function, *iterables)
+
+        items = [list(iterable) for iterable in iterables]
+        chunksize = max(1, len(items[0]) // (4 * num_workers))
+        if self._executor is not None:
+            return self._executor.map(function, *items, chunksize=chunksize)
+
+        with _spawn_executor(num_workers) as executor:
+            return iter(list(executor.map(function, *items, chunksize=chunksize)))
+
+    @contextmanager
+    def _worker_pool(self) -> Iterator[None]:
+        """
+        Starts the worker processes requested by ``n_jobs``, if more than one, that are shared by
+        all calls to :meth:`_map` within the context, e.g. by all tiles of a kernel matrix. The
+        worker processes are spawned rather than forked, since the primitives may run threads.
+        """
+        if self._executor is not None or self._num_workers() == 1:
+            yield
+            return
+
+        self._executor = _spawn_executor(self._num_workers())
+        try:
+            yield
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _num_workers(self) -> int:
+        """Returns the number of worker processes requested by ``n_jobs``."""
+        if self._n_jobs == -1:
+            return os.cpu_count() or 1
+        return max(1, self._n_jobs or 1)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # worker processes are not copied, e.g. to the worker processes themselves
+        state["_executor"] = None
+        return state
+
     def _make_psd(self, kernel_matrix: np.ndarray) -> np.ndarray:
         r"""
         Find the closest positive semi-definite approximation to a symmetric kernel matrix.
         The (symmetric) matrix should always be positive semi-definite by construction,
-        but this can be violated in case of noise, such as sampling noise.
+        but this can be violated in case of noise, such as sampling noise. The approximation
+        is computed by the strategy defined by ``psd_method``.
 
         Args:
             kernel_matrix: Symmetric 2D array of the kernel entries.
@@ -148,6 +402,65 @@ class BaseKernel(ABC):
         Returns:
             The closest positive semi-definite matrix.
         """
-        w, v = np.linalg.eig(kernel_matrix)
-        m = v @ np.diag(np.maximum(0, w)) @ v.transpose()
-        return m.real
+        # remove any asymmetry due to noise or rounding errors
+        kernel_matrix = 0.5 * (kernel_matrix + kernel_matrix.T).real
+
+        if self._psd_method == "cholesky":
+            return self._make_psd_cholesky(kernel_matrix)
+        if self._psd_method == "lanczos":
+            return self._make_psd_lanczos(kernel_matrix)
+        return self._make_psd_eigh(kernel_matrix)
+
+    @staticmethod
+    def _make_psd_eigh(kernel_matrix: np.ndarray) -> np.ndarray:
+        w, v = np.linalg.eigh(kernel_matrix)
+        # scale the columns instead of multiplying by a dense diagonal matrix
+        return (v * np.maximum(0, w)) @ v.T
+
+    def _make_psd_cholesky(
+        self, kernel_matrix: np.ndarray, max_jitter: float = 1e-2, num_attempts: int = 9
+    ) -> np.ndarray:
+        scale = max(float(np.mean(np.diag(kernel_matrix))), np.finfo(float).eps)
+        # the first attempt is without any jitter, then it grows by an order of magnitude per
+        # attempt up to max_jitter
+        jitters = [0.0] + list(max_jitter * 10.0 ** np.arange(1 - num_attempts, 1))
+
+        diagonal = np.diag_indices_from(kernel_matrix)
+        candidate = kernel_matrix.copy()
+        for jitter in jitters:
+            candidate[diagonal] = kernel_matrix[diagonal] + jitter * scale
+            try:
+                np.linalg.cholesky(candidate)
+            except np.linalg.LinAlgError:
+                continue
+            return candidate
+
+        return self._make_psd_eigh(kernel_matrix)
+
+    def _make_psd_lanczos(self, kernel_matrix: np.ndarray, num_eigenvalues: int = 6) -> np.ndarray:
+        size = kernel_matrix.shape[0]
+        while 2 * num_eigenvalues < size:
+            try:
+                w, v = eigsh(kernel_matrix, k=num_eigenvalues, which="SA")
+            except ArpackNoConvergence:
+                break
+            if w.max() >= 0:
+                # all negative eigenvalues found, subtract the negative part of the spectrum
+                negative = w < 0
+                return kernel_matrix - (v[:, negative] * w[negative]) @ v[:, negative].T
+            num_eigenvalues *= 2
+
+        # small matrices or too many negative eigenvalues, the full spectrum is cheaper
+        return self._make_psd_eigh(kernel_matrix)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _spawn_executor(num_workers: int) -> ProcessPoolExecutor:
+    """Returns a pool of spawned worker processes, since forking a process that runs threads,
+    e.g. of the primitives, may deadlock the workers."""
+    return ProcessPoolExecutor(
+        max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")
+    )
@@ -0,0 +1,211 @@
+# This code is part of a Qiskit project.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Fidelity Cache"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from .statevector_cache import _circuit_fingerprint
+
+# size of a fidelity value in bytes
+_VALUE_SIZE = np.dtype(float).itemsize
+
+
+class FidelityCache:
+    r"""
+    A cache of fidelities between pairs of samples used by
+    :class:`~qiskit_machine_learning.kernels.FidelityQuantumKernel`.
+
+    The kernel looks up the fidelities of all pairs of samples in the cache before submitting
+    circuits to the fidelity primitive, so only the fidelities missing from the cache are
+    evaluated. This saves evaluations when the same samples are passed to the kernel more than
+    once, e.g. during cross-validation, grid search or repeated predictions.
+
+    Entries are keyed by hashes of the feature map and of both feature vectors, rounded to
+    ``decimals`` decimals, see :meth:`keys`. Since the fidelity is symmetric, the key of a pair
+    does not depend on the order of the samples. The cache may be shared between kernels with
+    different feature maps.
+
+    Once ``max_entries`` entries or ``max_bytes`` bytes are exceeded, the least recently used
+    entries are evicted. The number of bytes is estimated from the sizes of keys and values. The
+    number of hits, misses and evictions of the cache is recorded.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        decimals: int = 12,
+    ) -> None:
+        """
+        Args:
+            max_entries: Maximum number of fidelities kept in the cache. When ``None`` this is
+                unbounded.
+            max_bytes: Maximum number of bytes used by the entries of the cache. When ``None``
+                this is unbounded.
+            decimals: The number of decimals the feature vectors are rounded to when computing
+                the keys of the cache.
+
+        Raises:
+            ValueError: When a negative maximum number of entries or bytes is passed.
+        """
+        if max_entries is not None and max_entries < 0:
+            raise ValueError(f"Maximum number of entries must be non-negative, got {max_entries}.")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"Maximum number of bytes must be non-negative, got {max_bytes}.")
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._decimals = decimals
+        self._entries: OrderedDict[bytes, float] = OrderedDict()
+        self._nbytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def keys(
+        self,
+        feature_map: QuantumCircuit,
+        left_parameters: np.ndarray,
+        right_parameters: np.ndarray,
+    ) -> list[bytes]:
+        """
+        Computes the keys of the fidelities between pairs of samples.
+
+        Args:
+            feature_map: The feature map the fidelities are evaluated with.
+            left_parameters: 2D array of the values assigned to the parameters of the left
+                feature map, one row per pair.
+            right_parameters: 2D array of the values assigned to the parameters of the right
+                feature map, one row per pair.
+
+        Returns:
+            A list of digests identifying the pairs.
+        """
+        circuit_digest = hashlib.sha256(_circuit_fingerprint(feature_map))
+        # adding zero turns negative zeros into positive zeros
+        left_values = np.round(np.asarray(left_parameters, dtype=float), self._decimals) + 0.0
+        right_values = np.round(np.asarray(right_parameters, dtype=float), self._decimals) + 0.0
+
+        # the same samples appear in many pairs, hence each distinct sample is hashed only once
+        sample_digests: dict[bytes, bytes] = {}
+
+        def sample_digest(values: np.ndarray) -> bytes:
+            data = values.tobytes()
+            digest = sample_digests.get(data)
+            if digest is None:
+                hash_object = circuit_digest.copy()
+                hash_object.update(data)
+                digest = sample_digests[data] = hash_object.digest()
+            return digest
+
+        keys = []
+        for left, right in zip(left_values, right_values):
+            left_digest, right_digest = sample_digest(left), sample_digest(right)
+            if left_digest > right_digest:
+                left_digest, right_digest = right_digest, left_digest
+            keys.append(left_digest + right_digest)
+        return keys
+
+    def get(self, key: bytes) -> float | None:
+        """
+        Looks up a fidelity.
+
+        Args:
+            key: The key of the pair of samples.
+
+        Returns:
+            The fidelity or ``None`` if it is not in the cache.
+        """
+        fidelity = self._entries.get(key)
+        if fidelity is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return fidelity
+
+    def put(self, key: bytes, fidelity: float) -> None:
+        """
+        Adds a fidelity to the cache and evicts the least recently used entries if the cache
+        exceeds its limits.
+
+        Args:
+            key: The key of the pair of samples.
+            fidelity: The fidelity to cache.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            self._nbytes += len(key) + _VALUE_SIZE
+        self._entries[key] = float(fidelity)
+
+        while self._entries and self._exceeds_limits():
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._nbytes -= len(evicted_key) + _VALUE_SIZE
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Clears the cache and resets the counters."""
+        self._entries.clear()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _exceeds_limits(self) -> bool:
+        if self._max_entries is not None and len(self._entries) > self._max_entries:
+            return True
+        return self._max_bytes is not None and self._nbytes > self._max_bytes
+
+    @property
+    def max_entries(self) -> int | None:
+        """Returns the maximum number of fidelities kept in the cache."""
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Returns the maximum number of bytes used by the entries of the cache."""
+        return self._max_bytes
+
+    @property
+    def size(self) -> int:
+        """Returns the number of fidelities in the cache."""
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the estimated number of bytes used by the entries of the cache."""
+        return self._nbytes
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of fidelities found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of fidelities not found in the cache."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Returns the number of fidelities evicted from the cache."""
+        return self._evictions
@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import List, Tuple
+from typing import Tuple
 
 import numpy as np
 from qiskit import QuantumCircuit
@@ -22,8 +22,9 @@ from qiskit.primitives import Sampler
 from qiskit_algorithms.state_fidelities import BaseStateFidelity, ComputeUncompute
 
 from .base_kernel import BaseKernel
+from .fidelity_cache import FidelityCache
 
-KernelIndices = List[Tuple[int, int]]
+KernelIndices = Tuple[np.ndarray, np.ndarray]
 
 
 class FidelityQuantumKernel(BaseKernel):
@@ -46,6 +47,10 @@ class FidelityQuantumKernel(BaseKernel):
         fidelity: BaseStateFidelity | None = None,
         enforce_psd: bool = True,
         evaluate_duplicates: str = "off_diagonal",
+        block_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: FidelityCache | None = None,
+        psd_method: str = "eigh",
     ) -> None:
         """
         Args:
@@ -73,10 +78,34 @@ class FidelityQuantumKernel(BaseKernel):
                     - ``none`` when training the diagonal is set to `1` and if two identical samples
                       are found in the dataset the corresponding matrix element is set to `1`.
                       When inferring, matrix elements for identical samples are set to `1`.
+            block_size: If set, the kernel matrix is evaluated in tiles of at most
+                ``block_size x block_size`` entries. Each tile is evaluated separately, thus
+                bounding the memory required by the evaluation. When ``None`` the whole matrix is
+                evaluated at once. Default ``None``.
+            n_jobs: The number of worker processes the tiles of the kernel matrix are distributed
+                across, ``-1`` means that all available cores are used. Each tile is evaluated
+                by a separate fidelity job, hence ``block_size`` must be set to benefit from
+                multiple processes. The fidelity instance must be picklable. Default ``None``,
+                the kernel is evaluated in the current process.
+            cache: An optional :class:`~qiskit_machine_learning.kernels.FidelityCache` that is
+                consulted before fidelities are evaluated, so only the fidelities missing from the
+                cache are submitted to the fidelity instance. A cache may be shared between
+                kernels. Fidelities evaluated in worker processes, see ``n_jobs``, are added to
+                the cache of the current process. Default ``None``, no cache is used.
+            psd_method: Defines a strategy how the kernel matrix is projected to a positive
+                semidefinite matrix if ``enforce_psd`` is ``True``. Possible values are ``eigh``,
+                ``cholesky`` and ``lanczos``, see
+                :class:`~qiskit_machine_learning.kernels.BaseKernel` for details. Default ``eigh``.
         Raises:
             ValueError: When unsupported value is passed to `evaluate_duplicates`.
         """
-        super().__init__(feature_map=feature_map, enforce_psd=enforce_psd)
+        super().__init__(
+            feature_map=feature_map,
+            enforce_psd=enforce_psd,
+            block_size=block_size,
+            n_jobs=n_jobs,
+            psd_method=psd_method,
+        )
 
         eval_duplicates = evaluate_duplicates.lower()
         if eval_duplicates not in ("all", "off_diagonal", "none"):
@@ -88,6 +117,9 @@ class FidelityQuantumKernel(BaseKernel):
         if fidelity is None:
             fidelity = ComputeUncompute(sampler=Sampler())
         self._fidelity = fidelity
+        self._cache = cache
+        # the fidelities added to the cache of a worker process while a tile is evaluated
+        self._cache_updates: list[tuple[bytes, float]] | None = None
 
     def evaluate(self, x_vec: np.ndarray, y_vec: np.ndarray | None = None) -> np.ndarray:
         x_vec, y_vec = self._validate_input(x_vec, y_vec)
@@ -99,6 +131,56 @@ class FidelityQuantumKernel(BaseKernel):
         elif not np.array_equal(x_vec, y_vec):
             is_symmetric = False
 
+        with self._worker_pool():
+            kernel_matrix = self._evaluate_kernel_matrix(x_vec, y_vec, is_symmetric)
+
+        if is_symmetric and self._enforce_psd:
+            kernel_matrix = self._make_psd(kernel_matrix)
+
+        return kernel_matrix
+
+    def _evaluate_kernel_matrix(
+        self, x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool
+    ) -> np.ndarray:
+        if self._cache is None or self._block_size is None or self._num_workers() == 1:
+            return self._evaluate_in_blocks(
+                x_vec, y_vec, is_symmetric, self._evaluate, parallel=True
+            )
+        # the tiles are evaluated by copies of the kernel, hence their caches are merged back
+        return self._evaluate_in_blocks(
+            x_vec,
+            y_vec,
+            is_symmetric,
+            self._evaluate_in_worker,
+            parallel=True,
+            collect=self._merge_cache_updates,
+        )
+
+    def _evaluate_in_worker(
+        self, x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool
+    ) -> tuple[np.ndarray, list[tuple[bytes, float]]]:
+        """
+        Evaluates a tile in a worker process and returns the tile together with the fidelities
+        added to the copy of the cache in the worker process.
+        """
+        cache_updates: list[tuple[bytes, float]] = []
+        self._cache_updates = cache_updates
+        try:
+            kernel_matrix = self._evaluate(x_vec, y_vec, is_symmetric)
+        finally:
+            self._cache_updates = None
+        return kernel_matrix, cache_updates
+
+    def _merge_cache_updates(
+        self, result: tuple[np.ndarray, list[tuple[bytes, float]]]
+    ) -> np.ndarray:
+        """Adds the fidelities evaluated in a worker process to the cache and returns the tile."""
+        kernel_matrix, cache_updates = result
+        for key, fidelity in cache_updates:
+            self._cache.put(key, fidelity)
+        return kernel_matrix
+
+    def _evaluate(self, x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool) -> np.ndarray:
         kernel_shape = (x_vec.shape[0], y_vec.shape[0])
 
         if is_symmetric:
@@ -112,9 +194,6 @@ class FidelityQuantumKernel(BaseKernel):
                 kernel_shape, left_parameters, right_parameters, indices
             )
 
-        if is_symmetric and self._enforce_psd:
-            kernel_matrix = self._make_psd(kernel_matrix)
-
         return kernel_matrix
 
     def _get_parameterization(
@@ -123,21 +202,13 @@ class FidelityQuantumKernel(BaseKernel):
         """
         Combines x_vec and y_vec to get all the combinations needed to evaluate the kernel entries.
         """
-        num_features = x_vec.shape[1]
-        left_parameters = np.zeros((0, num_features))
-        right_parameters = np.zeros((0, num_features))
-
-        indices = []
-        for i, x_i in enumerate(x_vec):
-            for j, y_j in enumerate(y_vec):
-                if self._is_trivial(i, j, x_i, y_j, False):
-                    continue
+        rows = np.repeat(np.arange(x_vec.shape[0]), y_vec.shape[0])
+        cols = np.tile(np.arange(y_vec.shape[0]), x_vec.shape[0])
 
-                left_parameters = np.vstack((left_parameters, x_i))
-                right_parameters = np.vstack((right_parameters, y_j))
-                indices.append((i, j))
+        mask = self._get_non_trivial_mask(rows, cols, x_vec, y_vec, False)
+        rows, cols = rows[mask], cols[mask]
 
-        return left_parameters, right_parameters, indices
+        return x_vec[rows], y_vec[cols], (rows, cols)
 
     def _get_symmetric_parameterization(
         self, x_vec: np.ndarray
@@ -145,21 +216,12 @@ class FidelityQuantumKernel(BaseKernel):
         """
         Combines two copies of x_vec to get all the combinations needed to evaluate the kernel entries.
         """
-        num_features = x_vec.shape[1]
-        left_parameters = np.zeros((0, num_features))
-        right_parameters = np.zeros((0, num_features))
+        rows, cols = np.triu_indices(x_vec.shape[0])
 
-        indices = []
-        for i, x_i in enumerate(x_vec):
-            for j, x_j in enumerate(x_vec[i:]):
-                if self._is_trivial(i, i + j, x_i, x_j, True):
-                    continue
+        mask = self._get_non_trivial_mask(rows, cols, x_vec, x_vec, True)
+        rows, cols = rows[mask], cols[mask]
 
-                left_parameters = np.vstack((left_parameters, x_i))
-                right_parameters = np.vstack((right_parameters, x_j))
-                indices.append((i, i + j))
-
-        return left_parameters, right_parameters, indices
+        return x_vec[rows], x_vec[cols], (rows, cols)
 
     def _get_kernel_matrix(
         self,
@@ -169,15 +231,14 @@ class FidelityQuantumKernel(BaseKernel):
         indices: KernelIndices,
     ) -> np.ndarray:
         """
-        Given a parameterization, this computes the symmetric kernel matrix.
+        Given a parameterization, this computes the kernel matrix.
         """
         kernel_entries = self._get_kernel_entries(left_parameters, right_parameters)
 
         # fill in trivial entries and then update with fidelity values
         kernel_matrix = np.ones(kernel_shape)
-
-        for i, (col, row) in enumerate(indices):
-            kernel_matrix[col, row] = kernel_entries[i]
+        rows, cols = indices
+        kernel_matrix[rows, cols] = kernel_entries
 
         return kernel_matrix
 
@@ -189,14 +250,13 @@ class FidelityQuantumKernel(BaseKernel):
         indices: KernelIndices,
     ) -> np.ndarray:
         """
-        Given a set of parameterization, this computes the kernel matrix.
+        Given a set of parameterization, this computes the symmetric kernel matrix.
         """
         kernel_entries = self._get_kernel_entries(left_parameters, right_parameters)
         kernel_matrix = np.ones(kernel_shape)
-
-        for i, (col, row) in enumerate(indices):
-            kernel_matrix[col, row] = kernel_entries[i]
-            kernel_matrix[row, col] = kernel_entries[i]
+        rows, cols = indices
+        kernel_matrix[rows, cols] = kernel_entries
+        kernel_matrix[cols, rows] = kernel_entries
 
         return kernel_matrix
 
@@ -204,59 +264,97 @@ class FidelityQuantumKernel(BaseKernel):
         self, left_parameters: np.ndarray, right_parameters: np.ndarray
     ) -> Sequence[float]:
         """
-        Gets kernel entries by executing the underlying fidelity instance and getting the results
-        back from the async job.
+        Gets kernel entries from the cache, if any, and by executing the underlying fidelity
+        instance for the entries missing from the cache.
         """
         num_circuits = left_parameters.shape[0]
-        if num_circuits != 0:
-            job = self._fidelity.run(
-                [self._feature_map] * num_circuits,
-                [self._feature_map] * num_circuits,
-                left_parameters,
-                right_parameters,
-            )
-            kernel_entries = job.result().fidelities
-        else:
+        if num_circuits == 0:
             # trivial case, only identical samples
-            kernel_entries = []
+            return []
+
+        if self._cache is None:
+            return self._run_fidelity(left_parameters, right_parameters)
+
+        keys = self._cache.keys(self._feature_map, left_parameters, right_parameters)
+        kernel_entries = np.empty(num_circuits)
+        missing = []
+        for i, key in enumerate(keys):
+            fidelity = self._cache.get(key)
+            if fidelity is None:
+                missing.append(i)
+            else:
+                kernel_entries[i] = fidelity
+
+        if missing:
+            fidelities = self._run_fidelity(left_parameters[missing], right_parameters[missing])
+            kernel_entries[missing] = fidelities
+            for i, fidelity in zip(missing, fidelities):
+                self._cache.put(keys[i], fidelity)
+                if self._cache_updates is not None:
+                    self._cache_updates.append((keys[i], fidelity))
+
         return kernel_entries
 
-    def _is_trivial(
-        self, i: int, j: int, x_i: np.ndarray, y_j: np.ndarray, symmetric: bool
-    ) -> bool:
+    def _run_fidelity(
+        self, left_parameters: np.ndarray, right_parameters: np.ndarray
+    ) -> Sequence[float]:
         """
-        Verifies if the kernel entry is trivial (to be set to `1.0`) or not.
+        Executes the underlying fidelity instance and gets the results back from the async job.
+        """
+        num_circuits = left_parameters.shape[0]
+        job = self._fidelity.run(
+            [self._feature_map] * num_circuits,
+            [self._feature_map] * num_circuits,
+            left_parameters,
+            right_parameters,
+        )
+        return job.result().fidelities
+
+    def _get_non_trivial_mask(
+        self,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        x_vec: np.ndarray,
+        y_vec: np.ndarray,
+        symmetric: bool,
+    ) -> np.ndarray:
+        """
+        Verifies which kernel entries are non-trivial, i.e. must be evaluated. Trivial entries
+        are set to `1.0`.
 
         Args:
-            i: row index of the entry in the kernel matrix.
-            j: column index of the entry in the kernel matrix.
-            x_i: a sample from the dataset that corresponds to the row in the kernel matrix.
-            y_j: a sample from the dataset that corresponds to the column in the kernel matrix.
+            rows: row indices of the entries in the kernel matrix.
+            cols: column indices of the entries in the kernel matrix.
+            x_vec: samples from the dataset that correspond to the rows in the kernel matrix.
+            y_vec: samples from the dataset that correspond to the columns in the kernel matrix.
             symmetric: whether it is a symmetric case or not.
 
         Returns:
-            `True` if the entry is trivial, `False` otherwise.
+            A boolean mask of the same length as ``rows``, ``True`` if the entry is non-trivial.
         """
-        # if we evaluate all combinations, then it is non-trivial
+        # if we evaluate all combinations, then all entries are non-trivial
         if self._evaluate_duplicates == "all":
-            return False
+            return np.ones(rows.shape[0], dtype=bool)
 
         # if we are on the diagonal and we don't evaluate it, it is trivial
-        if symmetric and i == j and self._evaluate_duplicates == "off_diagonal":
-            return True
-
-        # if don't evaluate any duplicates
-        if np.array_equal(x_i, y_j) and self._evaluate_duplicates == "none":
-            return True
+        if self._evaluate_duplicates == "off_diagonal":
+            if symmetric:
+                return rows != cols
+            return np.ones(rows.shape[0], dtype=bool)
 
-        # otherwise evaluate
-        return False
+        # if don't evaluate any duplicates, identical samples are trivial
+        return np.any(x_vec[rows] != y_vec[cols], axis=1)
 
     @property
     def fidelity(self):
         """Returns the fidelity primitive used by this kernel."""
         return self._fidelity
 
+    @property
+    def cache(self) -> FidelityCache | None:
+        """Returns the fidelity cache used by this kernel, if any."""
+        return self._cache
+
     @property
     def evaluate_duplicates(self):
         """Returns the strategy used by this kernel to evaluate kernel matrix elements if duplicate
@@ -13,10 +13,11 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import partial
 from typing import Type, TypeVar
 
 import numpy as np
+from scipy.linalg import blas
 
 from qiskit import QuantumCircuit
 from qiskit.quantum_info import Statevector
@@ -24,6 +25,7 @@ from qiskit_algorithms.utils import algorithm_globals
 
 
 from .base_kernel import BaseKernel
+from .statevector_cache import StatevectorCache
 
 SV = TypeVar("SV", bound=Statevector)
 
@@ -44,7 +46,10 @@ class FidelityStatevectorKernel(BaseKernel):
     :class:`~qiskit.quantum_info.Statevector` object or one of its subclasses. These
     arrays are stored in a statevector cache to avoid repeated evaluation of the quantum circuit.
     This cache can be cleared using :meth:`clear_cache`. By default the cache is cleared when
-    :meth:`evaluate` is called, unless ``auto_clear_cache`` is ``False``.
+    :meth:`evaluate` is called, unless ``auto_clear_cache`` is ``False``. A
+    :class:`~qiskit_machine_learning.kernels.StatevectorCache`, e.g. with an on-disk tier, can be
+    passed to retain statevectors across kernel instances, processes and sessions. Such a cache
+    is left untouched by :meth:`evaluate`.
 
     Shot noise emulation can also be added. If ``shots`` is ``None``, the exact fidelity is used.
     Otherwise, the mean is taken of samples drawn from a binomial distribution with probability
@@ -71,6 +76,10 @@ class FidelityStatevectorKernel(BaseKernel):
         auto_clear_cache: bool = True,
         shots: int | None = None,
         enforce_psd: bool = True,
+        block_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: StatevectorCache | None = None,
+        psd_method: str = "eigh",
     ) -> None:
         """
         Args:
@@ -84,29 +93,50 @@ class FidelityStatevectorKernel(BaseKernel):
                 should inherit from (and defaults to) :class:`~qiskit.quantum_info.Statevector`.
             cache_size: Maximum size of the statevector cache. When ``None`` this is unbounded.
             auto_clear_cache: Determines whether the statevector cache is retained when
-                :meth:`evaluate` is called. The cache is automatically cleared by default.
+                :meth:`evaluate` is called. The cache is automatically cleared by default. A
+                cache passed via ``cache`` is never cleared automatically.
             shots: The number of shots. If ``None``, the exact fidelity is used. Otherwise, the
                 mean is taken of samples drawn from a binomial distribution with probability equal
                 to the exact fidelity.
             enforce_psd: Project to the closest positive semidefinite matrix if ``x = y``.
                 This is only used when number of shots given is not ``None``.
+            block_size: If set, the kernel matrix is evaluated in tiles of at most
+                ``block_size x block_size`` entries. Each tile is evaluated separately, thus
+                bounding the memory required by the evaluation. When ``None`` the whole matrix is
+                evaluated at once. Default ``None``.
+            n_jobs: The number of worker processes the statevector simulations are distributed
+                across, ``-1`` means that all available cores are used. Default ``None``, the
+                statevectors are simulated in the current process.
+            cache: The statevector cache to use. If ``None`` is given, an in-memory
+                :class:`~qiskit_machine_learning.kernels.StatevectorCache` of size ``cache_size``
+                is created. A cache may be shared between kernels, hence it is not cleared when
+                :meth:`evaluate` is called.
+            psd_method: Defines a strategy how the kernel matrix is projected to a positive
+                semidefinite matrix if ``enforce_psd`` is ``True``. Possible values are ``eigh``,
+                ``cholesky`` and ``lanczos``, see
+                :class:`~qiskit_machine_learning.kernels.BaseKernel` for details. Default ``eigh``.
         """
-        super().__init__(feature_map=feature_map)
+        super().__init__(
+            feature_map=feature_map, block_size=block_size, n_jobs=n_jobs, psd_method=psd_method
+        )
 
         self._statevector_type = statevector_type
         self._auto_clear_cache = auto_clear_cache
         self._shots = shots
         self._enforce_psd = enforce_psd
 
-        # Create the statevector cache at the instance level.
-        self._get_statevector = lru_cache(maxsize=cache_size)(self._get_statevector_)
+        # a cache passed by the user may be shared, hence it is never cleared automatically
+        self._owns_cache = cache is None
+        if cache is None:
+            cache = StatevectorCache(max_size=cache_size)
+        self._cache = cache
 
     def evaluate(
         self,
         x_vec: np.ndarray,
         y_vec: np.ndarray | None = None,
     ) -> np.ndarray:
-        if self._auto_clear_cache:
+        if self._auto_clear_cache and self._owns_cache:
             self.clear_cache()
 
         x_vec, y_vec = self._validate_input(x_vec, y_vec)
@@ -118,45 +148,122 @@ class FidelityStatevectorKernel(BaseKernel):
         elif not np.array_equal(x_vec, y_vec):
             is_symmetric = False
 
-        return self._evaluate(x_vec, y_vec, is_symmetric)
-
-    def _evaluate(self, x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool):
-        kernel_shape = (x_vec.shape[0], y_vec.shape[0])
-
-        x_svs = [self._get_statevector(tuple(x)) for x in x_vec]
-        y_svs = [self._get_statevector(tuple(y)) for y in y_vec]
-
-        kernel_matrix = np.ones(kernel_shape)
-        for i, x in enumerate(x_svs):
-            for j, y in enumerate(y_svs):
-                if np.array_equal(x, y):
-                    continue
-                kernel_matrix[i, j] = self._compute_kernel_entry(x, y)
+        with self._worker_pool():
+            kernel_matrix = self._evaluate_kernel_matrix(x_vec, y_vec, is_symmetric)
 
         if self._enforce_psd and is_symmetric and self._shots is not None:
             kernel_matrix = self._make_psd(kernel_matrix)
 
         return kernel_matrix
 
-    def _get_statevector_(self, param_values: tuple[float]) -> np.ndarray:
-        # lru_cache requires hashable function arguments.
-        qc = self._feature_map.assign_parameters(param_values)
-        return self._statevector_type(qc).data
+    def _evaluate_kernel_matrix(
+        self, x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool
+    ) -> np.ndarray:
+        return self._evaluate_in_blocks(x_vec, y_vec, is_symmetric, self._evaluate)
+
+    def _evaluate(self, x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool):
+        kernel_shape = (x_vec.shape[0], y_vec.shape[0])
+        kernel_matrix = np.ones(kernel_shape)
+
+        rows, cols = self._get_non_trivial_indices(x_vec, y_vec, is_symmetric)
+        if rows.size == 0:
+            # trivial case, only identical samples
+            return kernel_matrix
+
+        x_svs = self._get_statevectors(x_vec)
+        y_svs = x_svs if is_symmetric else self._get_statevectors(y_vec)
 
-    def _compute_kernel_entry(self, x: np.ndarray, y: np.ndarray) -> float:
-        fidelity = self._compute_fidelity(x, y)
+        kernel_entries = self._compute_fidelities(x_svs, y_svs, is_symmetric)[rows, cols]
         if self._shots is not None:
-            fidelity = self._add_shot_noise(fidelity)
-        return fidelity
+            kernel_entries = self._add_shot_noise(kernel_entries)
+
+        kernel_matrix[rows, cols] = kernel_entries
+        if is_symmetric:
+            kernel_matrix[cols, rows] = kernel_entries
+
+        return kernel_matrix
 
     @staticmethod
-    def _compute_fidelity(x: np.ndarray, y: np.ndarray) -> float:
-        return np.abs(np.conj(x) @ y) ** 2
+    def _get_non_trivial_indices(
+        x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the row and column indices of the kernel entries that must be computed. Entries
+        of identical samples are trivial and equal to `1`. In the symmetric case only the strict
+        upper triangle is returned.
+        """
+        num_x = x_vec.shape[0]
+        if is_symmetric:
+            _, sample_ids = np.unique(x_vec, axis=0, return_inverse=True)
+            x_ids = y_ids = sample_ids.ravel()
+            rows, cols = np.triu_indices(num_x, k=1)
+        else:
+            _, sample_ids = np.unique(np.vstack((x_vec, y_vec)), axis=0, return_inverse=True)
+            sample_ids = sample_ids.ravel()
+            x_ids, y_ids = sample_ids[:num_x], sample_ids[num_x:]
+            rows = np.repeat(np.arange(num_x), y_vec.shape[0])
+            cols = np.tile(np.arange(y_vec.shape[0]), num_x)
+
+        mask = x_ids[rows] != y_ids[cols]
+        return rows[mask], cols[mask]
+
+    def _get_statevectors(self, x_vec: np.ndarray) -> np.ndarray:
+        """
+        Stacks the statevectors of the samples into an array of shape ``(n, 2**q)``. Only the
+        statevectors missing from the cache are simulated.
+        """
+        keys = self._cache.keys(self._feature_map, x_vec, self._statevector_type)
+
+        statevectors: dict[str, np.ndarray] = {}
+        missing: dict[str, tuple[float, ...]] = {}
+        for key, x in zip(keys, x_vec):
+            if key in statevectors or key in missing:
+                continue
+            statevector = self._cache.get(key)
+            if statevector is None:
+                missing[key] = tuple(x)
+            else:
+                statevectors[key] = statevector
+
+        if missing:
+            simulate = partial(_simulate_statevector, self._feature_map, self._statevector_type)
+            for key, statevector in zip(missing, self._map(simulate, missing.values())):
+                self._cache.put(key, statevector)
+                statevectors[key] = statevector
+
+        return np.asarray([statevectors[key] for key in keys], dtype=complex)
 
-    def _add_shot_noise(self, fidelity: float) -> float:
-        return algorithm_globals.random.binomial(n=self._shots, p=fidelity) / self._shots
+    @staticmethod
+    def _compute_fidelities(x_svs: np.ndarray, y_svs: np.ndarray, is_symmetric: bool) -> np.ndarray:
+        r"""
+        Computes the fidelities between all pairs of statevectors as :math:`|X^\dagger Y|^2` with
+        a single BLAS call. In the symmetric case only the upper triangle is computed.
+        """
+        if is_symmetric:
+            # Hermitian rank-k update, the transposed (Fortran-ordered) view avoids a copy.
+            overlaps = blas.zherk(1.0, x_svs.T, trans=2)
+        else:
+            overlaps = np.conj(x_svs) @ y_svs.T
+        return np.abs(overlaps) ** 2
+
+    def _add_shot_noise(self, fidelities: np.ndarray) -> np.ndarray:
+        # fidelities may slightly exceed one due to rounding errors
+        probabilities = np.clip(fidelities, 0.0, 1.0)
+        return algorithm_globals.random.binomial(n=self._shots, p=probabilities) / self._shots
 
     def clear_cache(self):
-        """Clear the statevector cache."""
-        # pylint: disable=no-member
-        self._get_statevector.cache_clear()
+        """Clear the in-memory tier of the statevector cache."""
+        self._cache.clear()
+
+    @property
+    def cache(self) -> StatevectorCache:
+        """Returns the statevector cache used by this kernel."""
+        return self._cache
+
+
+def _simulate_statevector(
+    feature_map: QuantumCircuit, statevector_type: Type[SV], param_values: tuple[float]
+) -> np.ndarray:
+    """Simulates the statevector of the feature map, defined at module level to be picklable."""
+    qc = feature_map.assign_parameters(param_values)
+    return statevector_type(qc).data
@@ -0,0 +1,248 @@
+# This code is part of a Qiskit project.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Nystrom Quantum Kernel"""
+
+from __future__ import annotations
+
+import numpy as np
+from qiskit_algorithms.utils import algorithm_globals
+from sklearn.cluster import KMeans
+
+from .base_kernel import BaseKernel
+
+
+class NystromQuantumKernel(BaseKernel):
+    r"""
+    A low-rank approximation of a quantum kernel based on the Nyström method.
+
+    Evaluating the full kernel matrix of :math:`n` samples requires :math:`O(n^2)` kernel entries.
+    The Nyström method instead evaluates the kernel of the samples against :math:`m \ll n`
+    landmark samples only, and approximates the kernel as
+
+    .. math::
+
+        K(X, Y) \approx K(X, L) K(L, L)^{+} K(L, Y) = \Phi(X) \Phi(Y)^T,
+
+    where :math:`L` are the landmarks and :math:`K(L, L)^{+}` is the pseudo-inverse of the kernel
+    matrix of the landmarks. This reduces the number of kernel entries to :math:`O(n m)`.
+
+    The landmarks are selected from the samples passed to :meth:`fit`, and they are kept until
+    :meth:`fit` is called again. If the kernel has not been fitted explicitly, it is fitted to the
+    samples of the kernel matrix evaluated by :meth:`evaluate`, and refitted whenever the kernel
+    matrix of other samples is evaluated, e.g. when a
+    :class:`~qiskit_machine_learning.algorithms.QSVC` is trained on a new dataset. Thus, the kernel
+    can be used with :class:`~qiskit_machine_learning.algorithms.QSVC` and
+    :class:`~qiskit_machine_learning.algorithms.QSVR` directly. The explicit feature embedding
+    :math:`\Phi` returned by :meth:`transform` can be used by linear models.
+
+    Possible strategies to select the landmarks are:
+
+        - ``uniform`` selects the landmarks uniformly at random from the samples.
+        - ``kmeans`` uses the centers of the clusters found by k-means as landmarks.
+        - ``leverage`` evaluates the kernel of a uniformly selected pilot set of twice the number
+          of landmarks and selects the landmarks from the pilot set with probabilities
+          proportional to their ridge leverage scores.
+
+    **References:**
+    [1] Williams, C., & Seeger, M. (2001). Using the Nyström method to speed up kernel machines.
+    Advances in Neural Information Processing Systems, 13, 682-688.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_kernel: BaseKernel,
+        num_landmarks: int = 100,
+        landmark_selection: str = "uniform",
+    ) -> None:
+        """
+        Args:
+            base_kernel: The quantum kernel to be approximated.
+            num_landmarks: The number of landmarks. If the kernel is fitted to fewer samples,
+                all samples are used as landmarks.
+            landmark_selection: The strategy to select the landmarks, ``uniform``, ``kmeans`` or
+                ``leverage``. Default ``uniform``.
+
+        Raises:
+            ValueError: When a non-positive number of landmarks or an unsupported value of
+                ``landmark_selection`` is passed.
+        """
+        super().__init__(feature_map=base_kernel.feature_map, enforce_psd=False)
+
+        if num_landmarks < 1:
+            raise ValueError(f"Number of landmarks must be positive, got {num_landmarks}.")
+
+        selection = landmark_selection.lower()
+        if selection not in ("uniform", "kmeans", "leverage"):
+            raise ValueError(
+                f"Unsupported value passed as landmark_selection: {landmark_selection}"
+            )
+
+        self._base_kernel = base_kernel
+        self._num_landmarks = num_landmarks
+        self._landmark_selection = selection
+
+        self._landmarks: np.ndarray | None = None
+        # the samples the landmarks were selected from by evaluate, None if fitted explicitly
+        self._fitted_samples: np.ndarray | None = None
+        # maps the kernel against the landmarks to the feature embedding
+        self._normalization: np.ndarray | None = None
+        # the embedding of the last transformed samples, e.g. the training data of an SVM
+        self._last_embedding: tuple[np.ndarray, np.ndarray] | None = None
+
+    def fit(self, x_vec: np.ndarray) -> NystromQuantumKernel:
+        """
+        Selects the landmarks from the samples and evaluates their kernel matrix. The landmarks
+        are kept until the kernel is fitted again.
+
+        Args:
+            x_vec: 1D or 2D array of datapoints, NxD, where N is the number of datapoints,
+                D is the feature dimension.
+
+        Returns:
+            The fitted kernel.
+        """
+        x_vec, _ = self._validate_input(x_vec, None)
+        self._fit(x_vec)
+        self._fitted_samples = None
+        return self
+
+    def _fit(self, x_vec: np.ndarray) -> None:
+        num_landmarks = min(self._num_landmarks, x_vec.shape[0])
+
+        if self._landmark_selection == "kmeans":
+            kmeans = KMeans(
+                n_clusters=num_landmarks,
+                n_init=10,
+                random_state=algorithm_globals.random_seed,
+            )
+            landmarks = kmeans.fit(x_vec).cluster_centers_
+            landmark_matrix = self._base_kernel.evaluate(landmarks)
+        elif self._landmark_selection == "leverage":
+            landmarks, landmark_matrix = self._select_by_leverage(x_vec, num_landmarks)
+        else:
+            indices = algorithm_globals.random.choice(
+                x_vec.shape[0], size=num_landmarks, replace=False
+            )
+            landmarks = x_vec[np.sort(indices)]
+            landmark_matrix = self._base_kernel.evaluate(landmarks)
+
+        # pseudo-inverse square root of the kernel matrix of the landmarks
+        w, v = np.linalg.eigh(0.5 * (landmark_matrix + landmark_matrix.T))
+        nonzero = w > max(w.max(), 0) * landmark_matrix.shape[0] * np.finfo(float).eps
+        self._normalization = v[:, nonzero] / np.sqrt(w[nonzero])
+        self._landmarks = landmarks
+        self._last_embedding = None
+
+    def _fit_to_samples(self, x_vec: np.ndarray) -> None:
+        """
+        Fits the kernel to the samples unless it has been fitted explicitly or to the same
+        samples already.
+        """
+        if self._landmarks is not None and (
+            self._fitted_samples is None or np.array_equal(self._fitted_samples, x_vec)
+        ):
+            return
+        self._fit(x_vec)
+        self._fitted_samples = x_vec.copy()
+
+    def transform(self, x_vec: np.ndarray) -> np.ndarray:
+        r"""
+        Computes the explicit feature embedding :math:`\Phi(X)` of the samples, such that the
+        approximated kernel is given by :math:`\Phi(X) \Phi(Y)^T`. If the kernel has not been
+        fitted yet, it is fitted to the samples.
+
+        Args:
+            x_vec: 1D or 2D array of datapoints, NxD, where N is the number of datapoints,
+                D is the feature dimension.
+
+        Returns:
+            2D matrix, NxR, where R is the rank of the approximation, at most the number of
+            landmarks.
+        """
+        x_vec, _ = self._validate_input(x_vec, None)
+        if self._landmarks is None:
+            self._fit_to_samples(x_vec)
+
+        if self._last_embedding is not None and np.array_equal(self._last_embedding[0], x_vec):
+            return self._last_embedding[1]
+
+        embedding = self._base_kernel.evaluate(x_vec, self._landmarks) @ self._normalization
+        self._last_embedding = (x_vec.copy(), embedding)
+        return embedding
+
+    def evaluate(self, x_vec: np.ndarray, y_vec: np.ndarray | None = None) -> np.ndarray:
+        x_vec, y_vec = self._validate_input(x_vec, y_vec)
+        is_symmetric = y_vec is None or np.array_equal(x_vec, y_vec)
+        if is_symmetric:
+            # e.g. the kernel matrix of the training data, the landmarks are selected from it
+            self._fit_to_samples(x_vec)
+        elif self._landmarks is None:
+            self._fit_to_samples(y_vec)
+
+        return self._evaluate_kernel_matrix(x_vec, x_vec if is_symmetric else y_vec, is_symmetric)
+
+    def _evaluate_kernel_matrix(
+        self, x_vec: np.ndarray, y_vec: np.ndarray, is_symmetric: bool
+    ) -> np.ndarray:
+        # the landmarks are kept, e.g. when the kernel matrix is extended by new samples
+        if self._landmarks is None:
+            self._fit_to_samples(y_vec)
+
+        x_embedding = self.transform(x_vec)
+        if is_symmetric:
+            return x_embedding @ x_embedding.T
+        return x_embedding @ self.transform(y_vec).T
+
+    def _select_by_leverage(
+        self, x_vec: np.ndarray, num_landmarks: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Selects landmarks from a uniformly selected pilot set with probabilities proportional to
+        their ridge leverage scores.
+        """
+        num_pilots = min(2 * num_landmarks, x_vec.shape[0])
+        pilots = np.sort(algorithm_globals.random.choice(x_vec.shape[0], num_pilots, replace=False))
+        pilot_matrix = self._base_kernel.evaluate(x_vec[pilots])
+
+        # ridge leverage scores, diag(K (K + lambda I)^-1), with a ridge relative to the spectrum
+        w, v = np.linalg.eigh(0.5 * (pilot_matrix + pilot_matrix.T))
+        w = np.maximum(w, 0)
+        ridge = 1e-3 * max(w.sum(), np.finfo(float).eps) / num_pilots
+        scores = np.sum(v**2 * (w / (w + ridge)), axis=1)
+        scores = np.maximum(scores, np.finfo(float).eps)
+
+        indices = algorithm_globals.random.choice(
+            num_pilots, size=num_landmarks, replace=False, p=scores / scores.sum()
+        )
+        indices = np.sort(indices)
+        return x_vec[pilots[indices]], pilot_matrix[np.ix_(indices, indices)]
+
+    @property
+    def base_kernel(self) -> BaseKernel:
+        """Returns the quantum kernel approximated by this kernel."""
+        return self._base_kernel
+
+    @property
+    def num_landmarks(self) -> int:
+        """Returns the number of landmarks."""
+        return self._num_landmarks
+
+    @property
+    def landmark_selection(self) -> str:
+        """Returns the strategy used to select the landmarks."""
+        return self._landmark_selection
+
+    @property
+    def landmarks(self) -> np.ndarray | None:
+        """Returns the landmarks or ``None`` if the kernel has not been fitted yet."""
+        return self._landmarks
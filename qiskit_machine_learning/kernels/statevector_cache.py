@@ -0,0 +1,238 @@
+# This code is part of a Qiskit project.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Statevector Cache"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+from qiskit import QuantumCircuit, qasm3
+from qiskit.qasm3 import QASM3ExporterError
+from qiskit.quantum_info import Statevector
+
+
+class StatevectorCache:
+    r"""
+    A cache of simulated statevectors used by
+    :class:`~qiskit_machine_learning.kernels.FidelityStatevectorKernel`.
+
+    The cache consists of two tiers. The first tier keeps the most recently used statevectors in
+    memory and evicts the least recently used ones once ``max_size`` is reached. If a
+    ``directory`` is given, the second tier stores every statevector on disk as a ``.npy`` file
+    that is memory-mapped when read back. Thus, statevectors evicted from memory, as well as
+    statevectors simulated by other processes or in previous sessions, are not simulated again.
+
+    Entries are keyed by a hash of the feature map, of the type of the statevector and of the
+    feature vector, rounded to ``decimals`` decimals, see :meth:`keys`. The cache may be shared
+    between kernels with different feature maps and statevector types.
+
+    The number of hits, misses and evictions of the cache is recorded.
+    """
+
+    def __init__(
+        self, *, max_size: int | None = None, directory: str | None = None, decimals: int = 12
+    ) -> None:
+        """
+        Args:
+            max_size: Maximum number of statevectors kept in memory. When ``None`` this is
+                unbounded.
+            directory: A directory where the statevectors are stored on disk. When ``None`` the
+                statevectors are kept in memory only.
+            decimals: The number of decimals the feature vectors are rounded to when computing
+                the keys of the cache.
+
+        Raises:
+            ValueError: When a negative maximum size is passed.
+        """
+        if max_size is not None and max_size < 0:
+            raise ValueError(f"Maximum size of the cache must be non-negative, got {max_size}.")
+
+        self._max_size = max_size
+        self._directory = directory
+        self._decimals = decimals
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def keys(
+        self,
+        feature_map: QuantumCircuit,
+        param_values: np.ndarray,
+        statevector_type: type = Statevector,
+    ) -> list[str]:
+        """
+        Computes the keys of the statevectors of a feature map.
+
+        Args:
+            feature_map: The feature map the statevectors are simulated with.
+            param_values: 2D array of the values assigned to the parameters of the feature map,
+                one row per statevector.
+            statevector_type: The type of the statevectors, as different types may simulate the
+                feature map differently. Default :class:`~qiskit.quantum_info.Statevector`.
+
+        Returns:
+            A list of hexadecimal digests identifying the statevectors.
+        """
+        circuit_digest = hashlib.sha256(_circuit_fingerprint(feature_map))
+        circuit_digest.update(
+            f"{statevector_type.__module__}.{statevector_type.__qualname__}".encode()
+        )
+        # adding zero turns negative zeros into positive zeros
+        values = np.round(np.asarray(param_values, dtype=float), self._decimals) + 0.0
+
+        keys = []
+        for row in values:
+            digest = circuit_digest.copy()
+            digest.update(row.tobytes())
+            keys.append(digest.hexdigest())
+        return keys
+
+    def get(self, key: str) -> np.ndarray | None:
+        """
+        Looks up a statevector, first in memory and then on disk.
+
+        Args:
+            key: The key of the statevector.
+
+        Returns:
+            The statevector or ``None`` if it is not in the cache.
+        """
+        statevector = self._memory.get(key)
+        if statevector is not None:
+            self._memory.move_to_end(key)
+            self._hits += 1
+            return statevector
+
+        if self._directory is not None:
+            path = self._path(self._directory, key)
+            if os.path.exists(path):
+                statevector = np.load(path, mmap_mode="r")
+                self._store(key, statevector)
+                self._hits += 1
+                return statevector
+
+        self._misses += 1
+        return None
+
+    def put(self, key: str, statevector: np.ndarray) -> None:
+        """
+        Adds a statevector to the cache. If a directory is set, the statevector is written to
+        disk as well.
+
+        Args:
+            key: The key of the statevector.
+            statevector: The statevector to cache.
+        """
+        if self._directory is not None:
+            path = self._path(self._directory, key)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # write to a temporary file first, so concurrent readers never see partial files
+                with tempfile.NamedTemporaryFile(
+                    dir=os.path.dirname(path), suffix=".npy", delete=False
+                ) as file:
+                    np.save(file, statevector)
+                os.replace(file.name, path)
+
+        self._store(key, statevector)
+
+    def clear(self, include_disk: bool = False) -> None:
+        """
+        Clears the in-memory tier of the cache and resets the counters.
+
+        Args:
+            include_disk: Whether the statevectors stored on disk are removed as well.
+        """
+        self._memory.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        if include_disk and self._directory is not None and os.path.isdir(self._directory):
+            for shard in os.scandir(self._directory):
+                if not shard.is_dir():
+                    continue
+                for file in os.scandir(shard.path):
+                    if file.name.endswith(".npy"):
+                        os.remove(file.path)
+
+    def _store(self, key: str, statevector: np.ndarray) -> None:
+        if self._max_size == 0:
+            return
+        self._memory[key] = statevector
+        self._memory.move_to_end(key)
+        if self._max_size is not None and len(self._memory) > self._max_size:
+            self._memory.popitem(last=False)
+            self._evictions += 1
+
+    @staticmethod
+    def _path(directory: str, key: str) -> str:
+        # shard the files into sub-directories by the leading characters of their keys
+        return os.path.join(directory, key[:2], f"{key}.npy")
+
+    @property
+    def max_size(self) -> int | None:
+        """Returns the maximum number of statevectors kept in memory."""
+        return self._max_size
+
+    @property
+    def directory(self) -> str | None:
+        """Returns the directory where the statevectors are stored on disk."""
+        return self._directory
+
+    @property
+    def size(self) -> int:
+        """Returns the number of statevectors kept in memory."""
+        return len(self._memory)
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of statevectors found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of statevectors not found in the cache."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Returns the number of statevectors evicted from memory."""
+        return self._evictions
+
+
+def _circuit_fingerprint(circuit: QuantumCircuit) -> bytes:
+    """
+    Returns a representation of a circuit that, unlike the circuit's parameters, does not depend
+    on the process the circuit was created in.
+    """
+    try:
+        text = qasm3.dumps(circuit)
+    except QASM3ExporterError:
+        circuit = circuit.decompose()
+        text = repr(
+            [
+                (
+                    instruction.operation.name,
+                    [circuit.find_bit(qubit).index for qubit in instruction.qubits],
+                    [str(param) for param in instruction.operation.params],
+                )
+                for instruction in circuit.data
+            ]
+        )
+    return text.encode()
@@ -21,6 +21,7 @@ from qiskit import QuantumCircuit
 from qiskit.circuit import Parameter, ParameterVector
 from qiskit_algorithms.state_fidelities import BaseStateFidelity
 
+from .fidelity_cache import FidelityCache
 from .fidelity_quantum_kernel import FidelityQuantumKernel, KernelIndices
 from .trainable_kernel import TrainableKernel
 
@@ -51,6 +52,10 @@ class TrainableFidelityQuantumKernel(TrainableKernel, FidelityQuantumKernel):
         training_parameters: ParameterVector | Sequence[Parameter] | None = None,
         enforce_psd: bool = True,
         evaluate_duplicates: str = "off_diagonal",
+        block_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: FidelityCache | None = None,
+        psd_method: str = "eigh",
     ) -> None:
         """
         Args:
@@ -82,6 +87,24 @@ class TrainableFidelityQuantumKernel(TrainableKernel, FidelityQuantumKernel):
                     - ``none`` when training the diagonal is set to `1` and if two identical samples
                       are found in the dataset the corresponding matrix element is set to `1`.
                       When inferring, matrix elements for identical samples are set to `1`.
+            block_size: If set, the kernel matrix is evaluated in tiles of at most
+                ``block_size x block_size`` entries. Each tile is evaluated separately, thus
+                bounding the memory required by the evaluation. When ``None`` the whole matrix is
+                evaluated at once. Default ``None``.
+            n_jobs: The number of worker processes the tiles of the kernel matrix are distributed
+                across, ``-1`` means that all available cores are used. Each tile is evaluated
+                by a separate fidelity job, hence ``block_size`` must be set to benefit from
+                multiple processes. The fidelity instance must be picklable. Default ``None``,
+                the kernel is evaluated in the current process.
+            cache: An optional :class:`~qiskit_machine_learning.kernels.FidelityCache` that is
+                consulted before fidelities are evaluated, so only the fidelities missing from the
+                cache are submitted to the fidelity instance. A cache may be shared between
+                kernels. Fidelities evaluated in worker processes, see ``n_jobs``, are added to
+                the cache of the current process. Default ``None``, no cache is used.
+            psd_method: Defines a strategy how the kernel matrix is projected to a positive
+                semidefinite matrix if ``enforce_psd`` is ``True``. Possible values are ``eigh``,
+                ``cholesky`` and ``lanczos``, see
+                :class:`~qiskit_machine_learning.kernels.BaseKernel` for details. Default ``eigh``.
         """
         super().__init__(
             feature_map=feature_map,
@@ -89,6 +112,10 @@ class TrainableFidelityQuantumKernel(TrainableKernel, FidelityQuantumKernel):
             training_parameters=training_parameters,
             enforce_psd=enforce_psd,
             evaluate_duplicates=evaluate_duplicates,
+            block_size=block_size,
+            n_jobs=n_jobs,
+            cache=cache,
+            psd_method=psd_method,
         )
 
         # override the num of features defined in the base class
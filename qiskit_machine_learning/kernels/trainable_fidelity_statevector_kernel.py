@@ -23,6 +23,7 @@ from qiskit.quantum_info import Statevector
 
 
 from .fidelity_statevector_kernel import FidelityStatevectorKernel, SV
+from .statevector_cache import StatevectorCache
 from .trainable_kernel import TrainableKernel
 
 
@@ -53,6 +54,10 @@ class TrainableFidelityStatevectorKernel(TrainableKernel, FidelityStatevectorKer
         auto_clear_cache: bool = True,
         shots: int | None = None,
         enforce_psd: bool = True,
+        block_size: int | None = None,
+        n_jobs: int | None = None,
+        cache: StatevectorCache | None = None,
+        psd_method: str = "eigh",
     ) -> None:
         """
         Args:
@@ -70,12 +75,28 @@ class TrainableFidelityStatevectorKernel(TrainableKernel, FidelityStatevectorKer
                 should be set.
             cache_size: Maximum size of the statevector cache. When ``None`` this is unbounded.
             auto_clear_cache: Determines whether the statevector cache is retained when
-                :meth:`evaluate` is called. The cache is automatically cleared by default.
+                :meth:`evaluate` is called. The cache is automatically cleared by default. A
+                cache passed via ``cache`` is never cleared automatically.
             shots: The number of shots. If ``None``, the exact fidelity is used. Otherwise, the
                 mean is taken of samples drawn from a binomial distribution with probability equal
                 to the exact fidelity.
             enforce_psd: Project to the closest positive semidefinite matrix if ``x = y``.
                 Default ``True``.
+            block_size: If set, the kernel matrix is evaluated in tiles of at most
+                ``block_size x block_size`` entries. Each tile is evaluated separately, thus
+                bounding the memory required by the evaluation. When ``None`` the whole matrix is
+                evaluated at once. Default ``None``.
+            n_jobs: The number of worker processes the statevector simulations are distributed
+                across, ``-1`` means that all available cores are used. Default ``None``, the
+                statevectors are simulated in the current process.
+            cache: The statevector cache to use. If ``None`` is given, an in-memory
+                :class:`~qiskit_machine_learning.kernels.StatevectorCache` of size ``cache_size``
+                is created. A cache may be shared between kernels, hence it is not cleared when
+                :meth:`evaluate` is called.
+            psd_method: Defines a strategy how the kernel matrix is projected to a positive
+                semidefinite matrix if ``enforce_psd`` is ``True``. Possible values are ``eigh``,
+                ``cholesky`` and ``lanczos``, see
+                :class:`~qiskit_machine_learning.kernels.BaseKernel` for details. Default ``eigh``.
         """
         super().__init__(
             feature_map=feature_map,
@@ -85,6 +106,10 @@ class TrainableFidelityStatevectorKernel(TrainableKernel, FidelityStatevectorKer
             auto_clear_cache=auto_clear_cache,
             shots=shots,
             enforce_psd=enforce_psd,
+            block_size=block_size,
+            n_jobs=n_jobs,
+            cache=cache,
+            psd_method=psd_method,
         )
 
         # Override the number of features defined in the base class.
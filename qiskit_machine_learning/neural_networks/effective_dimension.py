@@ -13,6 +13,8 @@
 
 import logging
 import time
+from collections import deque
+from concurrent.futures import Future
 from typing import Union, List, Tuple
 
 import numpy as np
@@ -148,30 +150,35 @@ class EffectiveDimension:
             (self._num_input_samples * self._num_weight_samples, self._model.output_shape[0])
         )
 
-        for (i, param_set) in enumerate(self._weight_samples):
-            t_before_forward = time.time()
-            forward_pass = np.asarray(
-                self._model.forward(input_data=self._input_samples, weights=param_set)
-            )
-            t_after_forward = time.time()
-
-            backward_pass = np.asarray(
-                self._model.backward(input_data=self._input_samples, weights=param_set)[1]
-            )
-            t_after_backward = time.time()
-
-            t_forward = t_after_forward - t_before_forward
-            t_backward = t_after_backward - t_after_forward
+        def gather(i: int, t_submitted: float, forward: Future, backward: Future) -> None:
+            forward_pass = np.asarray(forward.result())
+            backward_pass = np.asarray(backward.result()[1])
             logger.debug(
-                "Weight sample: %d, forward time: %.3f (s), backward time: %.3f (s)",
+                "Weight sample: %d, forward and backward time: %.3f (s)",
                 i,
-                t_forward,
-                t_backward,
+                time.time() - t_submitted,
             )
 
             grads[self._num_input_samples * i : self._num_input_samples * (i + 1)] = backward_pass
             outputs[self._num_input_samples * i : self._num_input_samples * (i + 1)] = forward_pass
 
+        # the passes of the next weight sample are submitted before the results of the current
+        # one are gathered, so the primitives are kept busy during post-processing
+        pending: deque = deque()
+        for (i, param_set) in enumerate(self._weight_samples):
+            pending.append(
+                (
+                    i,
+                    time.time(),
+                    self._model.forward_async(input_data=self._input_samples, weights=param_set),
+                    self._model.backward_async(input_data=self._input_samples, weights=param_set),
+                )
+            )
+            if len(pending) > 1:
+                gather(*pending.popleft())
+        while pending:
+            gather(*pending.popleft())
+
         # post-processing in the case of EstimatorQNN output, to match
         # the SamplerQNN output format
         if isinstance(self._model, EstimatorQNN):
@@ -16,12 +16,13 @@ from __future__ import annotations
 
 import logging
 from copy import copy
-from typing import Sequence
+from typing import Callable, Sequence
 
 import numpy as np
 from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.exceptions import QiskitError
 from qiskit.primitives import BaseEstimator, Estimator, EstimatorResult
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info import SparsePauliOp, Statevector
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit_algorithms.gradients import (
     BaseEstimatorGradient,
@@ -111,6 +112,8 @@ class EstimatorQNN(NeuralNetwork):
         weight_params: Sequence[Parameter] | None = None,
         gradient: BaseEstimatorGradient | None = None,
         input_gradients: bool = False,
+        deduplicate_observables: bool = False,
+        simulate_statevectors: bool = False,
     ):
         r"""
         Args:
@@ -141,6 +144,21 @@ class EstimatorQNN(NeuralNetwork):
                 Note that this parameter is ``False`` by default, and must be explicitly set to
                 ``True`` for a proper gradient computation when using
                 :class:`~qiskit_machine_learning.connectors.TorchConnector`.
+            deduplicate_observables: If ``True``, duplicate samples and duplicate observables
+                are submitted to the estimator only once. If the observables share Pauli terms,
+                such that there are fewer distinct Pauli terms than distinct observables, the
+                distinct Pauli terms are submitted instead of the observables and the expectation
+                values of the observables are computed from them. This applies to the forward and
+                to the backward pass. Qubit-wise commuting terms are not grouped, this is left
+                to the estimator. With a shot-based estimator, duplicate samples then get
+                identical values instead of independent estimates. Default ``False``.
+            simulate_statevectors: If ``True``, the forward pass does not use the estimator.
+                Instead, the statevector of every sample is simulated once with
+                :class:`~qiskit.quantum_info.Statevector` and the exact expectation values of all
+                observables are computed from it, rather than simulating a circuit for every pair
+                of a sample and an observable. This pays off for many observables on a simulator.
+                The backward pass still uses the gradient, so noisy or shot-based gradients are
+                not consistent with the exact forward pass. Default ``False``.
 
         Raises:
             QiskitMachineLearningError: Invalid parameter values.
@@ -154,6 +172,14 @@ class EstimatorQNN(NeuralNetwork):
         if isinstance(observables, BaseOperator):
             observables = (observables,)
         self._observables = observables
+        self._deduplicate_observables = deduplicate_observables
+        self._simulate_statevectors = simulate_statevectors
+        # the observables submitted to the estimator and the coefficients of the observables of
+        # the network in terms of them, None if the observables are submitted as they are
+        self._submitted_observables: Sequence[BaseOperator] = observables
+        self._observable_coeffs: np.ndarray | None = None
+        if deduplicate_observables:
+            self._submitted_observables, self._observable_coeffs = self._deduplicate(observables)
         if isinstance(circuit, QNNCircuit):
             self._input_params = list(circuit.input_parameters)
             self._weight_params = list(circuit.weight_parameters)
@@ -193,6 +219,18 @@ class EstimatorQNN(NeuralNetwork):
         """The parameters that correspond to the trainable weights."""
         return copy(self._weight_params)
 
+    @property
+    def deduplicate_observables(self) -> bool:
+        """Returns whether duplicate samples, observables and Pauli terms are submitted to the
+        estimator only once."""
+        return self._deduplicate_observables
+
+    @property
+    def simulate_statevectors(self) -> bool:
+        """Returns whether the forward pass computes the expectation values of all observables
+        from a single statevector simulation of every sample instead of using the estimator."""
+        return self._simulate_statevectors
+
     @property
     def input_gradients(self) -> bool:
         """Returns whether gradients with respect to input data are computed by this neural network
@@ -204,6 +242,63 @@ class EstimatorQNN(NeuralNetwork):
         """Turn on/off computation of gradients with respect to input data."""
         self._input_gradients = input_gradients
 
+    @staticmethod
+    def _deduplicate(
+        observables: Sequence[BaseOperator],
+    ) -> tuple[Sequence[BaseOperator], np.ndarray]:
+        """
+        Returns the distinct observables, or the distinct Pauli terms if there are fewer, and the
+        matrix of the coefficients of the observables in terms of them.
+        """
+        distinct: list[BaseOperator] = []
+        coeffs = np.zeros((len(observables), len(observables)), dtype=complex)
+        for i, observable in enumerate(observables):
+            index = next((j for j, op in enumerate(distinct) if op == observable), len(distinct))
+            if index == len(distinct):
+                distinct.append(observable)
+            coeffs[i, index] = 1
+        coeffs = coeffs[:, : len(distinct)]
+
+        try:
+            paulis = [SparsePauliOp(op).simplify() for op in distinct]
+        except QiskitError:
+            # the observables are not given in terms of Pauli operators
+            return distinct, coeffs
+
+        labels: dict[str, int] = {}
+        for op in paulis:
+            for label in op.paulis.to_labels():
+                labels.setdefault(label, len(labels))
+        if len(labels) >= len(distinct):
+            return distinct, coeffs
+
+        term_coeffs = np.zeros((len(distinct), len(labels)), dtype=complex)
+        for i, op in enumerate(paulis):
+            for label, coeff in zip(op.paulis.to_labels(), op.coeffs):
+                term_coeffs[i, labels[label]] += coeff
+        terms = [SparsePauliOp(label) for label in labels]
+        return terms, coeffs @ term_coeffs
+
+    def _distinct_samples(
+        self, parameter_values: np.ndarray, num_samples: int
+    ) -> tuple[np.ndarray, int, np.ndarray | None]:
+        """Returns the distinct rows of the parameter values, their number and the indices of the
+        samples in them, if the observables are deduplicated."""
+        if not self._deduplicate_observables or parameter_values.ndim < 2 or num_samples < 2:
+            return parameter_values, num_samples, None
+        distinct, indices = np.unique(parameter_values, axis=0, return_inverse=True)
+        return distinct, distinct.shape[0], indices.ravel()
+
+    def _restore_outputs(self, values: np.ndarray, indices: np.ndarray | None) -> np.ndarray:
+        """Maps the values of the distinct samples and the submitted observables, of the shape
+        (num_distinct_samples, num_submitted_observables, ...), to the samples and the
+        observables of the network."""
+        if self._observable_coeffs is not None:
+            values = np.real(np.einsum("se...,oe->so...", values, self._observable_coeffs))
+        if indices is not None:
+            values = values[indices]
+        return values
+
     def _forward_postprocess(self, num_samples: int, result: EstimatorResult) -> np.ndarray:
         """Post-processing during forward pass of the network."""
         return np.reshape(result.values, (-1, num_samples)).T
@@ -212,31 +307,64 @@ class EstimatorQNN(NeuralNetwork):
         self, input_data: np.ndarray | None, weights: np.ndarray | None
     ) -> np.ndarray | None:
         """Forward pass of the neural network."""
+        return self._submit_forward(input_data, weights)()
+
+    def _submit_forward(
+        self, input_data: np.ndarray | None, weights: np.ndarray | None
+    ) -> Callable[[], np.ndarray]:
+        """Submits the estimator job of the forward pass and returns a function that waits for
+        the job and post-processes its results."""
         parameter_values_, num_samples = self._preprocess_forward(input_data, weights)
+        parameter_values_, num_samples, indices = self._distinct_samples(
+            parameter_values_, num_samples
+        )
+        if self._simulate_statevectors:
+            # the statevectors are simulated when the results are requested, thus, by the
+            # executor in asynchronous passes
+            return lambda: self._restore_outputs(
+                self._statevector_forward(parameter_values_, num_samples), indices
+            )
+
+        num_observables = len(self._submitted_observables)
         job = self.estimator.run(
-            [self._circuit] * num_samples * self.output_shape[0],
-            [op for op in self._observables for _ in range(num_samples)],
-            np.tile(parameter_values_, (self.output_shape[0], 1)),
+            [self._circuit] * num_samples * num_observables,
+            [op for op in self._submitted_observables for _ in range(num_samples)],
+            np.tile(parameter_values_, (num_observables, 1)),
         )
-        try:
-            results = job.result()
-        except Exception as exc:
-            raise QiskitMachineLearningError("Estimator job failed.") from exc
 
-        return self._forward_postprocess(num_samples, results)
+        def result() -> np.ndarray:
+            try:
+                results = job.result()
+            except Exception as exc:
+                raise QiskitMachineLearningError("Estimator job failed.") from exc
+            return self._restore_outputs(self._forward_postprocess(num_samples, results), indices)
+
+        return result
+
+    def _statevector_forward(self, parameter_values: np.ndarray, num_samples: int) -> np.ndarray:
+        """Simulates the statevector of every sample once and returns the expectation values of
+        the submitted observables, of the shape (num_samples, num_submitted_observables)."""
+        parameter_values = np.reshape(parameter_values, (num_samples, -1))
+        values = np.zeros((num_samples, len(self._submitted_observables)))
+        for i, sample in enumerate(parameter_values):
+            # the values are bound in the order of the circuit parameters, as by the estimator
+            state = Statevector(self._circuit.assign_parameters(sample))
+            for j, observable in enumerate(self._submitted_observables):
+                values[i, j] = np.real(state.expectation_value(observable))
+        return values
 
     def _backward_postprocess(
         self, num_samples: int, result: EstimatorGradientResult
     ) -> tuple[np.ndarray | None, np.ndarray]:
         """Post-processing during backward pass of the network."""
-        num_observables = self.output_shape[0]
+        gradients = np.asarray(result.gradients)
+        num_observables = gradients.shape[0] // num_samples
         if self._input_gradients:
             input_grad = np.zeros((num_samples, num_observables, self._num_inputs))
         else:
             input_grad = None
 
         weights_grad = np.zeros((num_samples, num_observables, self._num_weights))
-        gradients = np.asarray(result.gradients)
         for i in range(num_observables):
             if self._input_gradients:
                 input_grad[:, i, :] = gradients[i * num_samples : (i + 1) * num_samples][
@@ -253,32 +381,44 @@ class EstimatorQNN(NeuralNetwork):
         self, input_data: np.ndarray | None, weights: np.ndarray | None
     ) -> tuple[np.ndarray | None, np.ndarray]:
         """Backward pass of the network."""
+        return self._submit_backward(input_data, weights)()
+
+    def _submit_backward(
+        self, input_data: np.ndarray | None, weights: np.ndarray | None
+    ) -> Callable[[], tuple[np.ndarray | None, np.ndarray | None]]:
+        """Submits the gradient job of the backward pass and returns a function that waits for
+        the job and post-processes its results."""
         # prepare parameters in the required format
         parameter_values, num_samples = self._preprocess_forward(input_data, weights)
+        parameter_values, num_samples, indices = self._distinct_samples(
+            parameter_values, num_samples
+        )
 
-        input_grad, weights_grad = None, None
-
+        job = None
         if np.prod(parameter_values.shape) > 0:
-            num_observables = self.output_shape[0]
+            num_observables = len(self._submitted_observables)
             num_circuits = num_samples * num_observables
 
             circuits = [self._circuit] * num_circuits
-            observables = [op for op in self._observables for _ in range(num_samples)]
+            observables = [op for op in self._submitted_observables for _ in range(num_samples)]
             param_values = np.tile(parameter_values, (num_observables, 1))
 
-            job = None
             if self._input_gradients:
                 job = self.gradient.run(circuits, observables, param_values)
             elif len(parameter_values[0]) > self._num_inputs:
                 params = [self._circuit.parameters[self._num_inputs :]] * num_circuits
                 job = self.gradient.run(circuits, observables, param_values, parameters=params)
 
-            if job is not None:
-                try:
-                    results = job.result()
-                except Exception as exc:
-                    raise QiskitMachineLearningError("Estimator job failed.") from exc
-
-                input_grad, weights_grad = self._backward_postprocess(num_samples, results)
-
-        return input_grad, weights_grad
+        def result() -> tuple[np.ndarray | None, np.ndarray | None]:
+            if job is None:
+                return None, None
+            try:
+                results = job.result()
+            except Exception as exc:
+                raise QiskitMachineLearningError("Estimator job failed.") from exc
+            input_grad, weights_grad = self._backward_postprocess(num_samples, results)
+            if input_grad is not None:
+                input_grad = self._restore_outputs(input_grad, indices)
+            return input_grad, self._restore_outputs(weights_grad, indices)
+
+        return result
@@ -15,7 +15,11 @@ Machine Learning module."""
 
 from __future__ import annotations
 
+import atexit
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable
 
 import numpy as np
 
@@ -38,6 +42,12 @@ else:
 class NeuralNetwork(ABC):
     """Abstract Neural Network class providing forward and backward pass and handling
     batched inputs. This is to be implemented by other (quantum) neural networks.
+
+    Networks implement the passes in :meth:`_forward` and :meth:`_backward`. Networks that run
+    asynchronous jobs, e.g. on primitives, additionally implement :meth:`_submit_forward` and
+    :meth:`_submit_backward`, which submit the jobs of a pass and return a function that waits
+    for the results. All other passes, :meth:`forward_backward`, :meth:`forward_async` and
+    :meth:`backward_async`, are built on top of these two pairs of methods.
     """
 
     def __init__(
@@ -47,6 +57,7 @@ class NeuralNetwork(ABC):
         sparse: bool,
         output_shape: int | tuple[int, ...],
         input_gradients: bool = False,
+        executor: Executor | None = None,
     ) -> None:
         """
         Args:
@@ -55,6 +66,8 @@ class NeuralNetwork(ABC):
             sparse: Determines whether the output is a sparse array or not.
             output_shape: The shape of the output.
             input_gradients: Determines whether to compute gradients with respect to input data.
+            executor: The executor that waits for and post-processes the results of
+                :meth:`forward_async` and :meth:`backward_async`, see :attr:`executor`.
         Raises:
             QiskitMachineLearningError: Invalid parameter values.
         """
@@ -75,6 +88,7 @@ class NeuralNetwork(ABC):
             self._output_shape = self._validate_output_shape(output_shape)
 
         self._input_gradients = input_gradients
+        self._executor = executor
 
     @property
     def num_inputs(self) -> int:
@@ -107,6 +121,25 @@ class NeuralNetwork(ABC):
         """Turn on/off computation of gradients with respect to input data."""
         self._input_gradients = input_gradients
 
+    @property
+    def executor(self) -> Executor | None:
+        """Returns the executor that waits for and post-processes the results of
+        :meth:`forward_async` and :meth:`backward_async`. If ``None``, a thread pool shared by
+        all networks is used, which is shut down when the interpreter exits. An executor set by
+        the user is not shut down by the network."""
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: Executor | None) -> None:
+        """Sets the executor of the asynchronous passes."""
+        self._executor = executor
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # executors can not be copied, a copy uses the shared thread pool
+        state["_executor"] = None
+        return state
+
     def _validate_output_shape(self, output_shape):
         if isinstance(output_shape, int):
             output_shape = (output_shape,)
@@ -264,3 +297,132 @@ class NeuralNetwork(ABC):
         self, input_data: np.ndarray | None, weights: np.ndarray | None
     ) -> tuple[np.ndarray | SparseArray | None, np.ndarray | SparseArray | None]:
         raise NotImplementedError
+
+    def forward_backward(
+        self,
+        input_data: float | list[float] | np.ndarray | None,
+        weights: float | list[float] | np.ndarray | None,
+    ) -> tuple[
+        np.ndarray | SparseArray,
+        np.ndarray | SparseArray | None,
+        np.ndarray | SparseArray | None,
+    ]:
+        """Forward and backward passes of the network for the same input data and weights.
+
+        This is equivalent to calling :meth:`forward` and :meth:`backward` one after the other,
+        but networks may evaluate both passes at once, e.g. by submitting the primitive and the
+        gradient jobs together.
+
+        Args:
+            input_data: input data of the shape (num_inputs). In case of a
+                single scalar input it is directly cast to and interpreted like a one-element array.
+            weights: trainable weights of the shape (num_weights). In case of a single scalar weight
+                it is directly cast to and interpreted like a one-element array.
+        Returns:
+            A tuple of the result of the forward pass of the shape (output_shape) and the
+            gradients for input and weights of shape (output_shape, num_input) and
+            (output_shape, num_weights), respectively.
+        """
+        input_, shape = self._validate_input(input_data)
+        weights_ = self._validate_weights(weights)
+        # both passes are submitted before waiting for the results of either of them. The forward
+        # job is submitted first, so its circuits are passed to the primitives by this thread
+        # before the gradient job passes its own from a thread of its own.
+        forward_result = self._submit_forward(input_, weights_)
+        backward_result = self._submit_backward(input_, weights_)
+        output_data = forward_result()
+        input_grad, weight_grad = backward_result()
+
+        input_grad_reshaped, weight_grad_reshaped = self._validate_backward_output(
+            input_grad, weight_grad, shape
+        )
+
+        return (
+            self._validate_forward_output(output_data, shape),
+            input_grad_reshaped,
+            weight_grad_reshaped,
+        )
+
+    def forward_async(
+        self,
+        input_data: float | list[float] | np.ndarray | None,
+        weights: float | list[float] | np.ndarray | None,
+    ) -> Future:
+        """Asynchronous forward pass of the network.
+
+        The primitive job of the pass is submitted immediately and the method returns without
+        waiting for its results, so several passes can be kept in flight at once. The results
+        are post-processed by the :attr:`executor` of the network.
+
+        Args:
+            input_data: input data of the shape (num_inputs). In case of a single scalar input it is
+                directly cast to and interpreted like a one-element array.
+            weights: trainable weights of the shape (num_weights). In case of a single scalar weight
+                it is directly cast to and interpreted like a one-element array.
+        Returns:
+            A future of the result of :meth:`forward`.
+        """
+        input_, shape = self._validate_input(input_data)
+        weights_ = self._validate_weights(weights)
+        result = self._submit_forward(input_, weights_)
+        return self._get_executor().submit(lambda: self._validate_forward_output(result(), shape))
+
+    def backward_async(
+        self,
+        input_data: float | list[float] | np.ndarray | None,
+        weights: float | list[float] | np.ndarray | None,
+    ) -> Future:
+        """Asynchronous backward pass of the network.
+
+        The gradient job of the pass is submitted immediately and the method returns without
+        waiting for its results, so several passes can be kept in flight at once. The results
+        are post-processed by the :attr:`executor` of the network.
+
+        Args:
+            input_data: input data of the shape (num_inputs). In case of a
+                single scalar input it is directly cast to and interpreted like a one-element array.
+            weights: trainable weights of the shape (num_weights). In case of a single scalar weight
+                it is directly cast to and interpreted like a one-element array.
+        Returns:
+            A future of the result of :meth:`backward`.
+        """
+        input_, shape = self._validate_input(input_data)
+        weights_ = self._validate_weights(weights)
+        result = self._submit_backward(input_, weights_)
+        return self._get_executor().submit(lambda: self._validate_backward_output(*result(), shape))
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            return _default_executor()
+        return self._executor
+
+    def _submit_forward(
+        self, input_data: np.ndarray | None, weights: np.ndarray | None
+    ) -> Callable[[], np.ndarray | SparseArray]:
+        """Submits the forward pass and returns a function that waits for its results. Networks
+        that run asynchronous jobs should override this method, by default the pass is evaluated
+        only when the function is called."""
+        return lambda: self._forward(input_data, weights)
+
+    def _submit_backward(
+        self, input_data: np.ndarray | None, weights: np.ndarray | None
+    ) -> Callable[[], tuple[np.ndarray | SparseArray | None, np.ndarray | SparseArray | None]]:
+        """Submits the backward pass and returns a function that waits for its results. Networks
+        that run asynchronous jobs should override this method, by default the pass is evaluated
+        only when the function is called."""
+        return lambda: self._backward(input_data, weights)
+
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _default_executor() -> ThreadPoolExecutor:
+    """Returns the thread pool that waits for and post-processes asynchronous passes of the
+    networks without an executor of their own."""
+    global _EXECUTOR  # pylint: disable=global-statement
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(thread_name_prefix="qiskit-ml-nn")
+            atexit.register(_EXECUTOR.shutdown, wait=False)
+        return _EXECUTOR
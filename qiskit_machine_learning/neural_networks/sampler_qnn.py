@@ -13,10 +13,11 @@
 """A Neural Network implementation based on the Sampler primitive."""
 
 from __future__ import annotations
+import itertools
 import logging
 
 from numbers import Integral
-from typing import Callable, cast, Iterable, Sequence
+from typing import Callable, Sequence
 
 import numpy as np
 from qiskit.circuit import Parameter, QuantumCircuit
@@ -48,6 +49,14 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# circuits with more classical bits do not get a lookup table of all outcomes
+_MAX_LOOKUP_BITS = 20
+
+
+def _identity(x: int) -> int:
+    # a module level function, unlike a lambda, can be pickled with the network
+    return x
+
 
 class SamplerQNN(NeuralNetwork):
     """A neural network implementation based on the Sampler primitive.
@@ -194,7 +203,7 @@ class SamplerQNN(NeuralNetwork):
             self._weight_params = list(weight_params) if weight_params is not None else []
 
         if sparse:
-            _optionals.HAS_SPARSE.require_now("DOK")
+            _optionals.HAS_SPARSE.require_now("COO")
 
         self.set_interpret(interpret, output_shape)
         self._input_gradients = input_gradients
@@ -245,7 +254,12 @@ class SamplerQNN(NeuralNetwork):
 
         # derive target values to be used in computations
         self._output_shape = self._compute_output_shape(interpret, output_shape)
-        self._interpret = interpret if interpret is not None else lambda x: x
+        self._interpret = interpret if interpret is not None else _identity
+        self._identity_interpret = interpret is None
+        # flat output indices of all measured integers, built on first use
+        self._lookup_table: np.ndarray | None = None
+        # flat output indices of the measured integers seen so far, used for wide circuits
+        self._lookup_cache: dict[int, int] = {}
 
     def _compute_output_shape(
         self,
@@ -278,34 +292,109 @@ class SamplerQNN(NeuralNetwork):
 
         return output_shape_
 
-    def _postprocess(self, num_samples: int, result: SamplerResult) -> np.ndarray | SparseArray:
+    def _interpret_indices(self, outcomes: np.ndarray) -> np.ndarray:
         """
-        Post-processing during forward pass of the network.
+        Maps measured integers to flat indices of the interpreted outputs. The interpret function
+        is evaluated once for every possible outcome and the results are stored in a lookup table.
+        For circuits with too many classical bits, the table is filled lazily with the outcomes
+        that have actually been measured.
         """
+        num_clbits = self._circuit.num_clbits
+        if num_clbits <= _MAX_LOOKUP_BITS:
+            if self._lookup_table is None:
+                self._lookup_table = self._flat_indices(np.arange(2**num_clbits))
+            indices = self._lookup_table[outcomes]
+        else:
+            unique_outcomes, inverse = np.unique(outcomes, return_inverse=True)
+            missing = [int(b) for b in unique_outcomes if int(b) not in self._lookup_cache]
+            if missing:
+                self._lookup_cache.update(zip(missing, self._flat_indices(np.asarray(missing))))
+            unique_indices = np.fromiter(
+                (self._lookup_cache[int(b)] for b in unique_outcomes),
+                dtype=np.int64,
+                count=len(unique_outcomes),
+            )
+            indices = unique_indices[inverse]
 
-        if self._sparse:
-            # pylint: disable=import-error
-            from sparse import DOK
+        if np.any(indices < 0):
+            invalid = outcomes[np.argmax(indices < 0)]
+            raise QiskitMachineLearningError(
+                f"The interpreted value of {invalid} is out of the output shape "
+                f"{self._output_shape}."
+            )
+        return indices
 
-            prob = DOK((num_samples, *self._output_shape))
-        else:
-            prob = np.zeros((num_samples, *self._output_shape))
+    def _flat_indices(self, outcomes: np.ndarray) -> np.ndarray:
+        """
+        Interprets measured integers and computes the flat indices of the outputs, or ``-1`` for
+        interpreted values that are out of the output shape.
+        """
+        if self._identity_interpret:
+            outcomes = np.asarray(outcomes, dtype=np.int64)
+            return np.where(outcomes < self._output_shape[0], outcomes, -1)
+
+        keys = []
+        for outcome in outcomes:
+            key = self._interpret(int(outcome))
+            keys.append((key,) if isinstance(key, Integral) else tuple(key))
+        keys_array = np.asarray(keys, dtype=np.int64).reshape(len(outcomes), -1)
+
+        shape = np.asarray(self._output_shape)
+        if keys_array.shape[1] != len(shape):
+            raise QiskitMachineLearningError(
+                f"The interpreted values have {keys_array.shape[1]} dimensions, "
+                f"but the output shape is {self._output_shape}."
+            )
+
+        # negative indices count from the end as when indexing arrays
+        keys_array = np.where(keys_array < 0, keys_array + shape, keys_array)
+        valid = np.all((keys_array >= 0) & (keys_array < shape), axis=1)
+        indices = np.full(len(outcomes), -1, dtype=np.int64)
+        indices[valid] = np.ravel_multi_index(tuple(keys_array[valid].T), self._output_shape)
+        return indices
+
+    def _flatten_quasi_dists(
+        self, quasi_dists: Sequence[dict[int, float]]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Concatenates quasi-distributions into arrays of the position of the distribution in the
+        sequence, the flat index of the interpreted output and the value of every entry.
+        """
+        sizes = np.fromiter((len(dist) for dist in quasi_dists), dtype=np.int64)
+        num_entries = int(sizes.sum())
+        outcomes = np.fromiter(
+            itertools.chain.from_iterable(dist.keys() for dist in quasi_dists),
+            dtype=np.int64,
+            count=num_entries,
+        )
+        values = np.fromiter(
+            itertools.chain.from_iterable(dist.values() for dist in quasi_dists),
+            dtype=float,
+            count=num_entries,
+        )
+        positions = np.repeat(np.arange(len(quasi_dists)), sizes)
+        return positions, self._interpret_indices(outcomes), values
 
-        for i in range(num_samples):
-            counts = result.quasi_dists[i]
+    def _postprocess(self, num_samples: int, result: SamplerResult) -> np.ndarray | SparseArray:
+        """
+        Post-processing during forward pass of the network.
+        """
 
-            # evaluate probabilities
-            for b, v in counts.items():
-                key = self._interpret(b)
-                if isinstance(key, Integral):
-                    key = (cast(int, key),)
-                key = (i, *key)  # type: ignore
-                prob[key] += v
+        # probabilities of all samples are scattered at once
+        samples, output_indices, values = self._flatten_quasi_dists(
+            result.quasi_dists[:num_samples]
+        )
 
         if self._sparse:
-            return prob.to_coo()
-        else:
-            return prob
+            coords = np.vstack([samples, *np.unravel_index(output_indices, self._output_shape)])
+            return self._sparse_array(coords, values, (num_samples, *self._output_shape))
+
+        output_size = int(np.prod(self._output_shape))
+        return np.bincount(
+            samples * output_size + output_indices,
+            weights=values,
+            minlength=num_samples * output_size,
+        ).reshape((num_samples, *self._output_shape))
 
     def _postprocess_gradient(
         self, num_samples: int, results: SamplerGradientResult
@@ -314,65 +403,62 @@ class SamplerQNN(NeuralNetwork):
         Post-processing during backward pass of the network.
         """
 
-        if self._sparse:
-            # pylint: disable=import-error
-            from sparse import DOK
-
-            input_grad = (
-                DOK((num_samples, *self._output_shape, self._num_inputs))
-                if self._input_gradients
-                else None
-            )
-            weights_grad = DOK((num_samples, *self._output_shape, self._num_weights))
-        else:
-
-            input_grad = (
-                np.zeros((num_samples, *self._output_shape, self._num_inputs))
-                if self._input_gradients
-                else None
-            )
-            weights_grad = np.zeros((num_samples, *self._output_shape, self._num_weights))
-
         if self._input_gradients:
             num_grad_vars = self._num_inputs + self._num_weights
         else:
             num_grad_vars = self._num_weights
 
-        for sample in range(num_samples):
-            for i in range(num_grad_vars):
-                grad = results.gradients[sample][i]
-                for k, val in grad.items():
-                    # get index for input or weights gradients
-                    if self._input_gradients:
-                        grad_index = i if i < self._num_inputs else i - self._num_inputs
-                    else:
-                        grad_index = i
-
-                    # interpret integer and construct key
-                    key = self._interpret(k)
-                    if isinstance(key, Integral):
-                        key = (sample, int(key), grad_index)
-                    else:
-                        # if key is an array-type, cast to hashable tuple
-                        key = tuple(cast(Iterable[int], key))
-                        key = (sample, *key, grad_index)
-
-                    # store value for inputs or weights gradients
-                    if self._input_gradients:
-                        # we compute input gradients first
-                        if i < self._num_inputs:
-                            input_grad[key] += val
-                        else:
-                            weights_grad[key] += val
-                    else:
-                        weights_grad[key] += val
+        # gradients of all samples and variables are scattered at once, input gradients first
+        positions, output_indices, values = self._flatten_quasi_dists(
+            [grad for sample_grads in results.gradients for grad in sample_grads[:num_grad_vars]]
+        )
+        samples, grad_vars = np.divmod(positions, num_grad_vars)
+        output_size = int(np.prod(self._output_shape))
 
         if self._sparse:
+            coords = np.vstack([samples, *np.unravel_index(output_indices, self._output_shape)])
+            grad_shape = (num_samples, *self._output_shape)
             if self._input_gradients:
-                input_grad = input_grad.to_coo()  # pylint: disable=no-member
-            weights_grad = weights_grad.to_coo()
+                is_input = grad_vars < self._num_inputs
+                input_grad = self._sparse_array(
+                    np.vstack([coords[:, is_input], grad_vars[is_input]]),
+                    values[is_input],
+                    (*grad_shape, self._num_inputs),
+                )
+                is_weight = ~is_input
+                weights_grad = self._sparse_array(
+                    np.vstack([coords[:, is_weight], grad_vars[is_weight] - self._num_inputs]),
+                    values[is_weight],
+                    (*grad_shape, self._num_weights),
+                )
+            else:
+                input_grad = None
+                weights_grad = self._sparse_array(
+                    np.vstack([coords, grad_vars]), values, (*grad_shape, self._num_weights)
+                )
+            return input_grad, weights_grad
+
+        flat_indices = (samples * output_size + output_indices) * num_grad_vars + grad_vars
+        grads = np.bincount(
+            flat_indices, weights=values, minlength=num_samples * output_size * num_grad_vars
+        ).reshape((num_samples, *self._output_shape, num_grad_vars))
+
+        if self._input_gradients:
+            return grads[..., : self._num_inputs], grads[..., self._num_inputs :]
+        return None, grads
+
+    @staticmethod
+    def _sparse_array(
+        coords: np.ndarray, values: np.ndarray, shape: tuple[int, ...]
+    ) -> SparseArray:
+        """
+        Builds a sparse array from coordinates and values, summing the values of duplicate
+        coordinates.
+        """
+        # pylint: disable=import-error
+        from sparse import COO
 
-        return input_grad, weights_grad
+        return COO(coords, values, shape=shape, has_duplicates=True)
 
     def _forward(
         self,
@@ -382,45 +468,63 @@ class SamplerQNN(NeuralNetwork):
         """
         Forward pass of the network.
         """
+        return self._submit_forward(input_data, weights)()
+
+    def _backward(
+        self,
+        input_data: np.ndarray | None,
+        weights: np.ndarray | None,
+    ) -> tuple[np.ndarray | SparseArray | None, np.ndarray | SparseArray | None]:
+        """Backward pass of the network."""
+        return self._submit_backward(input_data, weights)()
+
+    def _submit_forward(
+        self,
+        input_data: np.ndarray | None,
+        weights: np.ndarray | None,
+    ) -> Callable[[], np.ndarray | SparseArray]:
+        """Submits the sampler job of the forward pass and returns a function that waits for the
+        job and post-processes its results."""
         parameter_values, num_samples = self._preprocess_forward(input_data, weights)
 
         # sampler allows batching
         job = self.sampler.run([self._circuit] * num_samples, parameter_values)
-        try:
-            results = job.result()
-        except Exception as exc:
-            raise QiskitMachineLearningError("Sampler job failed.") from exc
-        result = self._postprocess(num_samples, results)
+
+        def result() -> np.ndarray | SparseArray:
+            try:
+                results = job.result()
+            except Exception as exc:
+                raise QiskitMachineLearningError("Sampler job failed.") from exc
+            return self._postprocess(num_samples, results)
 
         return result
 
-    def _backward(
+    def _submit_backward(
         self,
         input_data: np.ndarray | None,
         weights: np.ndarray | None,
-    ) -> tuple[np.ndarray | SparseArray | None, np.ndarray | SparseArray | None]:
-        """Backward pass of the network."""
+    ) -> Callable[[], tuple[np.ndarray | SparseArray | None, np.ndarray | SparseArray | None]]:
+        """Submits the gradient job of the backward pass and returns a function that waits for
+        the job and post-processes its results."""
         # prepare parameters in the required format
         parameter_values, num_samples = self._preprocess_forward(input_data, weights)
 
-        input_grad, weights_grad = None, None
-
+        job = None
         if np.prod(parameter_values.shape) > 0:
             circuits = [self._circuit] * num_samples
-
-            job = None
             if self._input_gradients:
                 job = self.gradient.run(circuits, parameter_values)
             elif len(parameter_values[0]) > self._num_inputs:
                 params = [self._circuit.parameters[self._num_inputs :]] * num_samples
                 job = self.gradient.run(circuits, parameter_values, parameters=params)
 
-            if job is not None:
-                try:
-                    results = job.result()
-                except Exception as exc:
-                    raise QiskitMachineLearningError("Sampler job failed.") from exc
-
-                input_grad, weights_grad = self._postprocess_gradient(num_samples, results)
+        def result() -> tuple[np.ndarray | SparseArray | None, np.ndarray | SparseArray | None]:
+            if job is None:
+                return None, None
+            try:
+                results = job.result()
+            except Exception as exc:
+                raise QiskitMachineLearningError("Sampler job failed.") from exc
+            return self._postprocess_gradient(num_samples, results)
 
-        return input_grad, weights_grad
+        return result
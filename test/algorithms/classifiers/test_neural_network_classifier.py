@@ -26,11 +26,11 @@ import scipy
 from ddt import ddt, data, idata, unpack
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.library import RealAmplitudes, ZZFeatureMap
-from qiskit_algorithms.optimizers import COBYLA, L_BFGS_B, SPSA, Optimizer
+from qiskit_algorithms.optimizers import COBYLA, L_BFGS_B, SPSA, GradientDescent, Optimizer
 from qiskit_algorithms.utils import algorithm_globals
 from scipy.optimize import minimize
 
-from qiskit_machine_learning.algorithms import SerializableModelMixin
+from qiskit_machine_learning.algorithms import OneHotObjectiveFunction, SerializableModelMixin
 from qiskit_machine_learning.algorithms.classifiers import NeuralNetworkClassifier
 from qiskit_machine_learning.exceptions import QiskitMachineLearningError
 from qiskit_machine_learning.neural_networks import NeuralNetwork, EstimatorQNN, SamplerQNN
@@ -466,6 +466,147 @@ class TestNeuralNetworkClassifier(QiskitMachineLearningTestCase):
 
         self.assertEqual(len(loss_history), 3)
 
+    def test_mini_batches(self):
+        """Test training on mini-batches evaluates the network on batches only."""
+        qnn, num_inputs, num_parameters = self._create_sampler_qnn()
+        features = algorithm_globals.random.random((10, num_inputs))
+        labels = 1.0 * (np.sum(features, axis=1) <= 1)
+
+        batch_sizes = []
+        backward = qnn.backward
+
+        def counting_backward(input_data, weights):
+            batch_sizes.append(len(input_data))
+            return backward(input_data, weights)
+
+        qnn.backward = counting_backward
+
+        classifier = NeuralNetworkClassifier(
+            qnn,
+            optimizer=GradientDescent(maxiter=7, learning_rate=0.1),
+            initial_point=np.array([0.5] * num_parameters),
+            batch_size=4,
+        )
+        self.assertEqual(classifier.batch_size, 4)
+        self.assertTrue(classifier.shuffle)
+
+        classifier.fit(features, labels)
+        # every epoch has two batches of four samples and one of two samples
+        self.assertListEqual(batch_sizes, [4, 4, 2, 4, 4, 2, 4])
+        self.assertIsNotNone(classifier.weights)
+
+        with self.subTest("Epochs"):
+            function = classifier._create_objective(features, labels)
+            first_epoch = []
+            for _ in range(3):
+                first_epoch.extend(function._y)
+                function.next_batch()
+            self.assertEqual(function.epoch, 1)
+            self.assertEqual(sorted(first_epoch), sorted(labels))
+
+        with self.subTest("Once per iteration"):
+            function = classifier._create_objective(features, labels)
+            objective, gradient = classifier._advance_batches(
+                function, function.objective, classifier._get_gradient(function)
+            )
+            weights = [np.full(num_parameters, value) for value in (0.1, 0.2, 0.3)]
+            first_batch = function._y
+            # objective evaluations without a gradient in between, e.g. of SPSA, share a batch
+            objective(weights[0])
+            objective(weights[1])
+            self.assertIs(function._y, first_batch)
+            # the objective at the weights of the gradient is evaluated on the same batch
+            gradient(weights[1])
+            objective(weights[1])
+            self.assertIs(function._y, first_batch)
+            # the next iteration moves on to the next batch
+            objective(weights[2])
+            self.assertIsNot(function._y, first_batch)
+            second_batch = function._y
+            gradient(weights[2])
+            self.assertIs(function._y, second_batch)
+
+        with self.assertRaises(ValueError):
+            classifier.batch_size = 0
+
+    def test_objective_cache(self):
+        """Test the objective function caches the network results of several weights."""
+        qnn, num_inputs, num_parameters = self._create_sampler_qnn()
+        features = algorithm_globals.random.random((6, num_inputs))
+        labels = _one_hot_encode(1 * (np.sum(features, axis=1) <= 1))
+
+        calls = []
+        for name in ("forward", "backward", "forward_backward"):
+            method = getattr(qnn, name)
+            setattr(
+                qnn,
+                name,
+                lambda *args, method=method, name=name: calls.append(name) or method(*args),
+            )
+
+        classifier = NeuralNetworkClassifier(qnn, one_hot=True)
+        self.assertEqual(classifier._create_objective(features, labels).cache_size, 1)
+        function = OneHotObjectiveFunction(features, labels, qnn, classifier.loss, cache_size=8)
+        self.assertEqual(function.cache_size, 8)
+
+        weights = [np.full(num_parameters, value) for value in (0.1, 0.2, 0.3)]
+        values = [function.objective(w) for w in weights]
+        self.assertListEqual(calls, ["forward"] * 3)
+
+        with self.subTest("Alternating weights"):
+            for w, value in zip(weights, values):
+                self.assertEqual(function.objective(np.copy(w)), value)
+            self.assertEqual(len(calls), 3)
+
+        with self.subTest("Gradient after objective"):
+            function.gradient(weights[0])
+            function.gradient(weights[0])
+            function.objective(weights[0])
+            self.assertListEqual(calls[3:], ["backward"])
+
+        with self.subTest("Gradient first"):
+            weight = np.full(num_parameters, 0.4)
+            function.gradient(weight)
+            function.objective(weight)
+            self.assertListEqual(calls[4:], ["forward_backward"])
+
+        self.assertEqual(function.cache_hits, 6)
+        self.assertEqual(function.cache_misses, 5)
+
+        with self.subTest("Eviction"):
+            function = OneHotObjectiveFunction(features, labels, qnn, classifier.loss, cache_size=2)
+            calls.clear()
+            for w in weights + weights[:1]:
+                function.objective(w)
+            self.assertListEqual(calls, ["forward"] * 4)
+
+    def test_multiclass_objective(self):
+        """Test the multiclass objective function against a loop over the outputs."""
+        qnn, num_inputs, num_parameters = self._create_sampler_qnn(output_shape=3)
+        features = algorithm_globals.random.random((6, num_inputs))
+        labels = np.array([0, 1, 2, 2, 1, 0])
+        weights = algorithm_globals.random.random(num_parameters)
+
+        classifier = NeuralNetworkClassifier(qnn, loss="squared_error")
+        function = classifier._create_objective(features, labels)
+
+        loss_calls = []
+        loss = function._loss
+        function._loss = lambda *args: loss_calls.append(args) or loss(*args)
+
+        probs = qnn.forward(features, weights)
+        _, weight_grad = qnn.backward(features, weights)
+        expected_value, expected_grad = 0.0, np.zeros(num_parameters)
+        for i in range(3):
+            class_loss = loss(np.full(6, i), labels)
+            expected_value += probs[:, i] @ class_loss / 6
+            expected_grad += weight_grad[:, i, :].T @ class_loss / 6
+
+        self.assertAlmostEqual(function.objective(weights), expected_value)
+        np.testing.assert_allclose(function.gradient(weights), [expected_grad])
+        # the loss of the output values is evaluated once
+        self.assertEqual(len(loss_calls), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,6 +14,7 @@
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from test import QiskitMachineLearningTestCase
 
@@ -90,6 +91,140 @@ class TestPegasosQSVC(QiskitMachineLearningTestCase):
 
         self.assertTrue(np.all((decision_function > 0) == (self.label_test == 0)))
 
+    def test_kernel_rows(self):
+        """Test only kernel values of new support vectors are evaluated in training."""
+        qkernel = FidelityQuantumKernel(feature_map=self.feature_map)
+        evaluated_shapes = []
+        evaluate = qkernel.evaluate
+
+        def counting_evaluate(x_vec, y_vec=None):
+            kernel_matrix = evaluate(x_vec, y_vec)
+            evaluated_shapes.append(kernel_matrix.shape)
+            return kernel_matrix
+
+        qkernel.evaluate = counting_evaluate
+
+        for batch_size in (1, 4):
+            with self.subTest(batch_size=batch_size):
+                evaluated_shapes.clear()
+                pegasos_qsvc = PegasosQSVC(
+                    quantum_kernel=qkernel, C=1000, num_steps=self.tau, batch_size=batch_size
+                )
+                self.assertEqual(pegasos_qsvc.batch_size, batch_size)
+                pegasos_qsvc.fit(self.sample_train, self.label_train)
+
+                num_support = len(pegasos_qsvc._alphas)
+                num_entries = sum(rows * cols for rows, cols in evaluated_shapes)
+                # every kernel call evaluates at least one new support vector
+                self.assertLessEqual(len(evaluated_shapes), num_support * len(self.sample_train))
+                self.assertLessEqual(num_entries, batch_size * num_support * len(self.sample_train))
+                self.assertLess(len(evaluated_shapes), self.tau)
+                self.assertEqual(pegasos_qsvc.score(self.sample_test, self.label_test), 1.0)
+
+        with self.assertRaises(ValueError):
+            _ = PegasosQSVC(quantum_kernel=qkernel, batch_size=0)
+
+    def test_batched_decision_function(self):
+        """Test the decision function evaluates the kernel in batches of samples."""
+        qkernel = FidelityQuantumKernel(feature_map=self.feature_map)
+        pegasos_qsvc = PegasosQSVC(quantum_kernel=qkernel, C=1000, num_steps=self.tau)
+        pegasos_qsvc.fit(self.sample_train, self.label_train)
+
+        # a sum of kernel values weighted by the labels and alphas of the support vectors
+        labels = np.where(self.label_train == 0, 1, -1)
+        expected = np.zeros(len(self.sample_test))
+        for index, alpha in zip(pegasos_qsvc._support_indices, pegasos_qsvc._alphas):
+            kernel = qkernel.evaluate(self.sample_test, self.sample_train[[index]])[:, 0]
+            expected += alpha * labels[index] * (kernel + 1)
+
+        with patch.object(qkernel, "evaluate", wraps=qkernel.evaluate) as evaluate:
+            with patch(
+                "qiskit_machine_learning.algorithms.classifiers.pegasos_qsvc."
+                "_PREDICTION_BATCH_SIZE",
+                2,
+            ):
+                np.testing.assert_allclose(
+                    pegasos_qsvc.decision_function(self.sample_test), expected
+                )
+            self.assertEqual(evaluate.call_count, 3)
+
+        np.testing.assert_array_equal(
+            pegasos_qsvc.predict(self.sample_test), np.where(expected > 0, 0, 1)
+        )
+
+    def test_max_support_vectors(self):
+        """Test the number of support vectors is limited by the budget."""
+        qkernel = FidelityQuantumKernel(feature_map=self.feature_map)
+        evaluated_columns = []
+        evaluate = qkernel.evaluate
+
+        def counting_evaluate(x_vec, y_vec=None):
+            evaluated_columns.append(len(y_vec))
+            return evaluate(x_vec, y_vec)
+
+        qkernel.evaluate = counting_evaluate
+
+        # a small C results in many support vectors
+        pegasos_qsvc = PegasosQSVC(
+            quantum_kernel=qkernel, C=1, num_steps=self.tau, max_support_vectors=3
+        )
+        self.assertEqual(pegasos_qsvc.max_support_vectors, 3)
+        pegasos_qsvc.fit(self.sample_train, self.label_train)
+
+        self.assertEqual(len(pegasos_qsvc._alphas), 3)
+        self.assertEqual(pegasos_qsvc._support_vectors.shape, (3, 2))
+        self.assertLessEqual(max(evaluated_columns), 3)
+        self.assertGreaterEqual(pegasos_qsvc.score(self.sample_test, self.label_test), 0.8)
+
+        with self.subTest("Unlimited budget"):
+            pegasos_qsvc.max_support_vectors = None
+            pegasos_qsvc.fit(self.sample_train, self.label_train)
+            self.assertGreater(len(pegasos_qsvc._alphas), 3)
+
+        with self.assertRaises(ValueError):
+            _ = PegasosQSVC(quantum_kernel=qkernel, max_support_vectors=0)
+
+    def test_partial_fit(self):
+        """Test PegasosQSVC trained on chunks of data."""
+        qkernel = FidelityQuantumKernel(feature_map=self.feature_map)
+        pegasos_qsvc = PegasosQSVC(quantum_kernel=qkernel, C=1000)
+
+        # two passes over the training data in chunks of five samples
+        for _ in range(2):
+            for start in range(0, 15, 5):
+                chunk = slice(start, start + 5)
+                pegasos_qsvc.partial_fit(
+                    self.sample_train[chunk], self.label_train[chunk], classes=[0, 1]
+                )
+
+        # the steps are counted across chunks
+        self.assertEqual(pegasos_qsvc._step, 30)
+        # only the support vectors are kept
+        num_support = len(pegasos_qsvc._alphas)
+        self.assertLess(num_support, 30)
+        self.assertEqual(pegasos_qsvc._support_vectors.shape, (num_support, 2))
+        self.assertEqual(pegasos_qsvc.score(self.sample_test, self.label_test), 1.0)
+
+        with self.subTest("Restart with fit"):
+            pegasos_qsvc.num_steps = self.tau
+            pegasos_qsvc.fit(self.sample_train, self.label_train)
+            self.assertEqual(pegasos_qsvc._step, self.tau)
+
+        with self.subTest("Single label without classes"):
+            pegasos_qsvc = PegasosQSVC(quantum_kernel=qkernel, C=1000)
+            with self.assertRaises(ValueError):
+                pegasos_qsvc.partial_fit(self.sample_train[:2], np.zeros(2))
+
+        with self.subTest("Unknown label"):
+            pegasos_qsvc.partial_fit(self.sample_train[:2], np.zeros(2), classes=[0, 1])
+            with self.assertRaises(ValueError):
+                pegasos_qsvc.partial_fit(self.sample_train[:2], np.full(2, 2))
+
+        with self.subTest("Precomputed kernel"):
+            pegasos_qsvc = PegasosQSVC(precomputed=True)
+            with self.assertRaises(ValueError):
+                pegasos_qsvc.partial_fit(np.eye(2), np.array([0, 1]))
+
     def test_qsvc_4d(self):
         """Test PegasosQSVC with 4-dimensional input data"""
         qkernel = FidelityQuantumKernel(feature_map=self.feature_map_4d)
@@ -81,3 +81,13 @@ class TestTorch(ABC):
     def assertRaises(self, expected_exception):
         """Assert raises an exception."""
         raise builtins.Exception("Abstract method")
+
+    @abstractmethod
+    def assertIsNone(self, obj, msg=None):
+        """Assert is None."""
+        raise builtins.Exception("Abstract method")
+
+    @abstractmethod
+    def assertIsNotNone(self, obj, msg=None):
+        """Assert is not None."""
+        raise builtins.Exception("Abstract method")
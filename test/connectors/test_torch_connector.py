@@ -11,8 +11,10 @@
 # that they have been altered from the originals.
 
 """Test Torch Connector."""
+import copy
 import itertools
 from typing import cast
+from unittest.mock import patch
 
 from test.connectors.test_torch import TestTorch
 
@@ -241,3 +243,201 @@ class TestTorchConnector(TestTorch):
         self._validate_forward(model)
         self._validate_backward(model)
         self._validate_backward_automatically(model)
+
+    @data(False, True)
+    def test_num_workers(self, sparse_qnn):
+        """Test TorchConnector evaluating the network in worker processes."""
+        import torch
+
+        fmap = ZFeatureMap(2, reps=1)
+        ansatz = RealAmplitudes(2, reps=1)
+        qc = QuantumCircuit(2)
+        qc.compose(fmap, inplace=True)
+        qc.compose(ansatz, inplace=True)
+
+        qnn = SamplerQNN(
+            circuit=qc,
+            input_params=fmap.parameters,
+            weight_params=ansatz.parameters,
+            sparse=sparse_qnn,
+            input_gradients=True,
+        )
+        weights = np.linspace(-1, 1, qnn.num_weights)
+        model = TorchConnector(qnn, initial_weights=weights, num_workers=2)
+        reference = TorchConnector(qnn, initial_weights=weights)
+        self.assertEqual(model.num_workers, 2)
+
+        input_data = torch.rand((5, 2), requires_grad=True)
+        try:
+            for connector in (model, reference):
+                output = connector(input_data)
+                torch.sum(output.to_dense() if sparse_qnn else output).backward()
+
+            worker_pool = model._worker_pool
+            self.assertIsNotNone(worker_pool)
+            np.testing.assert_allclose(
+                model.weight.grad.detach().to_dense().numpy(),
+                reference.weight.grad.detach().to_dense().numpy(),
+                atol=1e-6,
+            )
+
+            with torch.no_grad():
+                output = model(input_data)
+                expected = reference(input_data)
+            if sparse_qnn:
+                output, expected = output.to_dense(), expected.to_dense()
+            np.testing.assert_allclose(output.numpy(), expected.numpy(), atol=1e-6)
+
+            with self.subTest("Copy"):
+                model_copy = copy.deepcopy(model)
+                self.assertIsNone(model_copy._worker_pool)
+        finally:
+            model.shutdown()
+
+        self.assertIsNone(model._worker_pool)
+        # the worker processes are not shut down again once the pool is garbage collected
+        self.assertFalse(worker_pool._finalizer.alive)
+        with self.assertRaises(QiskitMachineLearningError):
+            _ = TorchConnector(qnn, num_workers=0)
+
+    @data(False, True)
+    def test_dtype(self, use_estimator):
+        """Test TorchConnector with double precision does not copy data on CPU."""
+        import torch
+
+        fmap = ZFeatureMap(2, reps=1)
+        ansatz = RealAmplitudes(2, reps=1)
+        qc = QuantumCircuit(2)
+        qc.compose(fmap, inplace=True)
+        qc.compose(ansatz, inplace=True)
+
+        qnn_class = EstimatorQNN if use_estimator else SamplerQNN
+        qnn = qnn_class(
+            circuit=qc,
+            input_params=fmap.parameters,
+            weight_params=ansatz.parameters,
+            input_gradients=True,
+        )
+        input_data = torch.rand((3, 2), dtype=torch.double, device=self._device)
+
+        model = TorchConnector(qnn, dtype=torch.double)
+        model.to(self._device)
+        self.assertEqual(model.dtype, torch.double)
+        self.assertEqual(model.weight.dtype, torch.double)
+
+        output = model(input_data)
+        self.assertEqual(output.dtype, torch.double)
+        torch.sum(output).backward()
+        self.assertEqual(model.weight.grad.dtype, torch.double)
+
+        expected = qnn.forward(input_data.cpu().numpy(), model.weight.detach().cpu().numpy())
+        np.testing.assert_allclose(output.detach().cpu().numpy(), expected)
+
+        if self._device.type != "cpu":
+            return
+
+        # the arrays of the network share memory with the tensors
+        self.assertEqual(model.bytes_copied, 0)
+
+        with self.subTest("Default type"):
+            model = TorchConnector(qnn)
+            self.assertEqual(model.dtype, torch.get_default_dtype())
+            output = model(input_data.float())
+            self.assertEqual(output.dtype, torch.get_default_dtype())
+            # the output of the network is converted to the default type
+            self.assertEqual(model.bytes_copied, output.element_size() * output.nelement())
+            model.reset_bytes_copied()
+            self.assertEqual(model.bytes_copied, 0)
+
+    def test_fused(self):
+        """Test the gradients are evaluated in the forward pass only if requested."""
+        import torch
+
+        qnn = SamplerQNN(
+            circuit=RealAmplitudes(2, reps=1), weight_params=RealAmplitudes(2, reps=1).parameters
+        )
+        model = TorchConnector(qnn)
+        self.assertFalse(model.fused)
+
+        with patch.object(qnn.gradient, "run", wraps=qnn.gradient.run) as gradient_run:
+            for _ in range(3):
+                output = model()
+            self.assertEqual(gradient_run.call_count, 0)
+            torch.sum(output).backward()
+            self.assertEqual(gradient_run.call_count, 1)
+
+        fused_model = TorchConnector(qnn, initial_weights=model.weight.detach(), fused=True)
+        self.assertTrue(fused_model.fused)
+        with patch.object(qnn.gradient, "run", wraps=qnn.gradient.run) as gradient_run:
+            with torch.no_grad():
+                _ = fused_model()
+            self.assertEqual(gradient_run.call_count, 0)
+            torch.sum(fused_model()).backward()
+            self.assertEqual(gradient_run.call_count, 1)
+        np.testing.assert_allclose(
+            fused_model.weight.grad.numpy(), model.weight.grad.numpy(), rtol=1e-5
+        )
+
+    def test_backward_reuses_forward(self):
+        """Test the backward pass reuses the gradients and the tensors of the forward pass."""
+        import torch
+
+        fmap = ZFeatureMap(2, reps=1)
+        ansatz = RealAmplitudes(2, reps=1)
+        qc = QuantumCircuit(2)
+        qc.compose(fmap, inplace=True)
+        qc.compose(ansatz, inplace=True)
+
+        qnn = SamplerQNN(
+            circuit=qc,
+            input_params=fmap.parameters,
+            weight_params=ansatz.parameters,
+            input_gradients=True,
+        )
+        model = TorchConnector(qnn, fused=True)
+        input_data = torch.rand((3, 2))
+
+        with patch.object(qnn.gradient, "run", wraps=qnn.gradient.run) as gradient_run:
+            output = model(input_data)
+            # the gradients are evaluated in the forward pass
+            self.assertEqual(gradient_run.call_count, 1)
+            torch.sum(output).backward()
+            self.assertEqual(gradient_run.call_count, 1)
+
+        _, expected = qnn.backward(input_data.numpy(), model.weight.detach().numpy())
+        np.testing.assert_allclose(
+            model.weight.grad.numpy(), np.sum(expected, axis=(0, 1)), rtol=1e-5
+        )
+
+        with self.subTest("No pending jobs"):
+            jobs = []
+            gradient_run = qnn.gradient.run
+
+            def recording_run(*args, **kwargs):
+                jobs.append(gradient_run(*args, **kwargs))
+                return jobs[-1]
+
+            with patch.object(qnn.gradient, "run", side_effect=recording_run):
+                _ = model(input_data)
+            # the gradient job has finished once the forward pass returns, so it never runs
+            # concurrently with jobs of later passes
+            self.assertEqual(len(jobs), 1)
+            self.assertTrue(jobs[0].in_final_state())
+
+        with self.subTest("Not fused"):
+            weights = model.weight.detach().clone().requires_grad_(True)
+            with patch.object(qnn, "backward", wraps=qnn.backward) as backward:
+                output = TorchConnector._TorchNNFunction.apply(input_data, weights, qnn, False)
+                torch.sum(output).backward()
+                self.assertEqual(backward.call_count, 1)
+                # the saved tensors are converted to arrays without copying them
+                self.assertTrue(np.shares_memory(backward.call_args[0][0], input_data.numpy()))
+            np.testing.assert_allclose(weights.grad.numpy(), model.weight.grad.numpy(), rtol=1e-5)
+
+        with self.subTest("Modified in place"):
+            weights = model.weight.detach().clone().requires_grad_(True)
+            modified = input_data.clone()
+            output = TorchConnector._TorchNNFunction.apply(modified, weights, qnn, False)
+            modified.mul_(2)
+            with self.assertRaises(RuntimeError):
+                torch.sum(output).backward()
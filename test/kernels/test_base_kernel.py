@@ -0,0 +1,51 @@
+# This code is part of a Qiskit project.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test BaseKernel."""
+
+from __future__ import annotations
+
+import unittest
+
+from test import QiskitMachineLearningTestCase
+
+import numpy as np
+from qiskit.circuit.library import ZFeatureMap
+
+from qiskit_machine_learning.kernels import BaseKernel
+
+
+class _RBFKernel(BaseKernel):
+    """A classical kernel that implements evaluate only."""
+
+    def evaluate(self, x_vec: np.ndarray, y_vec: np.ndarray | None = None) -> np.ndarray:
+        x_vec, y_vec = self._validate_input(x_vec, y_vec)
+        if y_vec is None:
+            y_vec = x_vec
+        distances = np.sum((x_vec[:, np.newaxis, :] - y_vec[np.newaxis, :, :]) ** 2, axis=-1)
+        return np.exp(-distances)
+
+
+class TestBaseKernel(QiskitMachineLearningTestCase):
+    """Test BaseKernel."""
+
+    def test_extend(self):
+        """Test a kernel implementing evaluate only can be extended."""
+        kernel = _RBFKernel(feature_map=ZFeatureMap(feature_dimension=2))
+        x_old = np.asarray([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+        x_new = np.asarray([[0.7, 0.8], [0.9, 1.0]])
+
+        extended = kernel.extend(kernel.evaluate(x_old), x_old, x_new)
+        np.testing.assert_allclose(extended, kernel.evaluate(np.vstack((x_old, x_new))))
+
+
+if __name__ == "__main__":
+    unittest.main()
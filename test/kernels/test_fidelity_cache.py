@@ -0,0 +1,155 @@
+# This code is part of a Qiskit project.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test FidelityCache."""
+
+from __future__ import annotations
+
+import functools
+import unittest
+
+from test import QiskitMachineLearningTestCase
+
+import numpy as np
+from qiskit.circuit.library import ZFeatureMap, ZZFeatureMap
+from qiskit.primitives import Sampler
+from qiskit_algorithms.state_fidelities import ComputeUncompute
+
+from qiskit_machine_learning.kernels import FidelityCache, FidelityQuantumKernel
+
+
+class TestFidelityCache(QiskitMachineLearningTestCase):
+    """Test FidelityCache."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.feature_map = ZFeatureMap(feature_dimension=2, reps=2)
+        self.samples = np.asarray(
+            [
+                [3.07876080, 1.75929189],
+                [6.03185789, 5.27787566],
+                [6.22035345, 2.70176968],
+                [0.18849556, 2.82743339],
+            ]
+        )
+        self.sample_test = np.asarray([[2.199114860, 5.15221195], [0.50265482, 0.06283185]])
+
+        counting_sampler = Sampler()
+        counting_sampler.run = self.count_circuits(counting_sampler.run)
+        self.fidelity = ComputeUncompute(sampler=counting_sampler)
+        self.circuit_counts = 0
+
+    def count_circuits(self, func):
+        """Wrapper to record the number of circuits passed to the sampler."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.circuit_counts += len(kwargs["circuits"])
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def test_keys(self):
+        """Test keys of the cache."""
+        cache = FidelityCache(decimals=6)
+        left, right = self.samples[:2], self.samples[2:]
+        keys = cache.keys(self.feature_map, left, right)
+
+        with self.subTest("Distinct pairs"):
+            self.assertEqual(len(set(keys)), 2)
+
+        with self.subTest("Symmetric pairs"):
+            self.assertListEqual(cache.keys(self.feature_map, right, left), keys)
+
+        with self.subTest("Rounded samples"):
+            self.assertListEqual(cache.keys(self.feature_map, left + 1e-9, right), keys)
+
+        with self.subTest("Different feature map"):
+            feature_map = ZZFeatureMap(feature_dimension=2, reps=2)
+            self.assertTrue(set(cache.keys(feature_map, left, right)).isdisjoint(keys))
+
+    def test_eviction(self):
+        """Test eviction of the least recently used entries and counters."""
+        with self.subTest("Maximum number of entries"):
+            cache = FidelityCache(max_entries=2)
+            cache.put(b"a", 0.1)
+            cache.put(b"b", 0.2)
+            self.assertEqual(cache.get(b"a"), 0.1)
+            cache.put(b"c", 0.3)
+
+            self.assertIsNone(cache.get(b"b"))
+            self.assertEqual(cache.size, 2)
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(cache.misses, 1)
+            self.assertEqual(cache.evictions, 1)
+
+        with self.subTest("Maximum number of bytes"):
+            cache = FidelityCache(max_bytes=20)
+            cache.put(b"a", 0.1)
+            cache.put(b"b", 0.2)
+            self.assertEqual(cache.size, 2)
+            self.assertEqual(cache.nbytes, 18)
+            cache.put(b"c", 0.3)
+            self.assertEqual(cache.size, 2)
+            self.assertEqual(cache.evictions, 1)
+            self.assertIsNone(cache.get(b"a"))
+
+        with self.subTest("Clear"):
+            cache.clear()
+            self.assertEqual(cache.size, 0)
+            self.assertEqual(cache.nbytes, 0)
+            self.assertEqual(cache.evictions, 0)
+
+    def test_kernel(self):
+        """Test only the fidelities missing from the cache are evaluated."""
+        cache = FidelityCache()
+        kernel = FidelityQuantumKernel(
+            feature_map=self.feature_map, fidelity=self.fidelity, cache=cache
+        )
+        self.assertIs(kernel.cache, cache)
+
+        kernel_train = kernel.evaluate(self.samples)
+        self.assertEqual(self.circuit_counts, 6)
+        self.assertEqual(cache.size, 6)
+
+        with self.subTest("Repeated evaluation"):
+            self.circuit_counts = 0
+            np.testing.assert_allclose(kernel.evaluate(self.samples), kernel_train)
+            self.assertEqual(self.circuit_counts, 0)
+            self.assertEqual(cache.hits, 6)
+
+        with self.subTest("Partially cached evaluation"):
+            self.circuit_counts = 0
+            kernel_test = kernel.evaluate(self.sample_test, self.samples[:2])
+            self.assertEqual(self.circuit_counts, 4)
+            self.assertEqual(kernel_test.shape, (2, 2))
+
+        with self.subTest("Shared cache"):
+            self.circuit_counts = 0
+            other_kernel = FidelityQuantumKernel(
+                feature_map=ZFeatureMap(feature_dimension=2, reps=2),
+                fidelity=self.fidelity,
+                cache=cache,
+            )
+            np.testing.assert_allclose(other_kernel.evaluate(self.samples), kernel_train)
+            self.assertEqual(self.circuit_counts, 0)
+
+    def test_invalid_limits(self):
+        """Test negative limits raise an error."""
+        with self.assertRaises(ValueError):
+            _ = FidelityCache(max_entries=-1)
+        with self.assertRaises(ValueError):
+            _ = FidelityCache(max_bytes=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,7 +34,7 @@ from qiskit_algorithms.state_fidelities import (
 )
 from sklearn.svm import SVC
 
-from qiskit_machine_learning.kernels import FidelityQuantumKernel
+from qiskit_machine_learning.kernels import FidelityCache, FidelityQuantumKernel
 
 
 @ddt
@@ -344,6 +344,125 @@ class TestFidelityQuantumKernel(QiskitMachineLearningTestCase):
         self.assertEqual("none", kernel.evaluate_duplicates)
         self.assertEqual(1, kernel.num_features)
 
+    @idata(
+        itertools.product(
+            [1, 3, 10],
+            ["none", "off_diagonal", "all"],
+        )
+    )
+    @unpack
+    def test_block_size(self, block_size, duplicates):
+        """Test tiled evaluation of the kernel matrix."""
+        features = np.vstack((self.sample_train, self.sample_train[:1]))
+        kernel = FidelityQuantumKernel(
+            feature_map=self.feature_map, evaluate_duplicates=duplicates, enforce_psd=False
+        )
+        blocked_kernel = FidelityQuantumKernel(
+            feature_map=self.feature_map,
+            evaluate_duplicates=duplicates,
+            enforce_psd=False,
+            block_size=block_size,
+        )
+        self.assertEqual(blocked_kernel.block_size, block_size)
+
+        with self.subTest("Symmetric"):
+            np.testing.assert_allclose(
+                blocked_kernel.evaluate(features), kernel.evaluate(features), atol=1e-7
+            )
+
+        with self.subTest("Asymmetric"):
+            np.testing.assert_allclose(
+                blocked_kernel.evaluate(features, self.sample_test),
+                kernel.evaluate(features, self.sample_test),
+                atol=1e-7,
+            )
+
+    def test_block_size_jobs(self):
+        """Test each tile of the kernel matrix is submitted as a separate job."""
+        num_circuits = []
+
+        class CountingFidelity(ComputeUncompute):
+            """Fidelity that records the number of circuits per job."""
+
+            def _run(self, circuits_1, circuits_2, values_1=None, values_2=None, **options):
+                num_circuits.append(len(circuits_1))
+                return super()._run(circuits_1, circuits_2, values_1, values_2, **options)
+
+        kernel = FidelityQuantumKernel(
+            feature_map=self.feature_map,
+            fidelity=CountingFidelity(self.sampler),
+            evaluate_duplicates="all",
+            block_size=2,
+        )
+        kernel.evaluate(self.sample_train, self.sample_test)
+        self.assertListEqual(num_circuits, [4, 4])
+
+        num_circuits.clear()
+        kernel.evaluate(self.sample_train)
+        # two diagonal tiles with 3 entries each and one off-diagonal tile
+        self.assertListEqual(num_circuits, [3, 4, 3])
+
+        with self.assertRaises(ValueError):
+            _ = FidelityQuantumKernel(block_size=0)
+
+    @idata(["none", "off_diagonal", "all"])
+    def test_extend(self, duplicates):
+        """Test extension of a kernel matrix with new samples."""
+        kernel = FidelityQuantumKernel(
+            feature_map=self.feature_map, evaluate_duplicates=duplicates, enforce_psd=False
+        )
+        x_old, x_new = self.sample_train[:3], self.sample_train[3:]
+        kernel_old = kernel.evaluate(x_old)
+
+        extended = kernel.extend(kernel_old, x_old, x_new)
+        np.testing.assert_allclose(extended, kernel.evaluate(self.sample_train), atol=1e-7)
+        np.testing.assert_array_equal(extended, extended.T)
+
+        with self.subTest("Enforce PSD"):
+            extended = kernel.extend(kernel_old, x_old, x_new, enforce_psd=True)
+            self.assertTrue(np.all(np.linalg.eigvalsh(extended) >= -1e-10))
+
+        with self.subTest("Mismatched kernel matrix"):
+            self.assertRaises(ValueError, kernel.extend, kernel_old, self.sample_train, x_new)
+
+    def test_n_jobs(self):
+        """Test evaluation of the tiles of the kernel matrix in worker processes."""
+        kernel = FidelityQuantumKernel(feature_map=self.feature_map)
+        parallel_kernel = FidelityQuantumKernel(
+            feature_map=self.feature_map, block_size=2, n_jobs=2
+        )
+        self.assertEqual(parallel_kernel.n_jobs, 2)
+
+        with self.subTest("Symmetric"):
+            np.testing.assert_allclose(
+                parallel_kernel.evaluate(self.sample_train),
+                kernel.evaluate(self.sample_train),
+                atol=1e-7,
+            )
+
+        with self.subTest("Asymmetric"):
+            np.testing.assert_allclose(
+                parallel_kernel.evaluate(self.sample_train, self.sample_test),
+                kernel.evaluate(self.sample_train, self.sample_test),
+                atol=1e-7,
+            )
+
+        with self.subTest("Cache"):
+            cache = FidelityCache()
+            cached_kernel = FidelityQuantumKernel(
+                feature_map=self.feature_map, block_size=2, n_jobs=2, cache=cache
+            )
+            kernel_matrix = cached_kernel.evaluate(self.sample_train)
+            # the fidelities evaluated in the worker processes are added to the cache
+            num_samples = len(self.sample_train)
+            self.assertEqual(cache.size, num_samples * (num_samples - 1) // 2)
+            serial_kernel = FidelityQuantumKernel(feature_map=self.feature_map, cache=cache)
+            np.testing.assert_allclose(serial_kernel.evaluate(self.sample_train), kernel_matrix)
+            self.assertEqual(cache.hits, cache.size)
+
+        with self.assertRaises(ValueError):
+            _ = FidelityQuantumKernel(n_jobs=0)
+
 
 @ddt
 class TestDuplicates(QiskitMachineLearningTestCase):
@@ -17,6 +17,8 @@ import functools
 import itertools
 import sys
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
 
 from test import QiskitMachineLearningTestCase
 
@@ -27,6 +29,7 @@ from sklearn.svm import SVC
 from qiskit import QuantumCircuit
 from qiskit.circuit import Parameter
 from qiskit.circuit.library import ZFeatureMap
+from qiskit.quantum_info import Statevector
 from qiskit.utils import optionals
 from qiskit_algorithms.utils import algorithm_globals
 
@@ -106,7 +109,7 @@ class TestStatevectorKernel(QiskitMachineLearningTestCase):
         )
         kernel_train = kernel.evaluate(x_vec=features)
         np.testing.assert_array_almost_equal(
-            kernel_train, [[1, 0.9, 0.9], [0.4, 1, 1], [0.7, 0.8, 1]]
+            kernel_train, [[1, 0.9, 0.9], [0.9, 1, 0.7], [0.9, 0.7, 1]]
         )
 
     def test_enforce_psd(self):
@@ -128,6 +131,28 @@ class TestStatevectorKernel(QiskitMachineLearningTestCase):
             # all eigenvalues are non-negative with some tolerance
             self.assertTrue(np.all(np.greater_equal(w, -1e-10)))
 
+    @idata(["eigh", "cholesky", "lanczos"])
+    def test_psd_method(self, psd_method):
+        """Test strategies of projecting to a positive semidefinite matrix."""
+        features = algorithm_globals.random.random((30, 2))
+        noise = algorithm_globals.random.normal(scale=0.2, size=(30 * 29 // 2,))
+
+        kernel = FidelityStatevectorKernel(shots=100, psd_method=psd_method)
+        self.assertEqual(kernel.psd_method, psd_method)
+        kernel._add_shot_noise = lambda fidelities: fidelities + noise
+        matrix = kernel.evaluate(features)
+        w = np.linalg.eigvalsh(matrix)
+        self.assertTrue(np.all(np.greater_equal(w, -1e-10)))
+        np.testing.assert_allclose(matrix, matrix.T)
+
+        if psd_method == "lanczos":
+            kernel = FidelityStatevectorKernel(shots=100, psd_method="eigh")
+            kernel._add_shot_noise = lambda fidelities: fidelities + noise
+            np.testing.assert_allclose(matrix, kernel.evaluate(features), atol=1e-10)
+
+        with self.assertRaises(ValueError):
+            _ = FidelityStatevectorKernel(psd_method="wrong")
+
     # todo: enable the test on macOS when fixed: https://github.com/Qiskit/qiskit-aer/issues/1886
     @unittest.skipUnless(optionals.HAS_AER, "qiskit-aer is required to run this test")
     @unittest.skipIf(sys.platform.startswith("darwin"), "macOS is not supported")
@@ -151,28 +176,21 @@ class TestStatevectorKernel(QiskitMachineLearningTestCase):
         svc = SVC(kernel=kernel.evaluate)
         svc.fit(self.sample_train, self.label_train)
         with self.subTest("Check cache fills correctly."):
-            # pylint: disable=no-member
-            self.assertEqual(kernel._get_statevector.cache_info().currsize, len(self.sample_train))
+            self.assertEqual(kernel.cache.size, len(self.sample_train))
 
         svc.fit(self.sample_test, self.label_test)
         with self.subTest("Check no auto_clear_cache."):
-            # pylint: disable=no-member
-            self.assertEqual(
-                kernel._get_statevector.cache_info().currsize,
-                len(self.sample_train) + len(self.sample_test),
-            )
+            self.assertEqual(kernel.cache.size, len(self.sample_train) + len(self.sample_test))
 
         kernel = FidelityStatevectorKernel(cache_size=3, auto_clear_cache=False)
         svc = SVC(kernel=kernel.evaluate)
         svc.fit(self.sample_train, self.label_train)
         with self.subTest("Check cache limit respected."):
-            # pylint: disable=no-member
-            self.assertEqual(kernel._get_statevector.cache_info().currsize, 3)
+            self.assertEqual(kernel.cache.size, 3)
 
         kernel.clear_cache()
         with self.subTest("Check cache clears correctly"):
-            # pylint: disable=no-member
-            self.assertEqual(kernel._get_statevector.cache_info().currsize, 0)
+            self.assertEqual(kernel.cache.size, 0)
 
     @idata(
         # params, feature map, duplicate
@@ -343,6 +361,73 @@ class TestStatevectorKernel(QiskitMachineLearningTestCase):
         self.assertEqual(qc, kernel.feature_map)
         self.assertEqual(1, kernel.num_features)
 
+    @idata([1, 3, 10])
+    def test_block_size(self, block_size):
+        """Test tiled evaluation of the kernel matrix."""
+        features = np.vstack((self.sample_train, self.sample_train[:1]))
+        kernel = FidelityStatevectorKernel(feature_map=self.feature_map)
+        blocked_kernel = FidelityStatevectorKernel(
+            feature_map=self.feature_map, block_size=block_size
+        )
+        self.assertEqual(blocked_kernel.block_size, block_size)
+
+        with self.subTest("Symmetric"):
+            np.testing.assert_allclose(blocked_kernel.evaluate(features), kernel.evaluate(features))
+
+        with self.subTest("Asymmetric"):
+            np.testing.assert_allclose(
+                blocked_kernel.evaluate(features, self.sample_test),
+                kernel.evaluate(features, self.sample_test),
+            )
+
+        with self.subTest("Shot noise"):
+            blocked_kernel = FidelityStatevectorKernel(
+                feature_map=self.feature_map, block_size=block_size, shots=10, enforce_psd=False
+            )
+            kernel_matrix = blocked_kernel.evaluate(features)
+            np.testing.assert_array_equal(kernel_matrix, kernel_matrix.T)
+
+    def test_extend(self):
+        """Test extension of a kernel matrix with new samples."""
+        kernel = FidelityStatevectorKernel(feature_map=self.feature_map)
+        x_old, x_new = self.sample_train, self.sample_test
+        kernel_old = kernel.evaluate(x_old)
+
+        extended = kernel.extend(kernel_old, x_old, x_new)
+        np.testing.assert_allclose(extended, kernel.evaluate(np.vstack((x_old, x_new))))
+
+    def test_n_jobs(self):
+        """Test simulation of the statevectors in worker processes."""
+        features = np.vstack((self.sample_train, self.sample_train[:1]))
+        kernel = FidelityStatevectorKernel(feature_map=self.feature_map)
+        parallel_kernel = FidelityStatevectorKernel(
+            feature_map=self.feature_map, n_jobs=2, auto_clear_cache=False
+        )
+        self.assertEqual(parallel_kernel.n_jobs, 2)
+
+        np.testing.assert_allclose(parallel_kernel.evaluate(features), kernel.evaluate(features))
+        np.testing.assert_allclose(
+            parallel_kernel.evaluate(features, self.sample_test),
+            kernel.evaluate(features, self.sample_test),
+        )
+        with self.subTest("Check the cache is filled."):
+            self.assertEqual(
+                parallel_kernel.cache.size, len(self.sample_train) + len(self.sample_test)
+            )
+
+        with self.subTest("Check a single pool is started per evaluation."):
+            tiled_kernel = FidelityStatevectorKernel(
+                feature_map=self.feature_map, block_size=2, n_jobs=2
+            )
+            with patch(
+                "qiskit_machine_learning.kernels.base_kernel.ProcessPoolExecutor",
+                wraps=ProcessPoolExecutor,
+            ) as executor:
+                np.testing.assert_allclose(
+                    tiled_kernel.evaluate(features), kernel.evaluate(features)
+                )
+            self.assertEqual(executor.call_count, 1)
+
 
 @ddt
 class TestStatevectorKernelDuplicates(QiskitMachineLearningTestCase):
@@ -365,33 +450,31 @@ class TestStatevectorKernelDuplicates(QiskitMachineLearningTestCase):
         """Wrapper to record the number of computed kernel entries.
 
         Args:
-            func (Callable): execute function to be wrapped
+            func (Callable): shot noise function to be wrapped
 
         Returns:
             Callable: function wrapper
         """
 
         @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            self.computation_counts += 1
-            return func(*args, **kwargs)
+        def wrapper(fidelities, *args, **kwargs):
+            self.computation_counts += len(fidelities)
+            return func(fidelities, *args, **kwargs)
 
         return wrapper
 
     @idata(
         [
-            ("no_dups", 6),
-            ("dups", 4),
+            ("no_dups", 3),
+            ("dups", 2),
         ]
     )
     @unpack
     def test_with_duplicates(self, dataset_name, expected_computations):
         """Tests statevector kernel evaluation with duplicate samples."""
         self.computation_counts = 0
-        kernel = FidelityStatevectorKernel(
-            feature_map=self.feature_map,
-        )
-        kernel._compute_kernel_entry = self.count_computations(kernel._compute_kernel_entry)
+        kernel = FidelityStatevectorKernel(feature_map=self.feature_map, shots=100)
+        kernel._add_shot_noise = self.count_computations(kernel._add_shot_noise)
         kernel.evaluate(self.properties.get(dataset_name))
 
         self.assertEqual(self.computation_counts, expected_computations)
@@ -406,13 +489,27 @@ class TestStatevectorKernelDuplicates(QiskitMachineLearningTestCase):
     def test_with_duplicates_asymmetric(self, dataset_name, expected_computations):
         """Tests asymmetric statevector kernel evaluation with duplicate samples."""
         self.computation_counts = 0
-        kernel = FidelityStatevectorKernel(
-            feature_map=self.feature_map,
-        )
-        kernel._compute_kernel_entry = self.count_computations(kernel._compute_kernel_entry)
+        kernel = FidelityStatevectorKernel(feature_map=self.feature_map, shots=100)
+        kernel._add_shot_noise = self.count_computations(kernel._add_shot_noise)
         kernel.evaluate(self.properties.get(dataset_name), self.properties.get("y_vec"))
         self.assertEqual(self.computation_counts, expected_computations)
 
+    def test_batched_fidelities(self):
+        """Tests batched evaluation matches the fidelities of individual statevectors."""
+        kernel = FidelityStatevectorKernel(feature_map=self.feature_map)
+        x_vec = self.properties.get("no_dups")
+        y_vec = self.properties.get("y_vec")
+        x_svs = [Statevector(self.feature_map.assign_parameters(x)).data for x in x_vec]
+        y_svs = [Statevector(self.feature_map.assign_parameters(y)).data for y in y_vec]
+
+        with self.subTest("Symmetric"):
+            expected = np.array([[np.abs(np.vdot(x, y)) ** 2 for y in x_svs] for x in x_svs])
+            np.testing.assert_allclose(kernel.evaluate(x_vec), expected)
+
+        with self.subTest("Asymmetric"):
+            expected = np.array([[np.abs(np.vdot(x, y)) ** 2 for y in y_svs] for x in x_svs])
+            np.testing.assert_allclose(kernel.evaluate(x_vec, y_vec), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,150 @@
+# This code is part of a Qiskit project.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test NystromQuantumKernel."""
+
+from __future__ import annotations
+
+import unittest
+
+from test import QiskitMachineLearningTestCase
+
+import numpy as np
+from ddt import ddt, idata
+from qiskit.circuit.library import ZFeatureMap
+from qiskit_algorithms.utils import algorithm_globals
+from sklearn.linear_model import LogisticRegression
+
+from qiskit_machine_learning.algorithms import QSVC
+from qiskit_machine_learning.kernels import FidelityStatevectorKernel, NystromQuantumKernel
+
+
+@ddt
+class TestNystromQuantumKernel(QiskitMachineLearningTestCase):
+    """Test NystromQuantumKernel."""
+
+    def setUp(self):
+        super().setUp()
+
+        algorithm_globals.random_seed = 10598
+
+        self.base_kernel = FidelityStatevectorKernel(
+            feature_map=ZFeatureMap(feature_dimension=2, reps=2)
+        )
+        self.features = algorithm_globals.random.random((20, 2)) * np.pi
+        self.labels = (self.features[:, 0] > np.pi / 2).astype(int)
+
+        self.evaluated_shapes: list[tuple[int, int]] = []
+        evaluate = self.base_kernel.evaluate
+
+        def counting_evaluate(x_vec, y_vec=None):
+            kernel_matrix = evaluate(x_vec, y_vec)
+            self.evaluated_shapes.append(kernel_matrix.shape)
+            return kernel_matrix
+
+        self.base_kernel.evaluate = counting_evaluate
+
+    @idata(["uniform", "kmeans", "leverage"])
+    def test_landmark_selection(self, landmark_selection):
+        """Test the approximation with different landmark selection strategies."""
+        kernel = NystromQuantumKernel(
+            base_kernel=self.base_kernel, num_landmarks=8, landmark_selection=landmark_selection
+        )
+        kernel_matrix = kernel.evaluate(self.features)
+
+        self.assertEqual(kernel.landmarks.shape, (8, 2))
+        self.assertEqual(kernel_matrix.shape, (20, 20))
+        np.testing.assert_allclose(kernel_matrix, kernel_matrix.T, atol=1e-12)
+        self.assertTrue(np.all(np.linalg.eigvalsh(kernel_matrix) >= -1e-10))
+        # no full kernel matrix of the samples has been evaluated
+        self.assertNotIn((20, 20), self.evaluated_shapes)
+
+    def test_exact_with_all_landmarks(self):
+        """Test the approximation is exact when all samples are landmarks."""
+        kernel = NystromQuantumKernel(base_kernel=self.base_kernel, num_landmarks=50)
+        test_features = algorithm_globals.random.random((5, 2))
+
+        np.testing.assert_allclose(
+            kernel.evaluate(self.features), self.base_kernel.evaluate(self.features), atol=1e-8
+        )
+        np.testing.assert_allclose(
+            kernel.evaluate(test_features, self.features),
+            self.base_kernel.evaluate(test_features, self.features),
+            atol=1e-8,
+        )
+
+    def test_transform(self):
+        """Test the explicit feature embedding."""
+        kernel = NystromQuantumKernel(base_kernel=self.base_kernel, num_landmarks=8)
+        embedding = kernel.fit(self.features).transform(self.features)
+        self.assertEqual(embedding.shape[0], 20)
+        self.assertLessEqual(embedding.shape[1], 8)
+
+        self.evaluated_shapes.clear()
+        np.testing.assert_allclose(kernel.evaluate(self.features), embedding @ embedding.T)
+        # the embedding of the same samples is reused
+        self.assertListEqual(self.evaluated_shapes, [])
+
+        model = LogisticRegression().fit(embedding, self.labels)
+        self.assertGreaterEqual(model.score(embedding, self.labels), 0.7)
+
+    def test_refit(self):
+        """Test the landmarks are selected again for new samples unless fitted explicitly."""
+        kernel = NystromQuantumKernel(base_kernel=self.base_kernel, num_landmarks=8)
+        other_features = algorithm_globals.random.random((10, 2)) + 10
+
+        kernel.evaluate(self.features)
+        landmarks = kernel.landmarks
+        kernel.evaluate(other_features, self.features)
+        np.testing.assert_array_equal(kernel.landmarks, landmarks)
+
+        with self.subTest("New samples"):
+            kernel.evaluate(other_features)
+            self.assertTrue(np.all(kernel.landmarks >= 10))
+
+        with self.subTest("Fitted explicitly"):
+            kernel.fit(self.features)
+            landmarks = kernel.landmarks
+            kernel.evaluate(other_features)
+            np.testing.assert_array_equal(kernel.landmarks, landmarks)
+
+    def test_extend(self):
+        """Test the kernel matrix is extended with the same landmarks."""
+        kernel = NystromQuantumKernel(base_kernel=self.base_kernel, num_landmarks=8)
+        x_old, x_new = self.features[:15], self.features[15:]
+        kernel_old = kernel.evaluate(x_old)
+        landmarks = kernel.landmarks
+
+        extended = kernel.extend(kernel_old, x_old, x_new)
+        np.testing.assert_array_equal(kernel.landmarks, landmarks)
+        embedding = kernel.transform(np.vstack((x_old, x_new)))
+        np.testing.assert_allclose(extended, embedding @ embedding.T, atol=1e-12)
+
+    def test_qsvc(self):
+        """Test the approximated kernel in QSVC performs close to the exact kernel."""
+        exact_qsvc = QSVC(quantum_kernel=self.base_kernel)
+        exact_score = exact_qsvc.fit(self.features, self.labels).score(self.features, self.labels)
+
+        kernel = NystromQuantumKernel(base_kernel=self.base_kernel, num_landmarks=8)
+        qsvc = QSVC(quantum_kernel=kernel)
+        score = qsvc.fit(self.features, self.labels).score(self.features, self.labels)
+        self.assertGreaterEqual(score, exact_score - 0.1)
+
+    def test_exceptions(self):
+        """Test invalid arguments raise errors."""
+        with self.assertRaises(ValueError):
+            _ = NystromQuantumKernel(base_kernel=self.base_kernel, num_landmarks=0)
+        with self.assertRaises(ValueError):
+            _ = NystromQuantumKernel(base_kernel=self.base_kernel, landmark_selection="wrong")
+
+
+if __name__ == "__main__":
+    unittest.main()
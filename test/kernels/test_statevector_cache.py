@@ -0,0 +1,154 @@
+# This code is part of a Qiskit project.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Test StatevectorCache."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+from test import QiskitMachineLearningTestCase
+
+import numpy as np
+from qiskit.circuit.library import ZFeatureMap, ZZFeatureMap
+from qiskit.quantum_info import Statevector
+
+from qiskit_machine_learning.kernels import FidelityStatevectorKernel, StatevectorCache
+
+
+class TestStatevectorCache(QiskitMachineLearningTestCase):
+    """Test StatevectorCache."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.feature_map = ZFeatureMap(feature_dimension=2, reps=2)
+        self.samples = np.asarray(
+            [
+                [3.07876080, 1.75929189],
+                [6.03185789, 5.27787566],
+                [6.22035345, 2.70176968],
+                [0.18849556, 2.82743339],
+            ]
+        )
+
+    def test_keys(self):
+        """Test keys of the cache."""
+        cache = StatevectorCache(decimals=6)
+        keys = cache.keys(self.feature_map, self.samples)
+
+        with self.subTest("Distinct samples"):
+            self.assertEqual(len(set(keys)), len(self.samples))
+
+        with self.subTest("Rounded samples"):
+            self.assertListEqual(cache.keys(self.feature_map, self.samples + 1e-9), keys)
+
+        with self.subTest("Same feature map in a new instance"):
+            feature_map = ZFeatureMap(feature_dimension=2, reps=2)
+            self.assertListEqual(cache.keys(feature_map, self.samples), keys)
+
+        with self.subTest("Different feature map"):
+            feature_map = ZZFeatureMap(feature_dimension=2, reps=2)
+            self.assertTrue(set(cache.keys(feature_map, self.samples)).isdisjoint(keys))
+
+        with self.subTest("Different statevector type"):
+            self.assertListEqual(cache.keys(self.feature_map, self.samples, Statevector), keys)
+            custom_keys = cache.keys(self.feature_map, self.samples, _CustomStatevector)
+            self.assertTrue(set(custom_keys).isdisjoint(keys))
+
+        with self.subTest("Negative zero"):
+            self.assertListEqual(
+                cache.keys(self.feature_map, [[0.0, 0.0]]),
+                cache.keys(self.feature_map, [[-0.0, 0.0]]),
+            )
+
+    def test_lru_eviction(self):
+        """Test eviction of the least recently used statevectors and counters."""
+        cache = StatevectorCache(max_size=2)
+        cache.put("a", np.array([1.0]))
+        cache.put("b", np.array([2.0]))
+        np.testing.assert_array_equal(cache.get("a"), [1.0])
+        cache.put("c", np.array([3.0]))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.size, 2)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.evictions, 1)
+
+        cache.clear()
+        self.assertEqual(cache.size, 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertIsNone(cache.get("a"))
+
+    def test_disk_tier(self):
+        """Test statevectors are stored on disk and shared between kernels."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = StatevectorCache(max_size=1, directory=directory)
+            kernel = FidelityStatevectorKernel(feature_map=self.feature_map, cache=cache)
+            kernel_matrix = kernel.evaluate(self.samples)
+
+            num_files = sum(len(files) for _, _, files in os.walk(directory))
+            self.assertEqual(num_files, len(self.samples))
+            self.assertEqual(cache.size, 1)
+            self.assertEqual(cache.evictions, len(self.samples) - 1)
+
+            # a new kernel with a new cache reads all statevectors from disk
+            cache = StatevectorCache(directory=directory)
+            kernel = FidelityStatevectorKernel(
+                feature_map=ZFeatureMap(feature_dimension=2, reps=2), cache=cache
+            )
+            kernel._map = lambda *args: self.fail("Statevectors must not be simulated.")
+            np.testing.assert_allclose(kernel.evaluate(self.samples), kernel_matrix)
+            self.assertEqual(cache.hits, len(self.samples))
+            self.assertEqual(cache.misses, 0)
+
+            cache.clear(include_disk=True)
+            num_files = sum(len(files) for _, _, files in os.walk(directory))
+            self.assertEqual(num_files, 0)
+
+    def test_shared_cache(self):
+        """Test a cache passed to kernels is shared and not cleared by the kernels."""
+        cache = StatevectorCache()
+        kernel = FidelityStatevectorKernel(feature_map=self.feature_map, cache=cache)
+        custom_kernel = FidelityStatevectorKernel(
+            feature_map=self.feature_map, statevector_type=_CustomStatevector, cache=cache
+        )
+        kernel_matrix = kernel.evaluate(self.samples)
+        # the diagonal is not evaluated
+        np.testing.assert_allclose(
+            custom_kernel.evaluate(self.samples), 0.5 * (kernel_matrix + np.eye(len(self.samples)))
+        )
+
+        # both kernels keep their statevectors in the cache and find them again
+        self.assertEqual(cache.size, 2 * len(self.samples))
+        self.assertEqual(cache.misses, 2 * len(self.samples))
+        np.testing.assert_allclose(kernel.evaluate(self.samples), kernel_matrix)
+        self.assertEqual(cache.hits, len(self.samples))
+
+    def test_invalid_size(self):
+        """Test a negative size raises an error."""
+        with self.assertRaises(ValueError):
+            _ = StatevectorCache(max_size=-1)
+
+
+class _CustomStatevector(Statevector):
+    """A statevector type that simulates states of a different norm."""
+
+    def __init__(self, data, dims=None):
+        super().__init__(data, dims)
+        self._data = self._data / 2**0.25
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,13 +13,16 @@
 """ Test EstimatorQNN """
 
 import unittest
+import unittest.mock
 
 from test import QiskitMachineLearningTestCase
 
 import numpy as np
 from qiskit.circuit import Parameter, QuantumCircuit
 from qiskit.circuit.library import ZZFeatureMap, RealAmplitudes
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.primitives import Estimator
+from qiskit.quantum_info import Operator, SparsePauliOp
+from qiskit_algorithms.utils import algorithm_globals
 from qiskit_machine_learning.circuit.library import QNNCircuit
 
 from qiskit_machine_learning.neural_networks.estimator_qnn import EstimatorQNN
@@ -447,6 +450,119 @@ class TestEstimatorQNN(QiskitMachineLearningTestCase):
             # Test if weights grad is identical
             np.testing.assert_array_almost_equal(backward_qc[1], backward_qnn_qc[1])
 
+    def test_forward_backward(self):
+        """Test the fused passes match separate forward and backward passes."""
+        num_qubits = 2
+        qnn_qc = QNNCircuit(num_qubits=num_qubits)
+        observables = [
+            SparsePauliOp.from_list([("ZI", 1)]),
+            SparsePauliOp.from_list([("XX", 1)]),
+        ]
+        qnn = EstimatorQNN(circuit=qnn_qc, observables=observables, input_gradients=True)
+        input_data = np.asarray([[1, 2], [3, 4]])
+        weights = np.arange(qnn.num_weights)
+
+        output, input_grad, weights_grad = qnn.forward_backward(input_data, weights)
+        expected_input_grad, expected_weights_grad = qnn.backward(input_data, weights)
+
+        np.testing.assert_allclose(output, qnn.forward(input_data, weights), atol=1e-12)
+        np.testing.assert_allclose(input_grad, expected_input_grad, atol=1e-12)
+        np.testing.assert_allclose(weights_grad, expected_weights_grad, atol=1e-12)
+
+    def test_deduplicate_observables(self):
+        """Test deduplicated samples and observables give the same results with fewer pairs."""
+        num_qubits = 2
+        feature_map = ZZFeatureMap(feature_dimension=num_qubits, reps=1)
+        ansatz = RealAmplitudes(num_qubits=num_qubits, reps=1)
+        qnn_qc = QNNCircuit(num_qubits=num_qubits, feature_map=feature_map, ansatz=ansatz)
+        observables = [
+            SparsePauliOp.from_list([("ZI", 1)]),
+            SparsePauliOp.from_list([("IZ", 1)]),
+            SparsePauliOp.from_list([("ZZ", 0.5), ("XX", 0.5)]),
+            SparsePauliOp.from_list([("ZI", 2), ("IZ", -1)]),
+            SparsePauliOp.from_list([("ZZ", 1)]),
+            SparsePauliOp.from_list([("ZI", 1)]),
+        ]
+        qnn = EstimatorQNN(circuit=qnn_qc, observables=observables, input_gradients=True)
+        estimator = Estimator()
+        deduplicated_qnn = EstimatorQNN(
+            circuit=qnn_qc,
+            estimator=estimator,
+            observables=observables,
+            input_gradients=True,
+            deduplicate_observables=True,
+        )
+        self.assertTrue(deduplicated_qnn.deduplicate_observables)
+        self.assertIs(deduplicated_qnn.estimator, estimator)
+
+        input_data = np.asarray([[1, 2], [3, 4], [1, 2]])
+        weights = np.asarray([1, 2, 3, 4])
+
+        with unittest.mock.patch.object(estimator, "run", wraps=estimator.run) as run:
+            forward = deduplicated_qnn.forward(input_data, weights)
+            # two distinct samples and four distinct Pauli terms
+            self.assertEqual(len(run.call_args[0][0]), 2 * 4)
+            backward = deduplicated_qnn.backward(input_data, weights)
+
+        self.assertEqual(forward.shape, (3, 6))
+        np.testing.assert_allclose(forward, qnn.forward(input_data, weights), atol=1e-10)
+        for deduplicated_grad, grad in zip(backward, qnn.backward(input_data, weights)):
+            np.testing.assert_allclose(deduplicated_grad, grad, atol=1e-10)
+
+        with self.subTest("Operators"):
+            operators = [Operator(op) for op in observables]
+            operator_qnn = EstimatorQNN(
+                circuit=qnn_qc, observables=operators, deduplicate_observables=True
+            )
+            np.testing.assert_allclose(
+                operator_qnn.forward(input_data, weights), forward, atol=1e-10
+            )
+
+    def test_simulate_statevectors(self):
+        """Test the forward pass simulates every sample once for all observables."""
+        num_qubits = 3
+        feature_map = ZZFeatureMap(feature_dimension=num_qubits, reps=1)
+        ansatz = RealAmplitudes(num_qubits=num_qubits, reps=1)
+        qnn_qc = QNNCircuit(num_qubits=num_qubits, feature_map=feature_map, ansatz=ansatz)
+        observables = [
+            SparsePauliOp.from_list([("ZII", 1)]),
+            SparsePauliOp.from_list([("IXI", 1), ("IIY", 0.5)]),
+            SparsePauliOp.from_list([("ZZZ", 1)]),
+            Operator(SparsePauliOp.from_list([("XXI", 1)])),
+        ]
+        qnn = EstimatorQNN(circuit=qnn_qc, observables=observables, input_gradients=True)
+        statevector_qnn = EstimatorQNN(
+            circuit=qnn_qc,
+            observables=observables,
+            input_gradients=True,
+            simulate_statevectors=True,
+        )
+        self.assertTrue(statevector_qnn.simulate_statevectors)
+
+        input_data = algorithm_globals.random.random((4, qnn.num_inputs))
+        weights = algorithm_globals.random.random(qnn.num_weights)
+        with unittest.mock.patch.object(
+            statevector_qnn.estimator, "run", wraps=statevector_qnn.estimator.run
+        ) as run:
+            forward = statevector_qnn.forward(input_data, weights)
+            self.assertEqual(run.call_count, 0)
+        np.testing.assert_allclose(forward, qnn.forward(input_data, weights), atol=1e-10)
+        for statevector_grad, grad in zip(
+            statevector_qnn.backward(input_data, weights), qnn.backward(input_data, weights)
+        ):
+            np.testing.assert_allclose(statevector_grad, grad, atol=1e-10)
+
+        with self.subTest("No parameters"):
+            circuit = QuantumCircuit(num_qubits)
+            circuit.h(0)
+            qnn = EstimatorQNN(circuit=circuit, observables=observables)
+            statevector_qnn = EstimatorQNN(
+                circuit=circuit, observables=observables, simulate_statevectors=True
+            )
+            np.testing.assert_allclose(
+                statevector_qnn.forward(None, None), qnn.forward(None, None), atol=1e-10
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,7 @@
 """Test Neural Network."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from test import QiskitMachineLearningTestCase
 
@@ -126,6 +127,53 @@ class TestNeuralNetwork(QiskitMachineLearningTestCase):
         else:
             self.assertEqual(weights_grad, None)
 
+    @data(
+        ((1, 1, True, 2), 0),
+        ((2, 2, True, (2, 2)), [[0, 0], [1, 1]]),
+        ((0, 1, True, 1), None),
+    )
+    def test_forward_backward_shape(self, params):
+        """Test forward and backward shapes of the fused passes."""
+
+        config, input_data = params
+        network = _NeuralNetwork(*config)
+        weights = np.zeros(network.num_weights)
+
+        output, input_grad, weights_grad = network.forward_backward(input_data, weights)
+        expected_input_grad, expected_weights_grad = network.backward(input_data, weights)
+
+        self.assertEqual(output.shape, network.forward(input_data, weights).shape)
+        if expected_input_grad is None:
+            self.assertIsNone(input_grad)
+        else:
+            self.assertEqual(input_grad.shape, expected_input_grad.shape)
+        self.assertEqual(weights_grad.shape, expected_weights_grad.shape)
+
+    def test_async_passes(self):
+        """Test the asynchronous passes return futures of the synchronous results."""
+        network = _NeuralNetwork(2, 2, True, (2, 2))
+        input_data = [[0, 0], [1, 1], [2, 2]]
+        weights = np.zeros(network.num_weights)
+
+        forward = network.forward_async(input_data, weights)
+        backward = network.backward_async(input_data, weights)
+
+        np.testing.assert_array_equal(forward.result(), network.forward(input_data, weights))
+        for grad, expected_grad in zip(backward.result(), network.backward(input_data, weights)):
+            np.testing.assert_array_equal(grad, expected_grad)
+
+        with self.subTest("Executor"):
+            self.assertIsNone(network.executor)
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-nn") as executor:
+                network.executor = executor
+                self.assertIs(network.executor, executor)
+                forward = network.forward_async(input_data, weights)
+                np.testing.assert_array_equal(
+                    forward.result(), network.forward(input_data, weights)
+                )
+            # the executor is owned by the user
+            self.assertRaises(RuntimeError, network.forward_async, input_data, weights)
+
     def test_data_gradients(self):
         """Tests data_gradient setter/getter."""
         network = _NeuralNetwork(1, 1, True, 1)
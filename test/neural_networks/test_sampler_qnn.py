@@ -17,6 +17,7 @@ from test import QiskitMachineLearningTestCase
 
 import itertools
 import unittest
+import unittest.mock
 import numpy as np
 
 from ddt import ddt, idata
@@ -27,6 +28,7 @@ from qiskit.circuit.library import RealAmplitudes, ZZFeatureMap
 from qiskit_algorithms.utils import algorithm_globals
 
 from qiskit_machine_learning.circuit.library import QNNCircuit
+from qiskit_machine_learning.exceptions import QiskitMachineLearningError
 from qiskit_machine_learning.neural_networks.sampler_qnn import SamplerQNN
 import qiskit_machine_learning.optionals as _optionals
 
@@ -282,6 +284,147 @@ class TestSamplerQNN(QiskitMachineLearningTestCase):
             diff = weights_grad_ - grad
             self.assertAlmostEqual(np.max(np.abs(diff)), 0.0, places=3)
 
+    def test_interpret_lookup(self):
+        """Test the interpret function is evaluated once per outcome in forward and backward."""
+        interpreted = []
+
+        def interpret(x):
+            interpreted.append(x)
+            return self.interpret_1d(x)
+
+        qnn = SamplerQNN(
+            circuit=self.qc,
+            input_params=self.input_params,
+            weight_params=self.weight_params,
+            interpret=interpret,
+            output_shape=self.output_shape_1d,
+            input_gradients=True,
+        )
+        input_data = algorithm_globals.random.random((4, qnn.num_inputs))
+        weights = algorithm_globals.random.random(qnn.num_weights)
+        for _ in range(2):
+            forward = qnn.forward(input_data, weights)
+            input_grad, weights_grad = qnn.backward(input_data, weights)
+        self.assertListEqual(interpreted, [0, 1, 2, 3])
+
+        # reference probabilities summed per interpreted output
+        results = qnn.sampler.run(
+            [qnn.circuit] * 4, np.hstack([input_data, np.tile(weights, (4, 1))])
+        )
+        probs = np.zeros((4, 2))
+        for sample, quasi_dist in enumerate(results.result().quasi_dists):
+            for k, val in quasi_dist.items():
+                probs[sample, self.interpret_1d(k)] += val
+        np.testing.assert_allclose(forward, probs, atol=1e-12)
+
+        # reference gradients summed per interpreted output
+        results = qnn.gradient.run(
+            [qnn.circuit] * 4, np.hstack([input_data, np.tile(weights, (4, 1))])
+        )
+        grads = np.zeros((4, 2, qnn.num_inputs + qnn.num_weights))
+        for sample, sample_grads in enumerate(results.result().gradients):
+            for i, grad in enumerate(sample_grads):
+                for k, val in grad.items():
+                    grads[sample, self.interpret_1d(k), i] += val
+        np.testing.assert_allclose(input_grad, grads[..., : qnn.num_inputs], atol=1e-12)
+        np.testing.assert_allclose(weights_grad, grads[..., qnn.num_inputs :], atol=1e-12)
+
+        with self.subTest("Lazy lookup for wide circuits"):
+            interpreted.clear()
+            with unittest.mock.patch(
+                "qiskit_machine_learning.neural_networks.sampler_qnn._MAX_LOOKUP_BITS", 0
+            ):
+                qnn.set_interpret(interpret, output_shape=self.output_shape_1d)
+                np.testing.assert_allclose(qnn.forward(input_data, weights), forward)
+                qnn.forward(input_data, weights)
+            self.assertListEqual(sorted(interpreted), [0, 1, 2, 3])
+
+        with self.subTest("Out of output shape"):
+            qnn.set_interpret(lambda x: x, output_shape=2)
+            with self.assertRaises(QiskitMachineLearningError):
+                qnn.backward(input_data, weights)
+
+    @unittest.skipIf(not _optionals.HAS_SPARSE, "Sparse not available.")
+    @idata(INTERPRET_TYPES)
+    def test_sparse_matches_dense(self, interpret_id):
+        """Test sparse outputs and gradients match the dense ones."""
+        # pylint: disable=import-error
+        from sparse import COO
+
+        dense_qnn, sparse_qnn = (
+            self._get_qnn(
+                sparse,
+                DEFAULT,
+                interpret_id,
+                input_params=self.input_params,
+                weight_params=self.weight_params,
+                input_grads=True,
+            )
+            for sparse in (False, True)
+        )
+        input_data = algorithm_globals.random.random((3, dense_qnn.num_inputs))
+        weights = algorithm_globals.random.random(dense_qnn.num_weights)
+
+        sparse_forward = sparse_qnn.forward(input_data, weights)
+        self.assertIsInstance(sparse_forward, COO)
+        np.testing.assert_allclose(
+            sparse_forward.todense(), dense_qnn.forward(input_data, weights), atol=1e-12
+        )
+
+        for sparse_grad, dense_grad in zip(
+            sparse_qnn.backward(input_data, weights), dense_qnn.backward(input_data, weights)
+        ):
+            self.assertIsInstance(sparse_grad, COO)
+            np.testing.assert_allclose(sparse_grad.todense(), dense_grad, atol=1e-12)
+
+    @idata(INPUT_GRADS)
+    def test_forward_backward(self, input_grads):
+        """Test the fused passes match separate forward and backward passes."""
+        qnn = self._get_qnn(
+            False,
+            DEFAULT,
+            1,
+            input_params=self.input_params,
+            weight_params=self.weight_params,
+            input_grads=input_grads,
+        )
+        input_data = algorithm_globals.random.random((3, qnn.num_inputs))
+        weights = algorithm_globals.random.random(qnn.num_weights)
+
+        output, input_grad, weights_grad = qnn.forward_backward(input_data, weights)
+        expected_input_grad, expected_weights_grad = qnn.backward(input_data, weights)
+
+        np.testing.assert_allclose(output, qnn.forward(input_data, weights), atol=1e-12)
+        if input_grads:
+            np.testing.assert_allclose(input_grad, expected_input_grad, atol=1e-12)
+        else:
+            self.assertIsNone(input_grad)
+        np.testing.assert_allclose(weights_grad, expected_weights_grad, atol=1e-12)
+
+    def test_async_passes(self):
+        """Test the jobs of the asynchronous passes are submitted before waiting on them."""
+        qnn = self._get_qnn(
+            False,
+            DEFAULT,
+            1,
+            input_params=self.input_params,
+            weight_params=self.weight_params,
+            input_grads=True,
+        )
+        input_data = algorithm_globals.random.random((3, qnn.num_inputs))
+        weights = algorithm_globals.random.random(qnn.num_weights)
+
+        with unittest.mock.patch.object(qnn.sampler, "run", wraps=qnn.sampler.run) as run:
+            forward = qnn.forward_async(input_data, weights)
+            run.assert_called_once()
+        with unittest.mock.patch.object(qnn.gradient, "run", wraps=qnn.gradient.run) as run:
+            backward = qnn.backward_async(input_data, weights)
+            run.assert_called_once()
+
+        np.testing.assert_allclose(forward.result(), qnn.forward(input_data, weights), atol=1e-12)
+        for grad, expected_grad in zip(backward.result(), qnn.backward(input_data, weights)):
+            np.testing.assert_allclose(grad, expected_grad, atol=1e-12)
+
     def test_setters_getters(self):
         """Test Sampler QNN properties."""
         params = [Parameter("input1"), Parameter("weight1")]